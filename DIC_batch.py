@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+"""
+Please report issues and request on the GitHub project from ChrisEberl (Python_DIC)
+More details regarding the project on the GitHub Wiki : https://github.com/ChrisEberl/Python_DIC/wiki
+
+Current File: This file runs a complete analysis from the command line, without interface (python DIC_batch.py -h for the options)
+"""
+
+import sys, os, shutil, argparse, multiprocessing, numpy as np
+from functions import newProcessCorrelations, strainFunctions, getData, processFunctions, motionPrediction
+
+#PARAMETERS
+IMAGE_EXTENSIONS = ['.tif', '.tiff', '.bmp', '.jpg', '.jpeg', '.png'] #same image types as the interface
+REFERENCE_MODES = ['previous', 'first', 'shifted'] #reference image of the correlation (baseMode 0, 1 and 2)
+DEFAULT_CORRSIZE = 15
+DEFAULT_FLOAT_STEP = 10
+#END PARAMETERS
+
+class consoleProgress: #progress written in the terminal, same percent and currentTitle attributes as the interface progress bars
+
+    def __init__(self):
+
+        self.title = ''
+        self.value = -1
+        self.lineOpen = False #the last line is a progress line, overwritten by the next percent
+
+    @property
+    def currentTitle(self):
+
+        return self.title
+
+    @currentTitle.setter
+    def currentTitle(self, title):
+
+        if title != self.title:
+            self.title = title
+            self.value = -1
+            self.write(str(title), newLine=self.lineOpen)
+
+    @property
+    def percent(self):
+
+        return self.value
+
+    @percent.setter
+    def percent(self, value):
+
+        if int(value) != self.value:
+            self.value = int(value)
+            self.write('\r'+str(self.title)+' '+str(self.value)+'%')
+
+    def addInfo(self, info): #messages are written on their own line
+
+        self.write(str(info)+'\n', newLine=self.lineOpen)
+        self.lineOpen = False
+
+    def write(self, text, newLine=False):
+
+        sys.stdout.write('\n'*newLine+text)
+        sys.stdout.flush()
+        self.lineOpen = True
+
+def imageList(imageDirectory, extension=None): #sorted image names of the directory with the extension (extension of the first image found if None)
+
+    fileList = sorted(os.listdir(imageDirectory))
+    if extension is None:
+        for element in fileList:
+            if os.path.splitext(element)[1].lower() in IMAGE_EXTENSIONS:
+                extension = os.path.splitext(element)[1]
+                break
+    if extension is None:
+        return []
+    return [element for element in fileList if element.endswith(extension)]
+
+def runAnalysis(imageDirectory, analysisName, gridDirectory, corrsize=DEFAULT_CORRSIZE, reference='previous', floatStep=DEFAULT_FLOAT_STEP, filterFile=None, largeDispFile=None, PROCESSES=1, extension=None, userName='Batch', corrOptions=None, fields=True, resolution=strainFunctions.COORDINATES_RESOLUTION, progressBar=None, addInfo=print):
+#correlate the images of imageDirectory with the grid of gridDirectory (gridx.csv and gridy.csv) and write the analysis folder imageDirectory/analysisName, return its path
+
+    fileNameList = imageList(imageDirectory, extension)
+    if len(fileNameList) < 2:
+        raise ValueError('At least 2 images are needed in '+imageDirectory)
+
+    gridX = getData.testReadFile(gridDirectory+'/gridx.csv')
+    gridY = getData.testReadFile(gridDirectory+'/gridy.csv')
+    if gridX is None or gridY is None or len(gridX) != len(gridY):
+        raise ValueError('No valid gridx.csv and gridy.csv files in '+gridDirectory)
+
+    filterInfos = []
+    if filterFile is not None:
+        filterInfos = getData.testReadFile(filterFile)
+        if filterInfos is None:
+            raise ValueError('Could not read the filter file '+filterFile)
+
+    largeDisp = None
+    if largeDispFile is not None:
+        largeDisp = getData.testReadFile(largeDispFile)
+        if largeDisp is None or len(largeDisp) != len(fileNameList):
+            raise ValueError('The large displacement file '+largeDispFile+' does not match the '+str(len(fileNameList))+' images')
+
+    baseMode = REFERENCE_MODES.index(reference)
+    if baseMode != 2:
+        floatStep = 0
+
+    #same analysis folder as the interface : grid files written first, then the correlation results
+    fileDataPath = os.path.join(imageDirectory, analysisName)
+    os.makedirs(fileDataPath)
+    shutil.copyfile(gridDirectory+'/gridx.csv', fileDataPath+'/gridx.csv')
+    shutil.copyfile(gridDirectory+'/gridy.csv', fileDataPath+'/gridy.csv')
+
+    activeImages = np.ones(len(fileNameList))
+    newProcessCorrelations.runCorrelations(imageDirectory, fileDataPath, fileNameList, activeImages, gridX[:,0], gridY[:,0], corrsize, baseMode, floatStep, largeDisp, filterInfos, PROCESSES, userName, corrOptions=corrOptions, progressBar=progressBar, addInfo=addInfo)
+
+    if fields: #strain and fields of the original mask, the analysis opens without calculation
+        strainFunctions.postProcess(fileDataPath, PROCESSES, resolution=resolution, progressBar=progressBar, addInfo=addInfo)
+
+    return fileDataPath
+
+def main(arguments=None):
+
+    parser = argparse.ArgumentParser(description='Run a digital image correlation analysis without interface.')
+    parser.add_argument('images', help='directory containing the images')
+    parser.add_argument('name', help='name of the analysis folder created in the image directory')
+    parser.add_argument('grid', help='directory containing the gridx.csv and gridy.csv files (an existing analysis folder for example), the second column of gridx.csv gives the grid instance of each marker, all the markers are one instance without it')
+    parser.add_argument('--extension', default=None, help='extension of the images (default: extension of the first image found)')
+    parser.add_argument('--corrsize', type=int, default=DEFAULT_CORRSIZE, help='correlation size (default: %(default)s)')
+    parser.add_argument('--reference', choices=REFERENCE_MODES, default='previous', help='reference image (default: %(default)s)')
+    parser.add_argument('--step', type=int, default=DEFAULT_FLOAT_STEP, help='reference image step of the shifted reference mode (default: %(default)s)')
+    parser.add_argument('--filter', default=None, help='filter file (filter.dat of an analysis)')
+    parser.add_argument('--largedisp', default=None, help='large displacement file (largeDisp.csv of an analysis)')
+    parser.add_argument('--processes', type=int, default=max(multiprocessing.cpu_count()-1, 1), help='number of processes (default: %(default)s)')
+    parser.add_argument('--engine', choices=list(newProcessCorrelations.CORR_ENGINES), default=newProcessCorrelations.CORR_OPTIONS['engine'], help='correlation engine (default: %(default)s)')
+    parser.add_argument('--csv', action='store_true', help='also write the result matrices as .csv files')
+    parser.add_argument('--pyramid', type=int, default=newProcessCorrelations.CORR_OPTIONS['pyramidLevels'], help='number of downsampled levels searched first, for markers moving more than the correlation size (default: %(default)s)')
+    parser.add_argument('--prediction', choices=list(motionPrediction.PREDICTION_ORDERS), default=newProcessCorrelations.CORR_OPTIONS['prediction'], help='starting position of each marker on the next image (default: %(default)s)')
+    parser.add_argument('--neighbors', action='store_true', help='markers lost on the previous image start from the median displacement of their neighbors')
+    parser.add_argument('--search-radius', type=int, default=newProcessCorrelations.CORR_OPTIONS['searchRadius'], help='largest displacement searched around the starting position of each marker, 0 for the correlation size without prediction and an adaptive radius with prediction (default: %(default)s)')
+    parser.add_argument('--subpixel', choices=['quadratic', 'icgn'], default=newProcessCorrelations.CORR_OPTIONS['subpixel'], help='subpixel method, fit of the correlation peak or Gauss-Newton refinement of the subsets (default: %(default)s)')
+    parser.add_argument('--precision', choices=list(newProcessCorrelations.RESULT_DTYPES), default=newProcessCorrelations.CORR_OPTIONS['precision'], help='storage precision of the result matrices (default: %(default)s)')
+    parser.add_argument('--resolution', type=int, default=strainFunctions.COORDINATES_RESOLUTION, help='points of the interpolated fields along x and y (default: %(default)s)')
+    parser.add_argument('--no-fields', action='store_true', help='do not calculate the strain and interpolated fields after the correlation')
+    parser.add_argument('--user', default='Batch', help='user name written in the analysis informations (default: %(default)s)')
+    parser.add_argument('--quiet', action='store_true', help='only print errors')
+    args = parser.parse_args(arguments)
+
+    progressBar = consoleProgress()
+    addInfo = progressBar.addInfo
+    if args.quiet:
+        progressBar, addInfo = None, lambda info: None
+
+    corrOptions = {'engine': args.engine, 'exportCSV': args.csv, 'precision': args.precision, 'pyramidLevels': args.pyramid, 'prediction': args.prediction, 'neighborPrediction': args.neighbors, 'searchRadius': args.search_radius, 'subpixel': args.subpixel}
+    try:
+        fileDataPath = runAnalysis(args.images, args.name, args.grid, corrsize=args.corrsize, reference=args.reference, floatStep=args.step, filterFile=args.filter, largeDispFile=args.largedisp, PROCESSES=args.processes, extension=args.extension, userName=args.user, corrOptions=corrOptions, fields=not args.no_fields, resolution=args.resolution, progressBar=progressBar, addInfo=addInfo)
+    except (OSError, ValueError, RuntimeError) as error:
+        print('Error: '+str(error), file=sys.stderr)
+        return 1
+    finally:
+        processFunctions.closePool()
+    addInfo('Analysis saved in '+fileDataPath)
+    return 0
+
+if __name__ == '__main__':
+    multiprocessing.freeze_support()
+    multiprocessing.set_start_method('spawn')
+    sys.exit(main())
@@ -1,375 +1,781 @@
-#!/usr/bin/env python
-# -*- coding: utf-8 -*-
-"""
-Created on --/--/20--
-
-@author: ---
-Revised by Charlie Bourigault
-@contact: bourigault.charlie@gmail.com
-
-Please report issues and request on the GitHub project from ChrisEberl (Python_DIC)
-More details regarding the project on the GitHub Wiki : https://github.com/ChrisEberl/Python_DIC/wiki
-
-Current File: This file has been translated, adapted and further developed from 'Digital Image Correlation and Tracking' for Matlab exchanged by Melanie Senn on Mathworks
-"""
-
-import numpy as np, cv2, scipy.interpolate
-
-def cpcorr(InputPoints,BasePoints,Input,Base, CORRSIZE):
-
-    [xymoving_in,xyfixed_in,moving,fixed] = ParseInputs(InputPoints,BasePoints,Input,Base)
-    CorrCoef=[]
-
-    # get all rectangle coordinates
-    rects_moving = np.array(calc_rects(xymoving_in,CORRSIZE,moving)).astype(np.int)
-    rects_fixed = np.array(calc_rects(xyfixed_in,2*CORRSIZE,fixed)).astype(np.int)
-    ncp = len(np.atleast_1d(xymoving_in))
-
-    xymoving = xymoving_in    # initialize adjusted control points matrix
-    CorrCoef=np.zeros((ncp,1))
-    StdX=np.zeros((ncp,1))
-    StdY=np.zeros((ncp,1))
-
-    errorInfos = np.zeros((ncp,1))
-    #### Error Type ####
-    # 1 : Edge Area
-    # 2 : Marker Out
-    # 3 : Non finite number
-    # 4 : No Std. Dev
-    # 5 : SubPx outside limits
-    # 6 : Div. by 0
-    # 7 : Low Corr.
-    # 8 : Peak badly constrained
-    ####################
-
-    for icp in range(ncp):
-
-        if (rects_moving[2][icp] == 0 and rects_moving[3][icp] == 0) or (rects_fixed[2][icp] == 0 and rects_moving[3][icp] == 0):
-            #near edge, unable to adjust
-            #print 'CpCorr : Edge area. No Adjustement.'
-            errorInfos[icp] = 1
-            continue
-
-        sub_moving = moving[rects_moving[1][icp]:rects_moving[1][icp]+rects_moving[3][icp],rects_moving[0][icp]:rects_moving[0][icp]+rects_moving[2][icp]]
-        sub_fixed = fixed[rects_fixed[1][icp]:rects_fixed[1][icp]+rects_fixed[3][icp],rects_fixed[0][icp]:rects_fixed[0][icp]+rects_fixed[2][icp]]
-
-        #make sure the image data exist
-        if sub_moving.shape[0] == 0 or sub_moving.shape[1] == 0 or sub_fixed.shape[0] == 0 or sub_fixed.shape[1] == 0:
-            #print 'CpCorr : Marker out of image.'
-            errorInfos[icp] = 2
-            continue
-
-         #make sure finite
-        if np.logical_or(np.any(np.isfinite(sub_moving[:])==False),np.any(np.isfinite(sub_fixed[:]))==False):
-            # NaN or Inf, unable to adjust
-            #print 'CpCorr : Wrong Number. No Adjustement.'
-            errorInfos[icp] = 3
-            continue
-
-
-        # check that template rectangle moving has nonzero std
-        if np.std(sub_moving[:])== 0:
-            # zero standard deviation of template image, unable to adjust
-            #print 'CpCorr : No Std Dev. No Adjustement.'
-            errorInfos[icp] = 4
-            continue
-
-
-        norm_cross_corr = cv2.matchTemplate(sub_moving,sub_fixed,cv2.TM_CCORR_NORMED)
-        #norm_cross_corr=scipy.signal.correlate2d(sub_fixed, sub_moving)
-        #norm_cross_corr=sklearn.preprocessing.normalize(norm_cross_corr, norm='l2', axis=1, copy=True)
-        #norm_cross_corr=match_template(sub_fixed,sub_moving)
-
-        # get subpixel resolution from cross correlation
-        subpixel = True
-        [xpeak, ypeak, stdx, stdy, corrcoef, info] = findpeak(norm_cross_corr,subpixel)
-        CorrCoef[icp]=corrcoef
-        StdX[icp]=stdx
-        StdY[icp]=stdy
-        xpeak = float(xpeak)
-        ypeak = float(ypeak)
-
-        if info == 1:
-            errorInfos[icp] = 5
-        elif info == 2:
-            errorInfos[icp] = 6
-
-
-        # eliminate any poor correlations
-        THRESHOLD = 0.5
-        if (corrcoef < THRESHOLD):
-            # low correlation, unable to adjust
-            #print 'CpCorr : Low Correlation. Marker avoided.'
-            errorInfos[icp] = 7
-            continue
-
-        # offset found by cross correlation
-        corroffset = [xpeak-CORRSIZE, ypeak-CORRSIZE]
-
-        # eliminate any big changes in control points
-        if corroffset[0] > (CORRSIZE-1) or corroffset[1] > (CORRSIZE-1):
-        # peak of norxcorr2 not well constrained, unable to adjust
-            #print 'CpCorr : Peak not well constrained. No adjustement'
-            errorInfos[icp] = 8
-            continue
-
-        movingfractionaloffset = np.array([xymoving[icp,:] - np.around(xymoving[icp,:])])
-        fixedfractionaloffset = np.array([xyfixed_in[icp,:] - np.around(xyfixed_in[icp,:])])
-
-
-        # adjust control point
-        xymoving[icp,:] = xymoving[icp,:] - movingfractionaloffset - corroffset + fixedfractionaloffset
-        #xymoving[icp,:] = xymoving[icp,:] - corroffset
-
-
-    return xymoving,StdX,StdY,CorrCoef, errorInfos
-
-def calc_rects(xy,halfwidth,img):
-
-    # Calculate rectangles so imcrop will return image with xy coordinate inside center pixel
-    default_width = 2*halfwidth
-    default_height = default_width
-    [row, col] = img.shape
-
-    # xy specifies center of rectangle, need upper left
-    upperleft=np.around(xy)-halfwidth
-    lowerright=np.around(xy)+halfwidth
-
-
-    # need to modify for pixels near edge of images
-    left = upperleft[:,0]
-    upper = upperleft[:,1]
-    right = lowerright[:,0]
-    lower = lowerright[:,1]
-
-    #lower = upper + default_height
-    #right = left + default_width
-    width = default_width * np.ones(np.shape(upper))
-    height = default_height * np.ones(np.shape(upper))
-
-    #check edges for coordinates outside image
-    [upper, height] = adjust_lo_edge(upper,1,height)
-    [lower, height] = adjust_hi_edge(lower,row,height)
-    [left,width] = adjust_lo_edge(left,1,width)
-    [right, width] = adjust_hi_edge(right,col,width)
-
-    # set width and height to zero when less than default size
-    #iw = find(width<default_width)
-    #ih = find(height<default_height)
-    #idx = unique([iw,ih])
-    #width[idx] = 0
-    #height[idx] = 0
-
-    rect = [left.astype(np.int), upper.astype(np.int), width.astype(np.int), height.astype(np.int)]
-    return rect
-
-def adjust_lo_edge(coordinates,edge,breadth):
-
-    for indx in range(0,len(coordinates)):
-        if coordinates[indx] < edge:
-            #breadth[indx] = breadth[indx] - np.absolute(coordinates[indx]-edge)
-            breadth[indx] = 0
-            coordinates[indx] = edge
-    return coordinates, breadth
-
-def adjust_hi_edge(coordinates,edge,breadth):
-
-    for indx in range(0,len(coordinates)):
-        if coordinates[indx] > edge:
-            #breadth[indx] = breadth[indx] - np.absolute(coordinates[indx]-edge)
-            breadth[indx] = 0
-            coordinates[indx] = edge
-    return coordinates, breadth
-
-def ParseInputs(InputPoints,BasePoints,Input,Base):
-
-    xymoving_in = InputPoints
-    xyfixed_in = BasePoints
-    moving = Input
-    fixed = Base
-    return xymoving_in,xyfixed_in,moving,fixed
-
-# sub pixel accuracy by 2D polynomial fit (quadratic)
-def findpeak(f,subpixel):
-    stdx=1e-4
-    stdy=1e-4
-
-    # Get absolute peak pixel
-
-    max_f = np.amax(f)
-    [xpeak,ypeak] = np.unravel_index(f.argmax(), f.shape) #coordinates of the maximum value in f
-
-    if subpixel == False or xpeak==0 or xpeak==np.shape(f)[0]-1 or ypeak==0 or ypeak==np.shape(f)[1]-1: # on edge
-        #print 'CpCorr : No Subpixel Adjustement.'
-        return ypeak, xpeak, stdx, stdy, max_f, 0# return absolute peak
-
-    else:
-        # fit a 2nd order polynomial to 9 points
-        # using 9 pixels centered on irow,jcol
-        u = f[xpeak-1:xpeak+2,ypeak-1:ypeak+2]
-        u = np.reshape(np.transpose(u),(9,1))
-        x = np.array([-1,  0,  1, -1,  0,  1, -1,  0,  1])
-        y = np.array([-1, -1, -1,  0,  0,  0,  1, 1,  1])
-        x = np.reshape(x,(9,1))
-        y = np.reshape(y,(9,1))
-
-        # u(x,y) = A(0) + A(1)*x + A(2)*y + A(3)*x*y + A(4)*x^2 + A(5)*y^2
-        X = np.hstack((np.ones((9,1)), x, y, x*y, x**2, y**2))
-        # u = X*A
-
-        #A = np.linalg.lstsq(X,u, rcond=1e-1)
-        A = np.linalg.lstsq(X,u, rcond=1e-20)
-
-        e = A[1] #residuals returned by Linalg Lstsq
-        A=np.reshape(A[0],(6,1)) # A[0] array of least square solution to the u = AX equation
-
-
-        # get absolute maximum, where du/dx = du/dy = 0
-        x_num = (-A[2]*A[3]+2*A[5]*A[1])
-        y_num = (-A[3]*A[1]+2*A[4]*A[2])
-
-        den = (A[3]**2-4*A[4]*A[5])
-        x_offset = x_num / den
-        y_offset = y_num / den
-
-
-        #print x_offset, y_offset
-        if np.absolute(x_offset)>1 or np.absolute(y_offset)>1:
-            #print 'CpCorr : Subpixel outside limit. No adjustement'
-            # adjusted peak falls outside set of 9 points fit,
-            return ypeak, xpeak, stdx, stdy, max_f, 1 # return absolute peak
-
-        #x_offset = np.round(10000*x_offset)/10000
-        #y_offset = np.round(10000*y_offset)/10000
-        x_offset = np.around(x_offset, decimals=4)
-        y_offset = np.around(y_offset, decimals=4)
-
-        xpeak = xpeak + x_offset
-        ypeak = ypeak + y_offset
-        #print xpeak, ypeak
-
-        # calculate residuals
-        #e=u-np.dot(X,A)
-
-        # calculate estimate of the noise variance
-        n=9     # number of data points
-        p=6     # number of fitted parameters
-        var=np.sum(e**2)/(n-p)
-
-        # calculate covariance matrix
-        cov=np.linalg.inv(np.dot(np.transpose(X),X))*var
-        # produce vector of std deviations on each term
-        s=np.sqrt([cov[0,0],cov[1,1],cov[2,2],cov[3,3],cov[4,4],cov[5,5]])
-        # Calculate standard deviation of denominator, and numerators
-        if A[1] == 0 or A[2] == 0 or A[3] == 0 or A[4] == 0 or A[5] == 0: #avoid divide by zero error and invalid value
-            #print 'CpCorr : Div. by 0 error escaped.'
-            return ypeak, xpeak, stdx, stdy, max_f, 2# return absolute peak
-        else:
-            x_num_std=np.sqrt(4*A[5]**2*A[1]**2*((s[5]/A[5])**2+(s[1]/A[1])**2)+A[2]**2*A[3]**2*((s[2]/A[2])**2+(s[3]/A[3])**2))
-            den_std=np.sqrt(16*A[4]**2*A[5]**2*((s[4]/A[4])**2+(s[5]/A[5])**2)+2*s[3]**2*A[3]**2)
-            y_num_std=np.sqrt(4*A[4]**2*A[2]**2*((s[4]/A[4])**2+(s[2]/A[2])**2)+A[3]**2*A[1]**2*((s[3]/A[3])**2+(s[1]/A[1])**2))
-
-        # Calculate standard deviation of x and y positions
-        stdx=np.sqrt(x_offset**2*((x_num_std/x_num)**2+(den_std/den)**2))
-        stdy=np.sqrt(y_offset**2*((den_std/den)**2+(y_num_std/y_num)**2))
-
-        # Calculate extremum of fitted function
-        max_f = np.dot([1, x_offset, y_offset, x_offset*y_offset, x_offset**2, y_offset**2],A)
-        max_f = np.absolute(max_f)
-
-
-    return ypeak, xpeak, stdx, stdy, max_f, 0
-
-# sub pixel accuracy by upsampling and interpolation
-def findpeak2(f,subpixel):
-    stdx=1e-4
-    stdy=1e-4
-
-    kernelsize=3
-
-    # get absolute peak pixel
-    max_f = np.amax(f)
-    [xpeak,ypeak] = np.unravel_index(f.argmax(), f.shape)
-
-    if subpixel==False or xpeak < kernelsize or xpeak > np.shape(f)[0]-kernelsize or ypeak < kernelsize or ypeak > np.shape(f)[1]-kernelsize: # on edge
-        return xpeak, ypeak, stdx, stdy, max_f # return absolute peak
-    else:
-        # determine sub pixel accuracy by upsampling and interpolation
-        fextracted=f[xpeak-kernelsize:xpeak+kernelsize+1,ypeak-kernelsize:ypeak+kernelsize+1]
-        totalsize=2*kernelsize+1
-        upsampling=totalsize*10+1
-        #step=2/upsampling
-        x=np.linspace(-kernelsize,kernelsize,totalsize)
-        #[X,Y]=np.meshgrid(x,x)
-        xq=np.linspace(-kernelsize,kernelsize,upsampling)
-        #[Xq,Yq]=np.meshgrid(xq,xq)
-
-        bilinterp = interpolate.interp2d(x, x, fextracted, kind='cubic')
-        fq = bilinterp(xq, xq)
-        #splineint = RectBivariateSpline(x, x, fextracted, kx=3, ky=3, s=0)
-        #fq=splineint(xq,xq)
-        #fq=griddata((x, x), fextracted, (Xq, Yq), method='cubic')
-
-        max_f = np.amax(fq)
-        [xpeaknew,ypeaknew] = np.unravel_index(fq.argmax(), fq.shape)
-
-        #xoffset=Xq[0,xpeaknew]
-        #yoffset=Yq[ypeaknew,0]
-        xoffset=xq[xpeaknew]
-        yoffset=xq[ypeaknew]
-
-        # return only one-thousandths of a pixel precision
-        xoffset = np.round(1000*xoffset)/1000
-        yoffset = np.round(1000*yoffset)/1000
-        xpeak=xpeak+xoffset
-        ypeak=ypeak+yoffset
-
-        # peak width (full width at half maximum)
-        scalehalfwidth=1.1774;
-        fextractedx=np.mean(fextracted,0)
-        fextractedy=np.mean(fextracted,1)
-        stdx=scalehalfwidth*np.std(fextractedx)
-        stdy=scalehalfwidth*np.std(fextractedy)
-
-    return xpeak, ypeak, stdx, stdy, max_f
-
- # sub pixel accuracy by centroid
-def findpeak3(f,subpixel):
-    stdx=1e-4
-    stdy=1e-4
-
-    kernelsize=3
-
-    # get absolute peak pixel
-    max_f = np.amax(f)
-    [xpeak,ypeak] = np.unravel_index(f.argmax(), f.shape)
-
-    if subpixel==False or xpeak < kernelsize or xpeak > np.shape(f)[0]-kernelsize or ypeak < kernelsize or ypeak > np.shape(f)[1]-kernelsize: # on edge
-        return xpeak, ypeak, stdx, stdy, max_f # return absolute peak
-    else:
-        # determine sub pixel accuracy by centroid
-        fextracted=f[xpeak-kernelsize:xpeak+kernelsize+1,ypeak-kernelsize:ypeak+kernelsize+1]
-        fextractedx=np.mean(fextracted,0)
-        fextractedy=np.mean(fextracted,1)
-        x=np.arange(-kernelsize,kernelsize+1,1)
-        y=np.transpose(x)
-
-        xoffset=np.dot(x,fextractedx)
-        yoffset=np.dot(y,fextractedy)
-
-        # return only one-thousandths of a pixel precision
-        xoffset = np.round(1000*xoffset)/1000
-        yoffset = np.round(1000*yoffset)/1000
-        xpeak=xpeak+xoffset
-        ypeak=ypeak+yoffset
-
-        # 2D linear interpolation
-        bilinterp = interpolate.interp2d(x, x, fextracted, kind='linear')
-        max_f = bilinterp(xoffset,yoffset)
-
-        # peak width (full width at half maximum)
-        scalehalfwidth=1.1774
-        stdx=scalehalfwidth*np.std(fextractedx)
-        stdy=scalehalfwidth*np.std(fextractedy)
-
-    return xpeak, ypeak, stdx, stdy, max_f
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Created on --/--/20--
+
+@author: ---
+Revised by Charlie Bourigault
+@contact: bourigault.charlie@gmail.com
+
+Please report issues and request on the GitHub project from ChrisEberl (Python_DIC)
+More details regarding the project on the GitHub Wiki : https://github.com/ChrisEberl/Python_DIC/wiki
+
+Current File: This file has been translated, adapted and further developed from 'Digital Image Correlation and Tracking' for Matlab exchanged by Melanie Senn on Mathworks
+"""
+
+import numpy as np, cv2, scipy.fft
+
+#PARAMETERS
+BATCH_SIZE = 512 #number of markers correlated in one vectorized pass by cpcorrBatch, bounds the memory used by the subset stacks
+PYRAMID_MIN_SIZE = 32 #smallest side of the downsampled images of cpcorrPyramid
+ICGN_MAX_ITERATIONS = 20 #iterations of the IC-GN refinement before a marker keeps the cross correlation estimation
+ICGN_TOLERANCE = 1e-3 #the IC-GN refinement stops when the subset moves less than this (pixels)
+ICGN_MAX_SHIFT = 1 #largest distance (pixels) between the cross correlation estimation and the refined position, markers going further keep the estimation
+REFERENCE_MEMORY = 1024 #largest size (MB) of the search window spectra kept by a correlationReference, they are computed for each image above
+GRADIENT_KERNEL = np.array([[1., -8., 0., 8., -1.]])/12 #4th order central difference of the reference subset gradients
+# 2nd order polynomial u(x,y) = A(0) + A(1)*x + A(2)*y + A(3)*x*y + A(4)*x^2 + A(5)*y^2 fitted to the 9 pixels centered on a peak by findpeakBatch
+# the pixels are taken column by column, x is the row offset and y the column offset
+PEAK_X = np.array([-1,  0,  1, -1,  0,  1, -1,  0,  1])
+PEAK_Y = np.array([-1, -1, -1,  0,  0,  0,  1, 1,  1])
+PEAK_DESIGN = np.column_stack((np.ones(9), PEAK_X, PEAK_Y, PEAK_X*PEAK_Y, PEAK_X**2, PEAK_Y**2))
+PEAK_PINV = np.linalg.pinv(PEAK_DESIGN) # least square solution A = PEAK_PINV.u, the design matrix never changes
+PEAK_COV = np.linalg.inv(np.dot(np.transpose(PEAK_DESIGN), PEAK_DESIGN)) # covariance of A for a unit noise variance
+#END PARAMETERS
+
+def cpcorr(InputPoints,BasePoints,Input,Base, CORRSIZE, searchRadius=None, subpixelMethod='quadratic', reference=None):
+# searchRadius : largest offset (pixels) searched around each input point, CORRSIZE if None
+# subpixelMethod : 'quadratic' (fit of the 3x3 pixels around the cross correlation peak) or 'icgn' (refineICGN of the markers found)
+# reference : optional correlationReference of BasePoints on Base, what depends only on them is read from it instead of being computed again
+
+    [xymoving_in,xyfixed_in,moving,fixed] = ParseInputs(InputPoints,BasePoints,Input,Base)
+    CorrCoef=[]
+    if searchRadius is None:
+        searchRadius = CORRSIZE
+    reference = checkReference(reference, xyfixed_in, fixed)
+
+    # get all rectangle coordinates
+    rects_moving = np.array(calc_rects(xymoving_in,CORRSIZE,moving)).astype(int)
+    if reference is not None:
+        rects_fixed = reference.rects(CORRSIZE+searchRadius)
+    else:
+        rects_fixed = np.array(calc_rects(xyfixed_in,CORRSIZE+searchRadius,fixed)).astype(int)
+    ncp = len(np.atleast_1d(xymoving_in))
+
+    xymoving = xymoving_in    # initialize adjusted control points matrix
+    CorrCoef=np.zeros((ncp,1))
+    StdX=np.zeros((ncp,1))
+    StdY=np.zeros((ncp,1))
+
+    errorInfos = np.zeros((ncp,1))
+    #### Error Type ####
+    # 1 : Edge Area
+    # 2 : Marker Out
+    # 3 : Non finite number
+    # 4 : No Std. Dev
+    # 5 : SubPx outside limits
+    # 6 : Div. by 0
+    # 7 : Low Corr.
+    # 8 : Peak badly constrained
+    ####################
+
+    for icp in range(ncp):
+
+        if (rects_moving[2][icp] == 0 and rects_moving[3][icp] == 0) or (rects_fixed[2][icp] == 0 and rects_moving[3][icp] == 0):
+            #near edge, unable to adjust
+            #print 'CpCorr : Edge area. No Adjustement.'
+            errorInfos[icp] = 1
+            continue
+
+        sub_moving = moving[rects_moving[1][icp]:rects_moving[1][icp]+rects_moving[3][icp],rects_moving[0][icp]:rects_moving[0][icp]+rects_moving[2][icp]]
+        sub_fixed = fixed[rects_fixed[1][icp]:rects_fixed[1][icp]+rects_fixed[3][icp],rects_fixed[0][icp]:rects_fixed[0][icp]+rects_fixed[2][icp]]
+
+        #make sure the image data exist
+        if sub_moving.shape[0] == 0 or sub_moving.shape[1] == 0 or sub_fixed.shape[0] == 0 or sub_fixed.shape[1] == 0:
+            #print 'CpCorr : Marker out of image.'
+            errorInfos[icp] = 2
+            continue
+
+         #make sure finite
+        if np.logical_or(np.any(np.isfinite(sub_moving[:])==False),np.any(np.isfinite(sub_fixed[:]))==False):
+            # NaN or Inf, unable to adjust
+            #print 'CpCorr : Wrong Number. No Adjustement.'
+            errorInfos[icp] = 3
+            continue
+
+
+        # check that template rectangle moving has nonzero std
+        if np.std(sub_moving[:])== 0:
+            # zero standard deviation of template image, unable to adjust
+            #print 'CpCorr : No Std Dev. No Adjustement.'
+            errorInfos[icp] = 4
+            continue
+
+
+        norm_cross_corr = cv2.matchTemplate(sub_moving,sub_fixed,cv2.TM_CCORR_NORMED)
+        #norm_cross_corr=scipy.signal.correlate2d(sub_fixed, sub_moving)
+        #norm_cross_corr=sklearn.preprocessing.normalize(norm_cross_corr, norm='l2', axis=1, copy=True)
+        #norm_cross_corr=match_template(sub_fixed,sub_moving)
+
+        # get subpixel resolution from cross correlation
+        subpixel = True
+        [xpeak, ypeak, stdx, stdy, corrcoef, info] = findpeak(norm_cross_corr,subpixel)
+        CorrCoef[icp]=corrcoef
+        StdX[icp]=stdx
+        StdY[icp]=stdy
+        xpeak = float(xpeak)
+        ypeak = float(ypeak)
+
+        if info == 1:
+            errorInfos[icp] = 5
+        elif info == 2:
+            errorInfos[icp] = 6
+
+
+        # eliminate any poor correlations
+        THRESHOLD = 0.5
+        if (corrcoef < THRESHOLD):
+            # low correlation, unable to adjust
+            #print 'CpCorr : Low Correlation. Marker avoided.'
+            errorInfos[icp] = 7
+            continue
+
+        # offset found by cross correlation
+        corroffset = [xpeak-searchRadius, ypeak-searchRadius]
+
+        # eliminate any big changes in control points
+        if corroffset[0] > (searchRadius-1) or corroffset[1] > (searchRadius-1):
+        # peak of norxcorr2 not well constrained, unable to adjust
+            #print 'CpCorr : Peak not well constrained. No adjustement'
+            errorInfos[icp] = 8
+            continue
+
+        movingfractionaloffset = np.array([xymoving[icp,:] - np.around(xymoving[icp,:])])
+        fixedfractionaloffset = np.array([xyfixed_in[icp,:] - np.around(xyfixed_in[icp,:])])
+
+
+        # adjust control point
+        xymoving[icp,:] = xymoving[icp,:] - movingfractionaloffset - corroffset + fixedfractionaloffset
+        #xymoving[icp,:] = xymoving[icp,:] - corroffset
+
+    if subpixelMethod == 'icgn':
+        [xymoving, StdX, StdY] = refineICGN(xymoving, xyfixed_in, moving, fixed, CORRSIZE, errorInfos[:,0] == 0, StdX, StdY, None if reference is None else reference.icgn())
+
+    return xymoving,StdX,StdY,CorrCoef, errorInfos
+
+def cpcorrBatch(InputPoints,BasePoints,Input,Base, CORRSIZE, searchRadius=None, subpixelMethod='quadratic', reference=None, batchSize=BATCH_SIZE, windowSquares=None, subsetType=np.float64):
+# same inputs, outputs and error codes as cpcorr but all the markers are correlated at once on stacks of subsets
+# windowSquares : windowSquareSums(Base, 2*CORRSIZE), the window norms of all the markers are read from it instead of being summed in each search window
+# subsetType : dtype of the subsets and of the FFT cross correlation, np.float32 is about twice faster but changes the positions up to the 1e-2 pixel
+
+    [xymoving_in,xyfixed_in,moving,fixed] = ParseInputs(InputPoints,BasePoints,Input,Base)
+    if searchRadius is None:
+        searchRadius = CORRSIZE
+    reference = checkReference(reference, xyfixed_in, fixed)
+
+    # get all rectangle coordinates, the search windows and their spectra are read from the reference when given
+    rects_moving = np.array(calc_rects(xymoving_in,CORRSIZE,moving)).astype(int)
+    fixedFinite, fixedSpectra = None, None
+    if reference is not None:
+        rects_fixed = reference.rects(CORRSIZE+searchRadius)
+        [fixedFinite, fixedSpectra] = reference.spectra(searchRadius, subsetType)
+    else:
+        rects_fixed = np.array(calc_rects(xyfixed_in,CORRSIZE+searchRadius,fixed)).astype(int)
+    ncp = len(np.atleast_1d(xymoving_in))
+
+    xymoving = xymoving_in    # initialize adjusted control points matrix
+    CorrCoef=np.zeros((ncp,1))
+    StdX=np.zeros((ncp,1))
+    StdY=np.zeros((ncp,1))
+    errorInfos = np.zeros((ncp,1))
+
+    # the error codes are given in the same order as in cpcorr, a marker keeps the first error found
+    toCorrelate = np.ones(ncp, dtype=bool)
+
+    edgeArea = ((rects_moving[2] == 0) & (rects_moving[3] == 0)) | ((rects_fixed[2] == 0) & (rects_moving[3] == 0))
+    errorInfos[edgeArea] = 1
+    toCorrelate &= ~edgeArea
+
+    # calc_rects gives either full size rectangles or empty ones
+    markerOut = ~(validRects(rects_moving, moving.shape) & validRects(rects_fixed, fixed.shape))
+    errorInfos[markerOut & toCorrelate] = 2
+    toCorrelate &= ~markerOut
+
+    movingImg = np.ascontiguousarray(moving, dtype=subsetType)
+    fixedImg = np.ascontiguousarray(fixed, dtype=subsetType)
+    markers = np.flatnonzero(toCorrelate)
+    for batchStart in range(0, len(markers), batchSize):
+
+        batch = markers[batchStart:batchStart+batchSize]
+        sub_moving = extractSubsets(movingImg, rects_moving[0][batch], rects_moving[1][batch], 2*CORRSIZE)
+        sub_fixed = None
+        if fixedSpectra is None or windowSquares is None:
+            sub_fixed = extractSubsets(fixedImg, rects_fixed[0][batch], rects_fixed[1][batch], 2*(CORRSIZE+searchRadius))
+
+        #make sure finite
+        if fixedFinite is not None:
+            fixedNotFinite = ~fixedFinite[batch]
+        else:
+            fixedNotFinite = ~np.any(np.isfinite(sub_fixed), axis=(1,2))
+        notFinite = np.any(~np.isfinite(sub_moving), axis=(1,2)) | fixedNotFinite
+        errorInfos[batch[notFinite]] = 3
+
+        # check that template rectangle moving has nonzero std
+        noStd = ~notFinite & (np.amax(sub_moving, axis=(1,2)) == np.amin(sub_moving, axis=(1,2)))
+        errorInfos[batch[noStd]] = 4
+
+        valid = ~(notFinite | noStd)
+        batch = batch[valid]
+        if len(batch) == 0:
+            continue
+
+        windowSum = None
+        if windowSquares is not None:
+            windowSum = extractSubsets(windowSquares, rects_fixed[0][batch], rects_fixed[1][batch], 2*searchRadius+1)
+        if sub_fixed is None:
+            norm_cross_corr = normCrossCorrStack(sub_moving[valid], None, windowSum, imageSpectra=fixedSpectra[batch], imageShape=(2*(CORRSIZE+searchRadius),)*2)
+        else:
+            norm_cross_corr = normCrossCorrStack(sub_moving[valid], sub_fixed[valid], windowSum)
+
+        # get subpixel resolution from cross correlation
+        subpixel = True
+        [xpeak, ypeak, stdx, stdy, corrcoef, info] = findpeakBatch(norm_cross_corr,subpixel)
+        CorrCoef[batch,0]=corrcoef
+        StdX[batch,0]=stdx
+        StdY[batch,0]=stdy
+        errorInfos[batch[info == 1]] = 5
+        errorInfos[batch[info == 2]] = 6
+
+        # eliminate any poor correlations
+        THRESHOLD = 0.5
+        lowCorr = corrcoef < THRESHOLD
+        errorInfos[batch[lowCorr]] = 7
+
+        # offset found by cross correlation
+        corroffset = np.column_stack((xpeak-searchRadius, ypeak-searchRadius))
+
+        # eliminate any big changes in control points
+        badPeak = ~lowCorr & ((corroffset[:,0] > (searchRadius-1)) | (corroffset[:,1] > (searchRadius-1)))
+        errorInfos[batch[badPeak]] = 8
+
+        adjusted = ~(lowCorr | badPeak)
+        icp = batch[adjusted]
+        movingfractionaloffset = xymoving[icp,:] - np.around(xymoving[icp,:])
+        fixedfractionaloffset = xyfixed_in[icp,:] - np.around(xyfixed_in[icp,:])
+
+        # adjust control point
+        xymoving[icp,:] = xymoving[icp,:] - movingfractionaloffset - corroffset[adjusted] + fixedfractionaloffset
+
+    if subpixelMethod == 'icgn':
+        [xymoving, StdX, StdY] = refineICGN(xymoving, xyfixed_in, moving, fixed, CORRSIZE, errorInfos[:,0] == 0, StdX, StdY, None if reference is None else reference.icgn())
+
+    return xymoving,StdX,StdY,CorrCoef, errorInfos
+
+def cpcorrSAT(InputPoints,BasePoints,Input,Base, CORRSIZE, searchRadius=None, subpixelMethod='quadratic', reference=None, subsetType=np.float64):
+# cpcorrBatch with the window norms read from the summed-area table of Base, same results as cpcorrBatch with float64 subsets
+
+    reference = checkReference(reference, BasePoints, Base)
+    if reference is not None:
+        windowSquares = reference.windowSquares(2*CORRSIZE)
+    else:
+        windowSquares = windowSquareSums(Base, 2*CORRSIZE)
+    return cpcorrBatch(InputPoints,BasePoints,Input,Base, CORRSIZE, searchRadius=searchRadius, subpixelMethod=subpixelMethod, reference=reference, windowSquares=windowSquares, subsetType=subsetType)
+
+def cpcorrSATSingle(InputPoints,BasePoints,Input,Base, CORRSIZE, searchRadius=None, subpixelMethod='quadratic', reference=None):
+# cpcorrSAT with single precision subsets and cross correlation, about twice faster but the positions differ from cpcorrBatch up to the 1e-2 pixel
+
+    return cpcorrSAT(InputPoints,BasePoints,Input,Base, CORRSIZE, searchRadius=searchRadius, subpixelMethod=subpixelMethod, reference=reference, subsetType=np.float32)
+
+def cpcorrPyramid(InputPoints,BasePoints,Input,Base, CORRSIZE, levels, correlate=cpcorrBatch, searchRadius=None, subpixelMethod='quadratic', reference=None):
+# coarse-to-fine correlation : the displacement of each marker is found on the images downsampled levels times by 2 first, each level starts from the displacement found on the coarser one
+# correlate(InputPoints,BasePoints,Input,Base, CORRSIZE, searchRadius, subpixelMethod, reference) is used at every level, the full resolution one gives the outputs and is the only one using searchRadius and the subpixel refinement
+# a marker moving up to (CORRSIZE-1)*2**levels pixels is found with the search window of CORRSIZE
+
+    reference = checkReference(reference, BasePoints, Base)
+    inputPyramid = imagePyramid(Input, levels)
+    if reference is not None:
+        basePyramid = reference.pyramid(levels)
+    else:
+        basePyramid = imagePyramid(Base, levels)
+    xymoving = np.array(InputPoints, dtype=np.float64)
+    xyfixed = np.array(BasePoints, dtype=np.float64)
+    for level in range(len(inputPyramid)-1, 0, -1):
+        scale = 2**level
+        levelReference = None
+        if reference is not None:
+            levelReference = reference.level(levels, level)
+        [xymovingLevel, stdX, stdY, corrCoef, errorInfos] = correlate(xymoving/scale, xyfixed/scale, inputPyramid[level], basePyramid[level], CORRSIZE, reference=levelReference)
+        found = errorInfos[:,0] == 0 #the other markers keep the previous estimation
+        xymoving[found] = xymovingLevel[found]*scale
+
+    return correlate(xymoving, xyfixed, Input, Base, CORRSIZE, searchRadius=searchRadius, subpixelMethod=subpixelMethod, reference=reference)
+
+def imagePyramid(img, levels):
+# list of the image downsampled 0 to levels times by 2 (pixel i of a level is centered on the pixel 2i of the previous one), stops when the image gets too small
+
+    pyramid = [img]
+    for level in range(levels):
+        if min(pyramid[-1].shape) < 2*PYRAMID_MIN_SIZE:
+            break
+        pyramid.append(cv2.pyrDown(pyramid[-1]))
+    return pyramid
+
+class correlationReference: #what the correlation computes from the base image and the base points only, kept as long as they do not change (first image as reference)
+
+    def __init__(self, BasePoints, Base, CORRSIZE, maxMemory=REFERENCE_MEMORY):
+
+        self.points = np.array(BasePoints, dtype=np.float64)
+        self.base = Base
+        self.size = CORRSIZE
+        self.maxMemory = maxMemory
+        self.imageCache = {} #computed on the whole base image
+        self.markerCache = {} #one row per base point
+
+    def __getitem__(self, markers): #reference of a part of the base points, sharing what has already been computed
+
+        reference = correlationReference(self.points[markers], self.base, self.size, self.maxMemory)
+        reference.imageCache = self.imageCache
+        for key in self.markerCache:
+            reference.markerCache[key] = [None if item is None else item[markers] for item in self.markerCache[key]]
+        return reference
+
+    def matches(self, BasePoints, Base):
+
+        return Base is self.base and np.array_equal(self.points, BasePoints)
+
+    def rects(self, halfwidth): #calc_rects of the base points
+
+        key = ('rects', halfwidth)
+        if key not in self.markerCache:
+            self.markerCache[key] = [np.transpose(np.array(calc_rects(self.points, halfwidth, self.base)).astype(int))]
+        return np.transpose(self.markerCache[key][0])
+
+    def spectra(self, searchRadius, subsetType): #True for the search windows containing finite values and their spectra (None if larger than maxMemory)
+
+        key = ('spectra', searchRadius, np.dtype(subsetType).str)
+        if key not in self.markerCache:
+            size = 2*(self.size+searchRadius)
+            rects = self.rects(self.size+searchRadius)
+            markers = np.flatnonzero(validRects(rects, self.base.shape))
+            finite = np.zeros(len(self.points), dtype=bool)
+            spectra = None
+            spectrumType = np.result_type(subsetType, np.complex64)
+            if len(self.points)*size*(size//2+1)*spectrumType.itemsize <= self.maxMemory*1024**2:
+                spectra = np.zeros((len(self.points), size, size//2+1), dtype=spectrumType)
+            baseImg = np.ascontiguousarray(self.base, dtype=subsetType)
+            for batchStart in range(0, len(markers), BATCH_SIZE):
+                batch = markers[batchStart:batchStart+BATCH_SIZE]
+                windows = extractSubsets(baseImg, rects[0][batch], rects[1][batch], size)
+                finite[batch] = np.any(np.isfinite(windows), axis=(1,2))
+                if spectra is not None:
+                    spectra[batch] = scipy.fft.rfft2(windows, s=(size, size))
+            self.markerCache[key] = [finite, spectra]
+        return self.markerCache[key]
+
+    def windowSquares(self, size): #windowSquareSums of the base image
+
+        key = ('windowSquares', size)
+        if key not in self.imageCache:
+            self.imageCache[key] = windowSquareSums(self.base, size)
+        return self.imageCache[key]
+
+    def pyramid(self, levels): #imagePyramid of the base image
+
+        key = ('pyramid', levels)
+        if key not in self.imageCache:
+            self.imageCache[key] = imagePyramid(self.base, levels)
+        return self.imageCache[key]
+
+    def level(self, levels, level): #reference of the base points on a downsampled image of the pyramid
+
+        key = ('level', levels, level)
+        if key not in self.markerCache:
+            self.markerCache[key] = [correlationReference(self.points/2**level, self.pyramid(levels)[level], self.size, self.maxMemory)]
+        return self.markerCache[key][0]
+
+    def icgn(self): #icgnReference of the base points
+
+        if 'icgn' not in self.markerCache:
+            self.markerCache['icgn'] = [icgnReference(self.points, self.base, self.size)]
+        return self.markerCache['icgn'][0]
+
+def checkReference(reference, BasePoints, Base): #the reference if it has been computed on these base points and image, None otherwise
+
+    if reference is not None and not reference.matches(BasePoints, Base):
+        return None
+    return reference
+
+class icgnReference: #reference subsets of the IC-GN refinement, intensities, gradients and inverse Hessian of the subset around each base point are computed once for a base image
+
+    def __init__(self, BasePoints, Base, CORRSIZE):
+
+        self.points = np.array(BasePoints, dtype=np.float64)
+        self.size = CORRSIZE
+        offsets = np.arange(-CORRSIZE, CORRSIZE+1, dtype=np.float64)
+        [self.offsetY, self.offsetX] = [offset.ravel() for offset in np.meshgrid(offsets, offsets, indexing='ij')]
+        nbPoints = len(self.points)
+        nbPixels = len(self.offsetX)
+
+        # the subset and the pixels of its gradients are inside the image
+        [row, col] = np.shape(Base)
+        finite = np.all(np.isfinite(self.points), axis=1)
+        centers = np.around(np.where(finite[:,None], self.points, 0)).astype(int)
+        self.fraction = self.points - centers
+        margin = CORRSIZE + 2
+        self.valid = finite & (centers[:,0] >= margin) & (centers[:,0] < col-margin) & (centers[:,1] >= margin) & (centers[:,1] < row-margin)
+
+        self.subsets = np.zeros((nbPoints, nbPixels), dtype=np.float32) #zero mean intensities
+        self.norms = np.zeros(nbPoints)
+        self.gradientX = np.zeros((nbPoints, nbPixels), dtype=np.float32)
+        self.gradientY = np.zeros((nbPoints, nbPixels), dtype=np.float32)
+        self.inverseHessian = np.tile(np.eye(6), (nbPoints, 1, 1))
+
+        baseImg = np.ascontiguousarray(Base, dtype=np.float64)
+        gradientX = cv2.filter2D(baseImg, -1, GRADIENT_KERNEL)
+        gradientY = cv2.filter2D(baseImg, -1, GRADIENT_KERNEL.T)
+        markers = np.flatnonzero(self.valid)
+        for batchStart in range(0, len(markers), BATCH_SIZE):
+
+            batch = markers[batchStart:batchStart+BATCH_SIZE]
+            left = centers[batch,0]-CORRSIZE
+            upper = centers[batch,1]-CORRSIZE
+            subsets = extractSubsets(baseImg, left, upper, 2*CORRSIZE+1).reshape(len(batch), nbPixels)
+            subsets = subsets - np.mean(subsets, axis=1)[:, None]
+            self.subsets[batch] = subsets
+            self.norms[batch] = np.sqrt(np.sum(subsets**2, axis=1))
+            self.gradientX[batch] = extractSubsets(gradientX, left, upper, 2*CORRSIZE+1).reshape(len(batch), nbPixels)
+            self.gradientY[batch] = extractSubsets(gradientY, left, upper, 2*CORRSIZE+1).reshape(len(batch), nbPixels)
+
+            # Hessian of the first order shape function, parameters (u, du/dx, du/dy, v, dv/dx, dv/dy)
+            steepestDescent = self.steepestDescent(batch)
+            hessian = np.einsum('mni,mnj->mij', steepestDescent, steepestDescent)
+            flat = self.norms[batch] == 0
+            hessian[flat] = np.eye(6)
+            self.inverseHessian[batch] = np.linalg.inv(hessian)
+        self.valid &= self.norms > 0
+
+    def __getitem__(self, markers): #reference of a part of the base points
+
+        reference = icgnReference.__new__(icgnReference)
+        reference.__dict__.update(self.__dict__)
+        for name in ['points', 'fraction', 'valid', 'subsets', 'norms', 'gradientX', 'gradientY', 'inverseHessian']:
+            setattr(reference, name, getattr(self, name)[markers])
+        return reference
+
+    def matches(self, BasePoints): #True if the reference has been computed on these base points
+
+        return np.array_equal(self.points, BasePoints)
+
+    def localCoordinates(self, markers): #position of the subset pixels relative to the base points
+
+        return self.offsetX - self.fraction[markers, 0, None], self.offsetY - self.fraction[markers, 1, None]
+
+    def steepestDescent(self, markers):
+
+        [dx, dy] = self.localCoordinates(markers)
+        gradientX = self.gradientX[markers].astype(np.float64)
+        gradientY = self.gradientY[markers].astype(np.float64)
+        return np.stack((gradientX, gradientX*dx, gradientX*dy, gradientY, gradientY*dx, gradientY*dy), axis=2)
+
+    def refine(self, markers, InputPoints, coefficients):
+    # IC-GN iterations of the markers (indexes of the base points) starting from InputPoints, coefficients are the cubic spline coefficients of the input image
+    # return the refined points, their std. dev. and True for the markers which converged
+
+        nbMarkers = len(markers)
+        [row, col] = coefficients.shape
+        from scipy import ndimage #not imported with the module, slow to load in each correlation process
+        [dx, dy] = self.localCoordinates(markers)
+        points = self.points[markers]
+        warp = np.zeros((nbMarkers, 6))
+        warp[:,0] = InputPoints[:,0] - points[:,0]
+        warp[:,3] = InputPoints[:,1] - points[:,1]
+        stdX = np.zeros(nbMarkers)
+        stdY = np.zeros(nbMarkers)
+        converged = np.zeros(nbMarkers, dtype=bool)
+        active = np.arange(nbMarkers)
+
+        for iteration in range(ICGN_MAX_ITERATIONS):
+
+            # current subset positions in the input image
+            p = warp[active]
+            x = points[active, 0, None] + p[:,0,None] + (1+p[:,1,None])*dx[active] + p[:,2,None]*dy[active]
+            y = points[active, 1, None] + p[:,3,None] + p[:,4,None]*dx[active] + (1+p[:,5,None])*dy[active]
+            inside = np.all((x >= 0) & (x <= col-1) & (y >= 0) & (y <= row-1), axis=1)
+            current = ndimage.map_coordinates(coefficients, [np.clip(y, 0, row-1).ravel(), np.clip(x, 0, col-1).ravel()], order=3, prefilter=False).reshape(x.shape)
+            current = current - np.mean(current, axis=1)[:, None]
+            currentNorm = np.sqrt(np.sum(current**2, axis=1))
+
+            # zero-normalized sum of squared differences, the Hessian of the reference subset never changes
+            currentNorm[currentNorm == 0] = np.nan
+            residual = self.subsets[markers[active]] - (self.norms[markers[active]]/currentNorm)[:, None]*current
+            residualX = self.gradientX[markers[active]]*residual
+            residualY = self.gradientY[markers[active]]*residual
+            gradient = np.column_stack((np.sum(residualX, axis=1), np.sum(residualX*dx[active], axis=1), np.sum(residualX*dy[active], axis=1), np.sum(residualY, axis=1), np.sum(residualY*dx[active], axis=1), np.sum(residualY*dy[active], axis=1)))
+            inverseHessian = self.inverseHessian[markers[active]]
+            delta = -np.einsum('mij,mj->mi', inverseHessian, gradient)
+
+            # inverse compositional update W(p) <- W(p) o W(delta)^-1
+            warp[active] = warpParameters(np.matmul(warpMatrices(p), np.linalg.inv(warpMatrices(np.nan_to_num(delta)))))
+            variance = np.sum(residual**2, axis=1)/(len(self.offsetX)-6)
+            stdX[active] = np.sqrt(variance*inverseHessian[:,0,0])
+            stdY[active] = np.sqrt(variance*inverseHessian[:,3,3])
+
+            failed = ~inside | ~np.all(np.isfinite(delta), axis=1)
+            done = np.sqrt(delta[:,0]**2 + delta[:,3]**2 + self.size**2*(delta[:,1]**2 + delta[:,2]**2 + delta[:,4]**2 + delta[:,5]**2)) < ICGN_TOLERANCE
+            converged[active[done & ~failed]] = True
+            active = active[~(done | failed)]
+            if len(active) == 0:
+                break
+
+        refinedPoints = points + warp[:, [0, 3]]
+        converged &= np.all(np.absolute(refinedPoints - InputPoints) <= ICGN_MAX_SHIFT, axis=1)
+        return refinedPoints, stdX, stdY, converged
+
+def warpMatrices(p): #3x3 affine matrices of the first order shape function parameters (u, du/dx, du/dy, v, dv/dx, dv/dy)
+
+    matrices = np.zeros((len(p), 3, 3))
+    matrices[:,0] = np.column_stack((1+p[:,1], p[:,2], p[:,0]))
+    matrices[:,1] = np.column_stack((p[:,4], 1+p[:,5], p[:,3]))
+    matrices[:,2,2] = 1
+    return matrices
+
+def warpParameters(matrices):
+
+    return np.column_stack((matrices[:,0,2], matrices[:,0,0]-1, matrices[:,0,1], matrices[:,1,2], matrices[:,1,0], matrices[:,1,1]-1))
+
+def refineICGN(InputPoints,BasePoints,Input,Base, CORRSIZE, markers, StdX, StdY, reference=None):
+# inverse compositional Gauss-Newton refinement of the markers found by the cross correlation, the subset around each base point follows a first order shape function
+# markers : True for the markers to refine, InputPoints gives their cross correlation estimation
+# reference : icgnReference of BasePoints on Base, computed here if None (with the first image as reference it is computed once for all the images)
+# return the points and std. dev., the markers which do not converge keep the cross correlation ones
+
+    if reference is None or not reference.matches(BasePoints):
+        reference = icgnReference(BasePoints, Base, CORRSIZE)
+    xymoving = np.array(InputPoints, dtype=np.float64)
+    StdX = np.array(StdX, dtype=np.float64)
+    StdY = np.array(StdY, dtype=np.float64)
+    markers = np.flatnonzero(np.ravel(markers) & reference.valid)
+    if len(markers) == 0:
+        return xymoving, StdX, StdY
+
+    from scipy import ndimage #not imported with the module, slow to load in each correlation process
+    coefficients = ndimage.spline_filter(np.asarray(Input, dtype=np.float64), order=3)
+    for batchStart in range(0, len(markers), BATCH_SIZE):
+        batch = markers[batchStart:batchStart+BATCH_SIZE]
+        [points, stdX, stdY, converged] = reference.refine(batch, xymoving[batch], coefficients)
+        batch = batch[converged]
+        xymoving[batch] = points[converged]
+        StdX[batch,0] = stdX[converged]
+        StdY[batch,0] = stdY[converged]
+    return xymoving, StdX, StdY
+
+def validRects(rects, shape):
+# True for the rectangles which can be cropped as a whole from an image of the given shape
+
+    [row, col] = shape
+    return (rects[2] > 0) & (rects[3] > 0) & (rects[0] >= 0) & (rects[1] >= 0) & (rects[0]+rects[2] <= col) & (rects[1]+rects[3] <= row)
+
+def extractSubsets(img, left, upper, size):
+# return a (nbRects, size, size) stack of the square subsets with upper-left corners (left, upper) read through a strided view of img
+
+    [row, col] = img.shape
+    windows = np.lib.stride_tricks.as_strided(img, shape=(row-size+1, col-size+1, size, size), strides=img.strides+img.strides, writeable=False)
+    return windows[upper, left]
+
+def windowSquareSums(img, size):
+# sum of the squares of every size x size window of the image, (row-size+1, col-size+1) map read from the summed-area table of the squared image (exact for integer images)
+
+    [row, col] = img.shape
+    sumTable = np.zeros((row+1, col+1))
+    np.cumsum(np.cumsum(np.asarray(img, dtype=np.float64)**2, axis=0), axis=1, out=sumTable[1:, 1:])
+    return sumTable[size:, size:] - sumTable[:-size, size:] - sumTable[size:, :-size] + sumTable[:-size, :-size]
+
+def normCrossCorrStack(templates, images, windowSum=None, imageSpectra=None, imageShape=None):
+# cv2.TM_CCORR_NORMED for a stack of templates (n, h, w) matched on a stack of images (n, H, W), numerators are computed in one FFT pass
+# windowSum : sums of the squares of the image windows (read from windowSquareSums), computed from the images if None
+# imageSpectra : rfft2 of the images, images can be None when they are given with their (H, W) imageShape and windowSum
+
+    [nbRects, height, width] = templates.shape
+    if imageShape is None:
+        imageShape = images.shape[1:]
+    [imgHeight, imgWidth] = imageShape
+    resultHeight = imgHeight-height+1
+    resultWidth = imgWidth-width+1
+
+    # numerator : cross correlation of each template over its own image
+    fftShape = (imgHeight, imgWidth)
+    if imageSpectra is None:
+        imageSpectra = scipy.fft.rfft2(images, s=fftShape)
+    crossCorr = scipy.fft.irfft2(imageSpectra*np.conj(scipy.fft.rfft2(templates, s=fftShape)), s=fftShape)
+    numerator = crossCorr[:, :resultHeight, :resultWidth]
+
+    # denominator : template norm times the norm of every window of the image (summed-area table)
+    if windowSum is None:
+        sumTable = np.zeros((nbRects, imgHeight+1, imgWidth+1))
+        sumTable[:, 1:, 1:] = np.cumsum(np.cumsum(images**2, axis=1, dtype=np.float64), axis=2)
+        windowSum = sumTable[:, height:, width:] - sumTable[:, :-height, width:] - sumTable[:, height:, :-width] + sumTable[:, :-height, :-width]
+    templateSum = np.sum(templates**2, axis=(1,2), dtype=np.float64)
+    denominator = np.sqrt(np.maximum(windowSum, 0)*templateSum[:, None, None])
+
+    return normalizeCrossCorr(numerator, denominator)
+
+def normalizeCrossCorr(numerator, denominator):
+# division applied by cv2.matchTemplate for normed methods : rounding errors slightly above 1 are clipped, undefined values are set to 0
+
+    normalized = np.zeros(numerator.shape)
+    absNumerator = np.absolute(numerator)
+    inside = absNumerator < denominator
+    normalized[inside] = numerator[inside]/denominator[inside]
+    clipped = ~inside & (absNumerator < 1.125*denominator)
+    normalized[clipped] = np.sign(numerator[clipped])
+    return normalized
+
+def calc_rects(xy,halfwidth,img):
+
+    # Calculate rectangles so imcrop will return image with xy coordinate inside center pixel
+    default_width = 2*halfwidth
+    default_height = default_width
+    [row, col] = img.shape
+
+    # xy specifies center of rectangle, need upper left
+    upperleft=np.around(xy)-halfwidth
+    lowerright=np.around(xy)+halfwidth
+
+
+    # need to modify for pixels near edge of images
+    left = upperleft[:,0]
+    upper = upperleft[:,1]
+    right = lowerright[:,0]
+    lower = lowerright[:,1]
+
+    #lower = upper + default_height
+    #right = left + default_width
+    width = default_width * np.ones(np.shape(upper))
+    height = default_height * np.ones(np.shape(upper))
+
+    #check edges for coordinates outside image
+    [upper, height] = adjust_lo_edge(upper,1,height)
+    [lower, height] = adjust_hi_edge(lower,row,height)
+    [left,width] = adjust_lo_edge(left,1,width)
+    [right, width] = adjust_hi_edge(right,col,width)
+
+    # set width and height to zero when less than default size
+    #iw = find(width<default_width)
+    #ih = find(height<default_height)
+    #idx = unique([iw,ih])
+    #width[idx] = 0
+    #height[idx] = 0
+
+    rect = [left.astype(int), upper.astype(int), width.astype(int), height.astype(int)]
+    return rect
+
+def adjust_lo_edge(coordinates,edge,breadth):
+
+    for indx in range(0,len(coordinates)):
+        if coordinates[indx] < edge:
+            #breadth[indx] = breadth[indx] - np.absolute(coordinates[indx]-edge)
+            breadth[indx] = 0
+            coordinates[indx] = edge
+    return coordinates, breadth
+
+def adjust_hi_edge(coordinates,edge,breadth):
+
+    for indx in range(0,len(coordinates)):
+        if coordinates[indx] > edge:
+            #breadth[indx] = breadth[indx] - np.absolute(coordinates[indx]-edge)
+            breadth[indx] = 0
+            coordinates[indx] = edge
+    return coordinates, breadth
+
+def ParseInputs(InputPoints,BasePoints,Input,Base):
+
+    xymoving_in = InputPoints
+    xyfixed_in = BasePoints
+    moving = Input
+    fixed = Base
+    return xymoving_in,xyfixed_in,moving,fixed
+
+# sub pixel accuracy by 2D polynomial fit (quadratic)
+def findpeak(f,subpixel):
+
+    [xpeak, ypeak, stdx, stdy, max_f, info] = findpeakBatch(f[np.newaxis], subpixel)
+    return xpeak[0], ypeak[0], stdx[0], stdy[0], max_f[0], info[0]
+
+def findpeakBatch(f,subpixel):
+# findpeak applied to a (N, height, width) stack of cross correlation maps
+# return xpeak (column), ypeak (row), stdx, stdy, max_f and info (0 : OK, 1 : subpixel outside limits, 2 : div. by 0) as arrays of length N
+
+    nbPeaks = f.shape[0]
+    flatPeak = np.argmax(np.reshape(f, (nbPeaks, -1)), axis=1)
+    [xpeak,ypeak] = np.unravel_index(flatPeak, f.shape[1:]) #coordinates of the maximum value in f
+    max_f = np.reshape(f, (nbPeaks, -1))[np.arange(nbPeaks), flatPeak]
+
+    xpeakOut = ypeak.astype(np.float64)
+    ypeakOut = xpeak.astype(np.float64)
+    stdx = 1e-4*np.ones(nbPeaks)
+    stdy = 1e-4*np.ones(nbPeaks)
+    info = np.zeros(nbPeaks, dtype=int)
+
+    # no subpixel adjustement for the peaks on edge
+    inside = (xpeak > 0) & (xpeak < f.shape[1]-1) & (ypeak > 0) & (ypeak < f.shape[2]-1)
+    if subpixel == False or not np.any(inside):
+        return xpeakOut, ypeakOut, stdx, stdy, max_f, info
+
+    peaks = np.flatnonzero(inside)
+    rows = xpeak[peaks, None, None] + np.arange(-1, 2)[None, :, None]
+    cols = ypeak[peaks, None, None] + np.arange(-1, 2)[None, None, :]
+    neighborhoods = f[peaks[:, None, None], rows, cols]
+
+    [x_offset, y_offset, peakStdX, peakStdY, fittedMax, peakInfo] = fitPeaks(neighborhoods)
+
+    # offsets are applied unless the adjusted peak falls outside the set of 9 points
+    adjusted = peakInfo != 1
+    xpeakOut[peaks[adjusted]] += y_offset[adjusted]
+    ypeakOut[peaks[adjusted]] += x_offset[adjusted]
+    info[peaks] = peakInfo
+
+    fitted = peakInfo == 0
+    stdx[peaks[fitted]] = peakStdX[fitted]
+    stdy[peaks[fitted]] = peakStdY[fitted]
+    max_f = max_f.astype(np.float64)
+    max_f[peaks[fitted]] = fittedMax[fitted]
+
+    return xpeakOut, ypeakOut, stdx, stdy, max_f, info
+
+def fitPeaks(neighborhoods):
+# closed-form quadratic subpixel fit of a (N, 3, 3) stack of peak neighborhoods
+# return the rounded x (row) and y (column) offsets, their std. dev., the fitted maximum and info (0 : OK, 1 : subpixel outside limits, 2 : div. by 0)
+
+    nbPeaks = neighborhoods.shape[0]
+    u = np.reshape(np.transpose(neighborhoods, (0, 2, 1)), (nbPeaks, 9))
+    A = np.dot(u, np.transpose(PEAK_PINV))
+
+    # residuals, estimate of the noise variance and std deviations on each term
+    e = np.sum((u - np.dot(A, np.transpose(PEAK_DESIGN)))**2, axis=1)
+    n=9     # number of data points
+    p=6     # number of fitted parameters
+    var = e**2/(n-p)
+    s = np.sqrt(np.diag(PEAK_COV)[None, :]*var[:, None])
+
+    info = np.zeros(nbPeaks, dtype=int)
+    with np.errstate(divide='ignore', invalid='ignore'):
+
+        # get absolute maximum, where du/dx = du/dy = 0
+        x_num = (-A[:,2]*A[:,3]+2*A[:,5]*A[:,1])
+        y_num = (-A[:,3]*A[:,1]+2*A[:,4]*A[:,2])
+        den = (A[:,3]**2-4*A[:,4]*A[:,5])
+        x_offset = x_num / den
+        y_offset = y_num / den
+
+        # adjusted peak falls outside set of 9 points fit
+        info[(np.absolute(x_offset) > 1) | (np.absolute(y_offset) > 1)] = 1
+
+        x_offset = np.around(x_offset, decimals=4)
+        y_offset = np.around(y_offset, decimals=4)
+
+        # avoid divide by zero error and invalid value
+        info[(info == 0) & np.any(A[:,1:] == 0, axis=1)] = 2
+
+        # Calculate standard deviation of denominator, and numerators
+        x_num_std=np.sqrt(4*A[:,5]**2*A[:,1]**2*((s[:,5]/A[:,5])**2+(s[:,1]/A[:,1])**2)+A[:,2]**2*A[:,3]**2*((s[:,2]/A[:,2])**2+(s[:,3]/A[:,3])**2))
+        den_std=np.sqrt(16*A[:,4]**2*A[:,5]**2*((s[:,4]/A[:,4])**2+(s[:,5]/A[:,5])**2)+2*s[:,3]**2*A[:,3]**2)
+        y_num_std=np.sqrt(4*A[:,4]**2*A[:,2]**2*((s[:,4]/A[:,4])**2+(s[:,2]/A[:,2])**2)+A[:,3]**2*A[:,1]**2*((s[:,3]/A[:,3])**2+(s[:,1]/A[:,1])**2))
+
+        # Calculate standard deviation of x and y positions
+        stdx=np.sqrt(x_offset**2*((x_num_std/x_num)**2+(den_std/den)**2))
+        stdy=np.sqrt(y_offset**2*((den_std/den)**2+(y_num_std/y_num)**2))
+
+        # Calculate extremum of fitted function
+        terms = np.column_stack((np.ones(nbPeaks), x_offset, y_offset, x_offset*y_offset, x_offset**2, y_offset**2))
+        max_f = np.absolute(np.sum(terms*A, axis=1))
+
+    return x_offset, y_offset, stdx, stdy, max_f, info
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""
+Please report issues and request on the GitHub project from ChrisEberl (Python_DIC)
+More details regarding the project on the GitHub Wiki : https://github.com/ChrisEberl/Python_DIC/wiki
+
+Current File: Contains the binary cache of the interpolated fields (correlation 2D, strain X and Y) of each instance and image
+"""
+
+import numpy as np, json, hashlib, os
+
+#PARAMETERS
+FIELD_DIRECTORY = 'coordinates' #one .npy file of fields per calculated (instance, image) cell : 3 x len(yi) x len(xi)
+FIELD_DTYPE = np.float32 #precision of the cached fields, enough for the plots
+HEADER_FILE = 'coordinates.json' #grid, mask version and key of each cell
+OLD_FIELD_FILE = 'coordinates.npy' #dense cache of all the cells written by the previous version, removed when found
+CACHE_VERSION = 3
+#END PARAMETERS
+
+def markersKey(markers): #short identifier of a marker list (or a mask)
+
+    return hashlib.sha1(np.ascontiguousarray(markers).astype(np.int64).tobytes()).hexdigest()[:16]
+
+def cellKeys(markers, referenceImage, neighbors): #key of the correlation field and of the strain fields of an instance : its markers and the reference image, and the neighbors of its markers for the strain
+
+    markers = np.atleast_1d(markers).astype(np.int64)
+    correlationKey = markersKey(np.append(markers, referenceImage))
+    markerNeighbors = np.nan_to_num(np.atleast_2d(neighbors)[markers], nan=-1)
+    strainKey = markersKey(np.concatenate((markers, [referenceImage], np.ravel(markerNeighbors))))
+    return [correlationKey, strainKey, strainKey]
+
+def openFieldCache(directory, nbInstances, nbImages, xi, yi): #open the cache of the analysis if it has been calculated on the same grid, create an empty one otherwise
+
+    grid = [float(xi[0]), float(xi[-1]), float(yi[0]), float(yi[-1])]
+    shape = (nbInstances, nbImages, 3, len(yi), len(xi))
+    header = None
+    try:
+        with open(directory+'/'+HEADER_FILE, 'r') as headerFile:
+            header = json.load(headerFile)
+    except:
+        header = None
+    if header is None or header['version'] != CACHE_VERSION or header['grid'] != grid or tuple(header['shape']) != shape:
+        if os.path.exists(directory+'/'+HEADER_FILE): #no cell is valid until the new header is saved
+            os.remove(directory+'/'+HEADER_FILE)
+        if os.path.exists(directory+'/'+OLD_FIELD_FILE):
+            os.remove(directory+'/'+OLD_FIELD_FILE)
+        if os.path.isdir(directory+'/'+FIELD_DIRECTORY): #cells of another grid
+            for cellFile in os.listdir(directory+'/'+FIELD_DIRECTORY):
+                os.remove(directory+'/'+FIELD_DIRECTORY+'/'+cellFile)
+        header = {'version': CACHE_VERSION, 'grid': grid, 'shape': list(shape), 'mask': '', 'cells': [[['' for image in range(nbImages)] for instance in range(nbInstances)] for field in range(3)]} #cellKeys of each calculated cell
+    os.makedirs(directory+'/'+FIELD_DIRECTORY, exist_ok=True)
+
+    return {'directory': directory, 'grid': [xi, yi], 'header': header, 'cells': np.array(header['cells'], dtype=object).reshape(3, nbInstances, nbImages)}
+
+def cellPath(fieldCache, instance, image):
+
+    return fieldCache['directory']+'/'+FIELD_DIRECTORY+'/'+str(int(instance))+'_'+str(int(image))+'.npy'
+
+def writeFields(fieldCache, instance, images, field, values): #write one field of the (instance, image) cells, the file of a cell is created when its first field is calculated
+
+    [xi, yi] = fieldCache['grid']
+    for image, value in zip(images, values):
+        path = cellPath(fieldCache, instance, image)
+        if os.path.exists(path):
+            cell = np.load(path, mmap_mode='r+')
+        else:
+            cell = np.lib.format.open_memmap(path, mode='w+', dtype=FIELD_DTYPE, shape=(3, len(yi), len(xi)))
+            cell[:] = np.nan
+        cell[field] = value
+        cell.flush()
+        del cell
+
+def readField(fieldCache, instance, image, field):
+
+    return np.array(np.load(cellPath(fieldCache, instance, image), mmap_mode='r')[field])
+
+def saveFieldCache(fieldCache, mask): #write the header with the mask version the calculated cells come from
+
+    header = fieldCache['header']
+    header['mask'] = markersKey(mask)
+    header['cells'] = fieldCache['cells'].tolist()
+    temporaryFile = fieldCache['directory']+'/'+HEADER_FILE+'.tmp'
+    with open(temporaryFile, 'w') as headerFile:
+        json.dump(header, headerFile)
+    os.replace(temporaryFile, fieldCache['directory']+'/'+HEADER_FILE)
+
+class fieldImages: #fields of one instance on the active images, read from the cache when accessed
+
+    def __init__(self, fieldCache, instance, field, images):
+
+        self.fieldCache = fieldCache
+        self.instance = instance
+        self.field = field
+        self.images = images
+
+    def __len__(self):
+
+        return len(self.images)
+
+    def __getitem__(self, image):
+
+        return readField(self.fieldCache, self.instance, self.images[image], self.field)
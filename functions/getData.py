@@ -1,104 +1,215 @@
-# -*- coding: utf-8 -*-
-"""
-Created on 05/04/2016
-
-@author: Charlie Bourigault
-@contact: bourigault.charlie@gmail.com
-
-Please report issues and request on the GitHub project from ChrisEberl (Python_DIC)
-More details regarding the project on the GitHub Wiki : https://github.com/ChrisEberl/Python_DIC/wiki
-
-Current File: This file manages the analysis files and open/generate data from them
-"""
-
-from PyQt4.QtCore import *
-from PyQt4.QtGui import *
-import csv, os, numpy as np, time, multiprocessing, pandas
-from math import sqrt
-from functions import DIC_Global, filterFunctions, initData
-
-
-def openData(parentWindow, progressBar, parent): #parent contains the Thread in which the opening is made
-
-    dataList = generateData(parentWindow, progressBar)
-    if dataList is not None:
-        parentWindow.devWindow.addInfo('Data extracted from files. Preparing the calculation.')
-        parent.signal.threadSignal.emit(dataList)
-    else:
-        parent.signal.threadSignal.emit([0])
-    return
-
-def generateData(parentWindow, progressBar):
-
-    #Opening main files
-    progressBar.currentTitle = "Opening validx.csv"
-    data_x = testReadFile(parentWindow.fileDataPath+'/validx.csv')
-    progressBar.currentTitle = "Opening validy.csv"
-    progressBar.percent = 15
-    data_y = testReadFile(parentWindow.fileDataPath+'/validy.csv')
-    progressBar.currentTitle = "Opening corrcoef.csv"
-    progressBar.percent = 30
-    data_corr = testReadFile(parentWindow.fileDataPath+'/corrcoef.csv')
-    progressBar.currentTitle = "Opening stdx.csv"
-    progressBar.percent = 45
-    data_stdx = testReadFile(parentWindow.fileDataPath+'/stdx.csv')
-    progressBar.currentTitle = "Opening stdy.csv"
-    progressBar.percent = 60
-    data_stdy = testReadFile(parentWindow.fileDataPath+'/stdy.csv')
-    progressBar.currentTitle = "Opening dispx.csv"
-    progressBar.percent = 75
-    disp_x = testReadFile(parentWindow.fileDataPath+'/dispx.csv')
-    progressBar.currentTitle = "Opening dispy.csv"
-    progressBar.percent = 90
-    disp_y = testReadFile(parentWindow.fileDataPath+'/dispy.csv')
-    if data_x is None or data_y is None or data_corr is None or data_stdx is None or data_stdy is None or disp_x is None or disp_y is None:
-        return None
-
-    progressBar.currentTitle = "Finishing preparation..."
-    filenamelist = []
-    filenamelistRead = testReadFile(parentWindow.fileDataPath+'/filenamelist.csv', lib=1)
-    if filenamelistRead is None:
-        return None
-    else:
-        for row in filenamelistRead:
-            filenamelist.append(row.decode(encoding='utf-8'))
-
-    grid_entities = testReadFile(parentWindow.fileDataPath+'/gridx.csv')
-    if grid_entities is None:
-        return None
-
-    temp_grid_instances = []
-    for (coor, instance) in grid_entities:
-        temp_grid_instances.append(instance)
-    temp_grid_instances = np.array(temp_grid_instances)
-
-    filterList = filterFunctions.saveOpenFilter(parentWindow.fileDataPath)
-    nbImages = len(filenamelist)
-
-    largeDisp = testReadFile(parentWindow.fileDataPath+'/largeDisp.csv')
-
-    #Last operations
-    nb_marker = data_x.shape[0]
-    nb_image = data_x.shape[1]
-
-    instances = np.unique(temp_grid_instances).tolist()
-    grid_instances = []
-    for instance in instances:
-        grid_instances.append([])
-    for marker in range(nb_marker):
-        grid_instances[instances.index(temp_grid_instances[marker])].append(marker)
-
-    return [data_x, data_y, data_corr, data_stdx, data_stdy, disp_x, disp_y, filenamelist, nb_marker, nb_image, filterList, grid_instances, largeDisp]
-
-
-def testReadFile(filePath, lib=None):
-
-    #test if the file exist
-    try:
-        if lib is not None: #for filenamelist to avoid type problems and errors due to space in file naming
-            readFile = np.genfromtxt(filePath, dtype=None, delimiter=',')
-        else:
-            readFile = pandas.read_csv(filePath, dtype=None, delimiter=',', header=None).values #pandas is way faster than numpy for this
-    except:
-        return None
-    return readFile
+# -*- coding: utf-8 -*-
+"""
+Created on 05/04/2016
+
+@author: Charlie Bourigault
+@contact: bourigault.charlie@gmail.com
+
+Please report issues and request on the GitHub project from ChrisEberl (Python_DIC)
+More details regarding the project on the GitHub Wiki : https://github.com/ChrisEberl/Python_DIC/wiki
+
+Current File: This file manages the analysis files and open/generate data from them
+"""
+
+import os, numpy as np, time, json
+from functions import filterFunctions
+
+#PARAMETERS
+RESULT_MANIFEST = 'results.json' #list of the result matrices saved as binary .npy files in the analysis folder
+RESULT_VERSION = 1
+RESULT_CHUNK = 256 #number of image columns read at once when a result matrice is scanned completely
+#END PARAMETERS
+
+
+def openData(parentWindow, progressBar, parent): #parent contains the Thread in which the opening is made
+
+    dataList = generateData(parentWindow, progressBar)
+    if dataList is not None:
+        parentWindow.devWindow.addInfo('Data extracted from files. Preparing the calculation.')
+        parent.signal.threadSignal.emit(dataList)
+    else:
+        parent.signal.threadSignal.emit([0])
+    return
+
+def generateData(parentWindow, progressBar):
+
+    #Opening main files
+    #binary results are memory mapped, image columns are only read from the disk when used
+    progressBar.currentTitle = "Opening validx"
+    data_x = readResult(parentWindow.fileDataPath, 'validx', mmap_mode='r')
+    progressBar.currentTitle = "Opening validy"
+    progressBar.percent = 15
+    data_y = readResult(parentWindow.fileDataPath, 'validy', mmap_mode='r')
+    progressBar.currentTitle = "Opening corrcoef"
+    progressBar.percent = 30
+    data_corr = readResult(parentWindow.fileDataPath, 'corrcoef', mmap_mode='r')
+    progressBar.currentTitle = "Opening stdx"
+    progressBar.percent = 45
+    data_stdx = readResult(parentWindow.fileDataPath, 'stdx', mmap_mode='r')
+    progressBar.currentTitle = "Opening stdy"
+    progressBar.percent = 60
+    data_stdy = readResult(parentWindow.fileDataPath, 'stdy', mmap_mode='r')
+    progressBar.currentTitle = "Opening dispx"
+    progressBar.percent = 75
+    disp_x = readResult(parentWindow.fileDataPath, 'dispx', mmap_mode='r')
+    progressBar.currentTitle = "Opening dispy"
+    progressBar.percent = 90
+    disp_y = readResult(parentWindow.fileDataPath, 'dispy', mmap_mode='r')
+    if data_x is None or data_y is None or data_corr is None or data_stdx is None or data_stdy is None or disp_x is None or disp_y is None:
+        return None
+
+    progressBar.currentTitle = "Finishing preparation..."
+    filenamelist = []
+    filenamelistRead = testReadFile(parentWindow.fileDataPath+'/filenamelist.csv', lib=1)
+    if filenamelistRead is None:
+        return None
+    else:
+        for row in filenamelistRead:
+            filenamelist.append(row.decode(encoding='utf-8'))
+
+    filterList = filterFunctions.saveOpenFilter(parentWindow.fileDataPath)
+    nbImages = len(filenamelist)
+
+    largeDisp = testReadFile(parentWindow.fileDataPath+'/largeDisp.csv')
+
+    #Last operations
+    nb_marker = data_x.shape[0]
+    nb_image = data_x.shape[1]
+
+    grid_instances = readGridInstances(parentWindow.fileDataPath, nb_marker)
+    if grid_instances is None:
+        return None
+
+    return [data_x, data_y, data_corr, data_stdx, data_stdy, disp_x, disp_y, filenamelist, nb_marker, nb_image, filterList, grid_instances, largeDisp]
+
+
+def readGridInstances(fileDataPath, nb_marker): #list of the markers of each grid instance from the gridx.csv file, a grid without instance column is a single instance
+
+    grid_entities = testReadFile(fileDataPath+'/gridx.csv')
+    if grid_entities is None:
+        return None
+    if grid_entities.ndim < 2 or grid_entities.shape[1] < 2:
+        return [list(range(nb_marker))]
+
+    temp_grid_instances = []
+    for (coor, instance) in grid_entities:
+        temp_grid_instances.append(instance)
+    temp_grid_instances = np.array(temp_grid_instances)
+
+    instances = np.unique(temp_grid_instances).tolist()
+    grid_instances = []
+    for instance in instances:
+        grid_instances.append([])
+    for marker in range(nb_marker):
+        grid_instances[instances.index(temp_grid_instances[marker])].append(marker)
+    return grid_instances
+
+def testReadFile(filePath, lib=None):
+
+    #test if the file exist
+    try:
+        if lib is not None: #for filenamelist to avoid type problems and errors due to space in file naming
+            readFile = np.genfromtxt(filePath, dtype=None, delimiter=',')
+        else:
+            import pandas #imported when a file is read only, the correlation processes import this module without reading .csv files
+            readFile = pandas.read_csv(filePath, dtype=None, delimiter=',', header=None).values #pandas is way faster than numpy for this
+    except:
+        return None
+    return readFile
+
+def saveResults(fileDataPath, results, exportCSV=False, progressBar=None): #save the result matrices (dict name : matrice) as .npy files listed in the manifest, and as .csv files if exportCSV
+
+    manifest = readManifest(fileDataPath)
+    if manifest is None:
+        manifest = {'version': RESULT_VERSION, 'results': {}}
+    nbResults = len(results)
+    for i, name in enumerate(results):
+        if progressBar is not None:
+            progressBar.currentTitle = 'Saving '+name+'...'
+            progressBar.percent = i * 100 / nbResults
+        data = np.asarray(results[name])
+        if data.ndim == 2: #markers x images matrices are saved column by column, one image is contiguous in the file
+            data = np.asfortranarray(data)
+        np.save(fileDataPath+'/'+name+'.npy', data)
+        manifest['results'][name] = {'shape': list(data.shape), 'dtype': data.dtype.str}
+        if data.dtype.kind == 'f' and data.size > 0:
+            manifest['results'][name]['limits'] = [float(np.fmin.reduce(data, axis=None)), float(np.fmax.reduce(data, axis=None))]
+        if exportCSV:
+            np.savetxt(fileDataPath+'/'+name+'.csv', data, fmt="%s", delimiter=',')
+    with open(fileDataPath+'/'+RESULT_MANIFEST, 'w') as manifestFile: #written last, an interrupted saving keeps the previous manifest
+        json.dump(manifest, manifestFile, indent=1)
+
+def readManifest(fileDataPath):
+
+    try:
+        with open(fileDataPath+'/'+RESULT_MANIFEST, 'r') as manifestFile:
+            manifest = json.load(manifestFile)
+    except:
+        return None
+    return manifest
+
+def readResult(fileDataPath, name, mmap_mode=None): #read a result matrice from its .npy file when listed in the manifest, from the .csv file otherwise (older analysis)
+
+    manifest = readManifest(fileDataPath)
+    if manifest is not None and name in manifest['results']:
+        try:
+            data = np.load(fileDataPath+'/'+name+'.npy', mmap_mode=mmap_mode)
+        except:
+            return None
+        if data.dtype == np.float16: #compact precision, only used for the storage (numpy calculates float16 in software)
+            data = upcastResult(data)
+        return data
+    return testReadFile(fileDataPath+'/'+name+'.csv')
+
+class upcastResult: #float16 result matrice read as float32, only the parts indexed are converted and a memory mapped file stays on the disk
+
+    def __init__(self, data, dtype=np.float32):
+
+        self.data = data
+        self.dtype = np.dtype(dtype)
+        self.shape = data.shape
+        self.ndim = data.ndim
+        self.size = data.size
+
+    def __getitem__(self, key):
+
+        return np.asarray(self.data[key]).astype(self.dtype)
+
+    def __len__(self):
+
+        return len(self.data)
+
+    def __array__(self, dtype=None): #complete conversion, when the whole matrice is used
+
+        return np.asarray(self.data).astype(self.dtype if dtype is None else dtype)
+
+def resultLimits(fileDataPath, name, data): #[min, max] of a result matrice ignoring nan, from the manifest when saved there, computed by blocks of image columns otherwise
+
+    manifest = readManifest(fileDataPath)
+    if manifest is not None and 'limits' in manifest['results'].get(name, {}):
+        return np.array(manifest['results'][name]['limits'])
+    limits = np.array([np.nan, np.nan])
+    for start in range(0, data.shape[1], RESULT_CHUNK):
+        block = np.asarray(data[:, start:start+RESULT_CHUNK])
+        limits = np.array([np.fmin(limits[0], np.fmin.reduce(block, axis=None)), np.fmax(limits[1], np.fmax.reduce(block, axis=None))])
+    return limits
+
+def exportResultsCSV(fileDataPath, progressBar=None): #write a .csv copy of every binary result matrice
+
+    manifest = readManifest(fileDataPath)
+    if manifest is None:
+        return 0
+    names = list(manifest['results'])
+    for i, name in enumerate(names):
+        if progressBar is not None:
+            progressBar.currentTitle = 'Exporting '+name+'.csv...'
+            progressBar.percent = i * 100 / len(names)
+        data = readResult(fileDataPath, name, mmap_mode='r')
+        if data is not None:
+            np.savetxt(fileDataPath+'/'+name+'.csv', data, fmt="%s", delimiter=',')
+    return len(names)
+
+def exportCSVRequest(parentWindow):
+
+    nbExported = exportResultsCSV(parentWindow.fileDataPath)
+    parentWindow.devWindow.addInfo(str(nbExported)+' result files exported to .csv in '+parentWindow.fileDataPath)
@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+"""
+Please report issues and request on the GitHub project from ChrisEberl (Python_DIC)
+More details regarding the project on the GitHub Wiki : https://github.com/ChrisEberl/Python_DIC/wiki
+
+Current File: Contains the shared memory cache of the filtered images used by the correlation processes
+"""
+
+import numpy as np, cv2, time, threading, queue, collections, os
+from multiprocessing import shared_memory
+from functions import filterFunctions
+
+#PARAMETERS
+SHARED_MEMORY_PATH = '/dev/shm' #file system of the shared memory blocks on Linux, the cache never takes more than its free space
+SHARED_MEMORY_MARGIN = 64 #MB left free in SHARED_MEMORY_PATH for the other shared blocks (results, other applications)
+#END PARAMETERS
+
+def loadImage(filePath, fileName, filterInfos): #read an image in grayscale and apply the filter list
+
+    image = cv2.imread(filePath+'/'+fileName, 0)
+    image = filterFunctions.applyFilterListToImage(filterInfos, image)
+    return image
+
+def sharedMemoryLimit(maxMemory): #largest shared cache size (bytes), maxMemory (MB) capped by the free space of the shared memory file system when there is one
+
+    limit = maxMemory*1024**2
+    if os.path.isdir(SHARED_MEMORY_PATH):
+        try:
+            stats = os.statvfs(SHARED_MEMORY_PATH)
+            limit = min(limit, stats.f_bavail*stats.f_frsize - SHARED_MEMORY_MARGIN*1024**2)
+        except (OSError, AttributeError):
+            pass
+    return limit
+
+def createImageCache(filePath, fileNameList, activeImages, filterInfos, maxMemory): #allocate a shared memory block for all the active images (maxMemory in MB), return the block and the informations needed by the processes to read it
+
+    activeList = np.flatnonzero(activeImages)
+    if len(activeList) < 1:
+        return None, None
+
+    firstImage = loadImage(filePath, fileNameList[activeList[0]], filterInfos)
+    if firstImage is None:
+        return None, None
+    nbBytes = firstImage.nbytes*len(activeList)
+    if nbBytes > sharedMemoryLimit(maxMemory): #the images are read from the disk by each process instead
+        return None, None
+
+    sharedBlock = shared_memory.SharedMemory(create=True, size=nbBytes)
+    slots = -np.ones(len(fileNameList), dtype=int) #position of each image in the cache, -1 if not cached
+    slots[activeList] = np.arange(len(activeList))
+    cacheInfos = {'name': sharedBlock.name, 'shape': (len(activeList),)+firstImage.shape, 'dtype': firstImage.dtype.str, 'slots': slots}
+
+    imageStack = np.ndarray(cacheInfos['shape'], dtype=np.dtype(cacheInfos['dtype']), buffer=sharedBlock.buf)
+    imageStack[0] = firstImage
+    del imageStack
+
+    return sharedBlock, cacheInfos
+
+def fillImageCache(cacheInfos, filePath, fileNameList, imageList, filterInfos, q, pipe): #loader process, decode and filter each image of imageList once and write it in the cache, put the images that could not be cached
+
+    sharedBlock = shared_memory.SharedMemory(name=cacheInfos['name'])
+    imageStack = np.ndarray(cacheInfos['shape'], dtype=np.dtype(cacheInfos['dtype']), buffer=sharedBlock.buf)
+
+    nbImages = len(imageList)
+    notCached = []
+    previousTime = time.time()
+    for i in range(nbImages):
+        image = imageList[i]
+        try:
+            loadedImage = loadImage(filePath, fileNameList[image], filterInfos)
+        except Exception:
+            loadedImage = None
+        if loadedImage is None or loadedImage.shape != imageStack.shape[1:] or loadedImage.dtype != imageStack.dtype: #missing, unreadable or different image, read by the correlation processes as without cache
+            notCached.append(image)
+        else:
+            imageStack[cacheInfos['slots'][image]] = loadedImage
+        currentTime = time.time()
+        if pipe is not None and currentTime > previousTime + .05:
+            previousTime = currentTime
+            pipe.send(i * 100 / nbImages)
+
+    del imageStack
+    sharedBlock.close()
+    if q is not None:
+        q.put(np.array([notCached], dtype=int))
+        q.close()
+
+def releaseImageCache(sharedBlock): #free the shared memory block once all the processes are done
+
+    if sharedBlock is not None:
+        sharedBlock.close()
+        sharedBlock.unlink()
+
+class imageReader: #give the filtered images to a correlation process, from the shared cache when available or from the disk (optionally prefetched)
+
+    def __init__(self, filePath, fileNameList, filterInfos, cacheInfos=None):
+
+        self.filePath = filePath
+        self.fileNameList = fileNameList
+        self.filterInfos = filterInfos
+        self.imageBytes = 0
+        self.prefetchThread = None
+        self.sharedBlock = None
+        if cacheInfos is not None:
+            self.sharedBlock = shared_memory.SharedMemory(name=cacheInfos['name'])
+            self.imageStack = np.ndarray(cacheInfos['shape'], dtype=np.dtype(cacheInfos['dtype']), buffer=self.sharedBlock.buf)
+            self.imageStack.flags.writeable = False #images are shared between all the processes
+            self.slots = cacheInfos['slots']
+
+    def read(self, image):
+
+        if self.sharedBlock is not None and self.slots[image] >= 0:
+            return self.imageStack[self.slots[image]]
+        loadedImage = None
+        if self.prefetchThread is not None and image in self.prefetchList:
+            while self.prefetchList.popleft() != image: #images skipped by the caller are dropped
+                self.prefetchQueue.get()
+            loadedImage = self.prefetchQueue.get()
+        if loadedImage is None: #not prefetched or failed in the loading thread, read it here to get the error
+            loadedImage = loadImage(self.filePath, self.fileNameList[image], self.filterInfos)
+        if loadedImage is not None:
+            self.imageBytes = loadedImage.nbytes
+        return loadedImage
+
+    def prefetch(self, imageList, depth, maxMemory): #decode and filter the images of imageList in a background thread, in the order they will be read (at most depth images and maxMemory MB waiting)
+
+        if depth < 1 or self.prefetchThread is not None:
+            return
+        if self.sharedBlock is not None:
+            imageList = [image for image in imageList if self.slots[image] < 0]
+        if len(imageList) < 1:
+            return
+        if self.imageBytes > 0:
+            depth = max(min(depth, int(maxMemory*1024**2 // self.imageBytes)), 1)
+
+        self.prefetchList = collections.deque(imageList)
+        self.prefetchQueue = queue.Queue(maxsize=depth)
+        self.stopPrefetch = threading.Event()
+        self.prefetchThread = threading.Thread(target=self.prefetchImages, args=(list(imageList),), daemon=True)
+        self.prefetchThread.start()
+
+    def prefetchImages(self, imageList): #loading thread, blocked as long as the queue is full
+
+        for image in imageList:
+            try:
+                loadedImage = loadImage(self.filePath, self.fileNameList[image], self.filterInfos)
+            except Exception:
+                loadedImage = None
+            while not self.stopPrefetch.is_set():
+                try:
+                    self.prefetchQueue.put(loadedImage, timeout=.1)
+                    break
+                except queue.Full:
+                    continue
+            if self.stopPrefetch.is_set():
+                return
+
+    def close(self):
+
+        if self.prefetchThread is not None:
+            self.stopPrefetch.set()
+            self.prefetchThread.join()
+            self.prefetchThread = None
+
+        if self.sharedBlock is not None:
+            self.imageStack = None
+            try:
+                self.sharedBlock.close()
+            except BufferError: #images still referenced by the caller, the mapping is released with the process
+                pass
+            self.sharedBlock = None
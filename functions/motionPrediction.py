@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+"""
+Please report issues and request on the GitHub project from ChrisEberl (Python_DIC)
+More details regarding the project on the GitHub Wiki : https://github.com/ChrisEberl/Python_DIC/wiki
+
+Current File: Contains the prediction of the marker positions on the next correlated image and the search radius it allows
+"""
+
+import numpy as np
+
+#PARAMETERS
+PREDICTION_ORDERS = {'previous': 0, 'velocity': 1, 'acceleration': 2} #number of previous displacements extrapolated for each prediction model
+SEARCH_RADIUS_MIN = 3 #smallest adaptive search radius (pixels)
+SEARCH_RADIUS_FACTOR = 3 #the adaptive search radius is this factor times the prediction error of most markers on the previous image
+SEARCH_RADIUS_PERCENTILE = 99 #percentile of the prediction errors used for the adaptive search radius, the other markers are correlated again with the full window
+#END PARAMETERS
+
+def localNeighbors(neighbors, markerStart, markerEnd): #neighbors.csv rows of the marker range with indexes relative to the range start, -1 for missing neighbors and the ones outside the range
+
+    rows = np.atleast_2d(neighbors)[markerStart:markerEnd]
+    local = -np.ones(rows.shape, dtype=int)
+    inside = np.isfinite(rows)
+    inside[inside] = (rows[inside] >= markerStart) & (rows[inside] < markerEnd)
+    local[inside] = rows[inside].astype(int) - markerStart
+    return local
+
+def extrapolationWeights(times, time): #Lagrange weights giving the value at time of the polynomial going through the values at times
+
+    weights = np.ones(len(times))
+    for i in range(len(times)):
+        for j in range(len(times)):
+            if j != i:
+                weights[i] *= (time - times[j]) / (times[i] - times[j])
+    return weights
+
+class motionPredictor: #positions of the markers on the next correlated image, extrapolated from their previous positions and from the motion of their neighbors
+
+    def __init__(self, gridX, gridY, order, neighbors, corrsize, searchRadius=0):
+    #gridX, gridY : reference positions of the markers
+    #order : number of previous displacements extrapolated (0 : previous position)
+    #neighbors : local neighbors of each marker (see localNeighbors), lost markers follow the median displacement of their neighbors, None to disable
+    #searchRadius : fixed search radius, adapted to the prediction errors if 0
+
+        self.gridX = np.ravel(gridX).astype(np.float64)
+        self.gridY = np.ravel(gridY).astype(np.float64)
+        self.order = order
+        self.neighbors = neighbors
+        self.corrsize = corrsize
+        self.fixedRadius = searchRadius
+        self.radius = corrsize
+        if searchRadius > 0:
+            self.radius = searchRadius
+        self.history = [] #last order+1 correlated images : [image, x, y, found] with the positions without the large displacement
+        self.predicted = None
+
+    def addPositions(self, image, positionsX, positionsY, errorInfos, largeDisp):
+    #positions found on image (errorInfos from cpcorr), the adaptive search radius is updated with the error of the last prediction
+
+        positionsX = np.ravel(positionsX).astype(np.float64)
+        positionsY = np.ravel(positionsY).astype(np.float64)
+        found = np.ravel(errorInfos) == 0
+        if self.predicted is not None and self.fixedRadius <= 0 and np.any(found):
+            [predictedX, predictedY] = self.predicted
+            predictionError = np.maximum(np.absolute(positionsX - predictedX), np.absolute(positionsY - predictedY))[found]
+            radius = int(np.ceil(SEARCH_RADIUS_FACTOR * np.percentile(predictionError, SEARCH_RADIUS_PERCENTILE)))
+            self.radius = min(max(radius, SEARCH_RADIUS_MIN), self.corrsize)
+        self.predicted = None
+
+        self.history.append([image, positionsX - largeDisp[image, 0], positionsY - largeDisp[image, 1], found])
+        if len(self.history) > self.order+1:
+            del self.history[0]
+
+    def predict(self, image, pointsX, pointsY, largeDisp):
+    #pointsX, pointsY : previous positions moved by the large displacement, return them corrected by the extrapolated displacement of each marker and the search radius to use
+
+        shape = np.shape(pointsX)
+        predictedX = np.ravel(pointsX).astype(np.float64)
+        predictedY = np.ravel(pointsY).astype(np.float64)
+
+        if len(self.history) > 0:
+            #number of previous images where the marker has been found without interruption
+            nbFound = np.zeros(len(predictedX), dtype=int)
+            tracked = np.ones(len(predictedX), dtype=bool)
+            for [previousImage, previousX, previousY, found] in reversed(self.history):
+                tracked &= found
+                nbFound += tracked
+
+            #each marker is extrapolated from as many previous images as it has been found on (up to order+1)
+            [lastImage, lastX, lastY, lastFound] = self.history[-1]
+            for nbImages in range(2, len(self.history)+1):
+                markers = nbFound >= nbImages
+                if nbImages < len(self.history):
+                    markers = nbFound == nbImages
+                if not np.any(markers):
+                    continue
+                times = [previous[0] for previous in self.history[-nbImages:]]
+                weights = extrapolationWeights(times, image)
+                extrapolatedX = sum(weight*previous[1][markers] for weight, previous in zip(weights, self.history[-nbImages:]))
+                extrapolatedY = sum(weight*previous[2][markers] for weight, previous in zip(weights, self.history[-nbImages:]))
+                predictedX[markers] += extrapolatedX - lastX[markers]
+                predictedY[markers] += extrapolatedY - lastY[markers]
+
+            if self.neighbors is not None:
+                #markers found on the last images only take the median extrapolated motion of their neighbors found on all of them
+                tracked = nbFound >= len(self.history)
+                partial = np.flatnonzero((nbFound > 0) & ~tracked)
+                [partial, neighbors, isNeighbor] = self.validNeighbors(partial, tracked)
+                if len(partial) > 0:
+                    motionX = predictedX - np.ravel(pointsX)
+                    motionY = predictedY - np.ravel(pointsY)
+                    predictedX[partial] += np.nanmedian(np.where(isNeighbor, motionX[neighbors], np.nan), axis=1) - motionX[partial]
+                    predictedY[partial] += np.nanmedian(np.where(isNeighbor, motionY[neighbors], np.nan), axis=1) - motionY[partial]
+
+                #markers lost on the previous image take the median displacement predicted for their neighbors
+                [lost, neighbors, isNeighbor] = self.validNeighbors(np.flatnonzero(~lastFound), lastFound)
+                if len(lost) > 0:
+                    predictedX[lost] = self.gridX[lost] + np.nanmedian(np.where(isNeighbor, predictedX[neighbors] - self.gridX[neighbors], np.nan), axis=1)
+                    predictedY[lost] = self.gridY[lost] + np.nanmedian(np.where(isNeighbor, predictedY[neighbors] - self.gridY[neighbors], np.nan), axis=1)
+
+        self.predicted = [predictedX, predictedY]
+        return np.reshape(predictedX, shape), np.reshape(predictedY, shape), self.radius
+
+    def validNeighbors(self, markers, valid): #markers having at least one valid neighbor, their neighbors and which of them are valid
+
+        neighbors = self.neighbors[markers]
+        isNeighbor = neighbors >= 0
+        isNeighbor[isNeighbor] = valid[neighbors[isNeighbor]]
+        hasNeighbors = np.any(isNeighbor, axis=1)
+        return markers[hasNeighbors], neighbors[hasNeighbors], isNeighbor[hasNeighbors]
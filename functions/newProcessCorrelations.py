@@ -1,375 +1,554 @@
-# -*- coding: utf-8 -*-
-"""
-Created on 06/06/2016
-
-@author: Charlie Bourigault
-@contact: bourigault.charlie@gmail.com
-
-Please report issues and request on the GitHub project from ChrisEberl (Python_DIC)
-More details regarding the project on the GitHub Wiki : https://github.com/ChrisEberl/Python_DIC/wiki
-
-Current File: This file manages the complete image processing operation
-"""
-
-import numpy as np, cv2, time, os
-from functions import DIC_Global, filterFunctions, CpCorr, initData
-
-def prepareCorrelations(fileNameList, gridX, gridY, corrsize, baseMode, floatStep, parentWidget, parentWindow, largeDisp, filterInfos, thread):
-
-    startTime = time.time()
-    # getting the images filename list
-    #fileName = parentWindow.fileDataPath+'/filenamelist.dat'
-    #fileNameList = getData.testReadFile(fileName)
-
-    infosThread = thread.signal.threadSignal
-
-    infosAnalysis = []
-    isLargeDisp = 1
-    # Name
-    # Reference Mode
-    # CorrSize
-    # nbProcesses
-    # total processing time
-    # nbImages
-    # nbMarkers
-    # nbImages * nbMarkers
-    # largeDisp YES/NO
-    # User Profile
-
-    for image in range(len(fileNameList)):
-        fileNameList[image] = fileNameList[image].rstrip()
-    fileNameList = np.array(fileNameList)
-
-    activeImages = np.array(parentWidget.imageActiveList).astype(np.int)
-
-    if fileNameList is None:
-        return
-
-    if largeDisp is None:
-        largeDisp = np.zeros((len(fileNameList),2))
-        isLargeDisp = 0
-
-
-    numOfBasePoints = len(gridX)
-    numOfImages = len(fileNameList)
-
-    #parentWidget.calculationBar.changeValue(1, 'Starting Processes...')
-
-    # Adding some informations to the DevMode widget
-    parentWindow.devWindow.addInfo('Starting the correlation process with '+str(numOfBasePoints)+' markers on '+str(numOfImages)+' images.')
-    if baseMode == 0:
-        parentWindow.devWindow.addInfo('Reference Image : Previous')
-    elif baseMode == 1:
-        parentWindow.devWindow.addInfo('Reference Image : First')
-    elif baseMode == 2:
-        parentWindow.devWindow.addInfo('Reference Image : Shifted ('+str(floatStep)+')')
-
-
-    # Setting up the processes
-    PROCESSES = int(parentWindow.profileData['nbProcesses'][parentWindow.currentProfile])
-    args = []
-    nbMarkersPerProcess = numOfBasePoints/PROCESSES
-    if nbMarkersPerProcess < 2:
-        nbMarkersPerProcess = 2
-        PROCESSES = int(numOfBasePoints/2)+1
-    parentWindow.devWindow.addInfo('Number of processes used: '+str(PROCESSES))
-    for i in range(0,PROCESSES):
-        start = int(i*nbMarkersPerProcess)
-        if i >= PROCESSES-1: #last process do all the last images
-            end = numOfBasePoints
-        else:
-            end = int((i+1)*nbMarkersPerProcess)
-        args.append((fileNameList, activeImages, parentWindow.filePath, gridX[start:end], gridY[start:end], baseMode, corrsize, floatStep, largeDisp, filterInfos))
-
-    result = DIC_Global.createProcess(parentWindow, processCorrelation, args, PROCESSES, parentWidget.calculationBar, '(1/2) Processing images...')
-
-
-    parentWindow.devWindow.addInfo('Calculation finished. Saving data files.')
-
-    #neighbors calculation
-    #parentWidget.calculationBar.changeValue(1, '(2/2) Calculating neighborhood...')
-    parentWidget.calculationBar.percent = 0
-    parentWidget.calculationBar.currentTitle = '(2/2) Calculating neighborhood...'
-    activeMarkers = np.linspace(0, numOfBasePoints, num=numOfBasePoints, endpoint=False).astype(np.int)
-    minNeighbors = 16
-    initData.calculateNeighbors(activeMarkers, result[0][:,activeImages[0]], result[1][:,activeImages[0]], minNeighbors, parentWindow.fileDataPath, progressBar=parentWidget.calculationBar)
-
-    #data saving
-    parentWidget.calculationBar.percent = 0
-    parentWidget.calculationBar.currentTitle = 'Saving validx.csv...'
-    Save('validx', result[0], parentWindow.fileDataPath)
-    parentWidget.calculationBar.percent = 10
-    parentWidget.calculationBar.currentTitle = 'Saving validy.csv...'
-    Save('validy', result[1], parentWindow.fileDataPath)
-    parentWidget.calculationBar.percent = 20
-    parentWidget.calculationBar.currentTitle = 'Saving stdx.csv...'
-    Save('stdx', result[3], parentWindow.fileDataPath)
-    parentWidget.calculationBar.percent = 30
-    parentWidget.calculationBar.currentTitle = 'Saving stdy.csv...'
-    Save('stdy', result[4], parentWindow.fileDataPath)
-    parentWidget.calculationBar.percent = 40
-    parentWidget.calculationBar.currentTitle = 'Saving corrcoef.csv...'
-    Save('corrcoef', result[2], parentWindow.fileDataPath)
-    parentWidget.calculationBar.percent = 50
-    parentWidget.calculationBar.currentTitle = 'Saving dispx.csv...'
-    Save('dispx', result[5], parentWindow.fileDataPath)
-    parentWidget.calculationBar.percent = 60
-    parentWidget.calculationBar.currentTitle = 'Saving dispy.csv...'
-    Save('dispy', result[6], parentWindow.fileDataPath)
-    parentWidget.calculationBar.percent = 70
-    parentWidget.calculationBar.currentTitle = 'Saving filenamelist.csv...'
-    Save('filenamelist', fileNameList, parentWindow.fileDataPath)
-    parentWidget.calculationBar.percent = 80
-    parentWidget.calculationBar.currentTitle = 'Saving infoMarkers.csv...'
-    Save('infoMarkers', result[7].astype(int), parentWindow.fileDataPath)
-    if len(filterInfos) > 0:
-        filterFunctions.saveOpenFilter(parentWindow.fileDataPath, filterList=filterInfos)
-
-    parentWindow.devWindow.addInfo('Calculation done. Data files saved.')
-    totalTime = time.time() - startTime
-
-    infosAnalysis.append(os.path.basename(parentWindow.fileDataPath))
-    infosAnalysis.append(baseMode)
-    infosAnalysis.append(corrsize)
-    infosAnalysis.append(PROCESSES)
-    infosAnalysis.append(totalTime)
-    infosAnalysis.append(numOfImages)
-    infosAnalysis.append(numOfBasePoints)
-    infosAnalysis.append(numOfImages*numOfBasePoints)
-    infosAnalysis.append(isLargeDisp)
-    infosAnalysis.append(str(parentWindow.profileData['User'][parentWindow.currentProfile]))
-
-    parentWidget.calculationBar.percent = 90
-    parentWidget.calculationBar.currentTitle = 'Saving infoAnalysis.csv...'
-    Save('infoAnalysis', np.array(infosAnalysis), parentWindow.fileDataPath)
-    if isLargeDisp:
-        parentWidget.calculationBar.percent = 95
-        parentWidget.calculationBar.currentTitle = 'Saving largeDisp.csv...'
-        Save('largeDisp', largeDisp, parentWindow.fileDataPath)
-
-    parentWindow.devWindow.addInfo('Processing Time : '+str(totalTime))
-    infosThread.emit([1])
-    return
-
-
-def processCorrelation(fileNameList, activeImages, filePath, gridX, gridY, baseMode, corrsize, floatStep, largeDisp, filterInfos, q, pipe):
-
-
-    # Initialise variables:
-    [basePointsX, basePointsY, inputPointsX, inputPointsY] = InitFunc(gridX, gridY)
-    numOfBasePoints = len(basePointsX)
-    numOfImages = len(fileNameList)
-
-    # Creating the main matrices to register the data
-    ValidX = np.zeros((numOfBasePoints, numOfImages))
-    ValidY = np.zeros((numOfBasePoints, numOfImages))
-    CorrCoef = np.zeros((numOfBasePoints,numOfImages))
-    StdX = np.zeros((numOfBasePoints, numOfImages))
-    StdY = np.zeros((numOfBasePoints, numOfImages))
-    DispX = np.zeros((numOfBasePoints,numOfImages))
-    DispY = np.zeros((numOfBasePoints,numOfImages))
-    infoMarkers = np.zeros((numOfBasePoints,numOfImages))
-
-
-    result = np.zeros((8, numOfBasePoints, numOfImages))
-
-    refImg = 0
-    # Loading the reference image and applying filter if exist
-    while(activeImages[refImg] == 0):
-        ValidX[:,refImg] = np.nan
-        ValidY[:,refImg] = np.nan
-        DispX[:, refImg] = np.nan
-        DispY[:, refImg] = np.nan
-        CorrCoef[:,refImg] = np.nan
-        StdX[:,refImg] = np.nan
-        StdY[:,refImg] = np.nan
-        refImg += 1
-    base = cv2.imread(filePath+'/'+fileNameList[refImg], 0) # Reference image
-    #base = cv2.cvtColor(baseRaw, cv2.COLOR_BGR2GRAY)
-
-
-    #apply filter if loaded
-    base = filterFunctions.applyFilterListToImage(filterInfos, base)
-
-
-    ValidX[:,refImg]=basePointsX[:,0]
-    ValidY[:,refImg]=basePointsY[:,0]
-
-
-    previousTime = time.time()
-    # Process all images: calculate correlation between reference and current image
-    for CurrentImage in range(refImg+1, numOfImages):
-
-
-        currentProgress = CurrentImage * 100 / numOfImages
-        currentTime = time.time()
-        if currentTime > previousTime + .05:
-            previousTime = currentTime
-            pipe.send(currentProgress)
-
-        if activeImages[CurrentImage] == 1:
-
-            inputImg = cv2.imread(filePath+'/'+fileNameList[CurrentImage], 0)
-            inputImg = filterFunctions.applyFilterListToImage(filterInfos, inputImg)
-            #inputImg = cv2.cvtColor(inputRaw, cv2.COLOR_BGR2GRAY)
-
-            if baseMode == 2:
-                #Reference image is shifted from float
-                if sum(activeImages[0:CurrentImage]) > floatStep:
-                    imageSelection = 0
-                    while(activeImages[CurrentImage-floatStep-imageSelection] == 0):
-                        imageSelection += 1
-                    base = cv2.imread(filePath+'/'+fileNameList[CurrentImage-floatStep-imageSelection], 0)
-                    base = filterFunctions.applyFilterListToImage(filterInfos, base)
-                    newX = ValidX[:,CurrentImage-floatStep-imageSelection]
-                    newY = ValidY[:,CurrentImage-floatStep-imageSelection]
-                    basePointsX = np.reshape(newX, (len(newX),1))
-                    basePointsY = np.reshape(newY, (len(newY),1))
-
-
-
-            #adding large displacement
-            largeDisplacementX = largeDisp[CurrentImage, 0] - largeDisp[CurrentImage-1, 0]
-            largeDisplacementY = largeDisp[CurrentImage, 1] - largeDisp[CurrentImage-1, 1]
-
-
-            inputPointsX = inputPointsX + largeDisplacementX
-            inputPointsY = inputPointsY + largeDisplacementY
-
-
-            [inputCorrX, inputCorrY, currentStdX, currentStdY, currentCorrCoef, infosError] = CpcorrFunc(basePointsX, basePointsY, inputPointsX, inputPointsY, base, inputImg, corrsize)
-            inputPointsX = inputCorrX
-            inputPointsY = inputCorrY
-
-
-            if baseMode == 0:
-                # Reference is previous image
-                base = inputImg
-                basePointsX = inputCorrX
-                basePointsY = inputCorrY
-                #basePointsX = np.round(inputCorrX, decimals = 1)
-                #basePointsY = np.round(inputCorrY, decimals = 1)
-
-
-            [ValidXCollected,ValidYCollected,StdXCollected,StdYCollected,CorrCoefCollected] = CollectDataFunc(inputCorrX, inputCorrY, currentStdX, currentStdY, currentCorrCoef) # a column for each image
-            #[self.XSize, self.YSize] = self.input.shape
-            ValidX[:,CurrentImage] = ValidXCollected[:,0]
-            ValidY[:,CurrentImage] = ValidYCollected[:,0]
-            DispX[:, CurrentImage] = ValidX[:, CurrentImage] - ValidX[:, refImg] - largeDisp[CurrentImage, 0]
-            DispY[:, CurrentImage] = ValidY[:, CurrentImage] - ValidY[:, refImg] - largeDisp[CurrentImage, 1]
-            CorrCoef[:,CurrentImage] = CorrCoefCollected[:,0]
-            StdX[:,CurrentImage] = StdXCollected[:,0]
-            StdY[:,CurrentImage] = StdYCollected[:,0]
-            infoMarkers[:,CurrentImage] = infosError[:,0]
-
-        else: #image has been removed by the user, putting NaN values in data
-
-            ValidX[:,CurrentImage] = np.nan
-            ValidY[:,CurrentImage] = np.nan
-            DispX[:, CurrentImage] = np.nan
-            DispY[:, CurrentImage] = np.nan
-            CorrCoef[:,CurrentImage] = np.nan
-            StdX[:,CurrentImage] = np.nan
-            StdY[:,CurrentImage] = np.nan
-
-
-
-    #assembling all matrices into one 3D result matrice
-    result[0] = ValidX
-    result[1] = ValidY
-    result[2] = CorrCoef
-    result[3] = StdX
-    result[4] = StdY
-    result[5] = DispX
-    result[6] = DispY
-    result[7] = infoMarkers
-
-    q.put(result)
-    q.close()
-    return
-
-
-
-def InitFunc(GridX, GridY):
-    # Initialize variables
-    inputPointsX = np.reshape(GridX,(len(GridX),1))
-    inputPointsY = np.reshape(GridY,(len(GridY),1))
-    basePointsX = np.reshape(GridX,(len(GridX),1))
-    basePointsY = np.reshape(GridY,(len(GridY),1))
-    return basePointsX, basePointsY, inputPointsX, inputPointsY
-
-
-def CpcorrFunc(BasePointsX, BasePointsY, InputPointsX, InputPointsY, Base, Input, corrsize):
-
-    #Process all markers and images by cpcorr.m (provided by matlab image processing toolbox)
-    InputPointsX=np.array(InputPointsX)
-    InputPointsY=np.array(InputPointsY)
-    BasePointsX=np.array(BasePointsX)
-    BasePointsY=np.array(BasePointsY)
-    InputPoints = np.hstack([InputPointsX,InputPointsY])
-    BasePoints = np.hstack([BasePointsX,BasePointsY])
-    [xymoving, stdX, stdY, corrCoef, errorInfos] = CpCorr.cpcorr(InputPoints,BasePoints,Input,Base, corrsize)
-    inputCorrX = xymoving[:,0]
-    inputCorrY = xymoving[:,1]
-    inputCorrX = np.array(inputCorrX)
-    inputCorrY = np.array(inputCorrY)
-    stdX = np.array(stdX)
-    stdY = np.array(stdY)
-    inputCorrX = np.reshape(inputCorrX, (len(inputCorrX),1))
-    inputCorrY = np.reshape(inputCorrY, (len(inputCorrY),1))
-    stdX = np.reshape(stdX, (len(stdX),1))
-    stdY = np.reshape(stdY, (len(stdY),1))
-    return inputCorrX, inputCorrY, stdX, stdY, corrCoef, errorInfos
-
-def CollectDataFunc(InputCorrX,InputCorrY,StdX,StdY,CorrCoef):
-    validXCurrent = InputCorrX
-    validYCurrent = InputCorrY
-    corrCoefCurrent = CorrCoef
-    stdXCurrent = StdX
-    stdYCurrent = StdY
-    return validXCurrent, validYCurrent, stdXCurrent, stdYCurrent, corrCoefCurrent
-
-def Save(FileName, Data, filePath, extension='csv'):
-
-    np.savetxt(filePath+'/'+FileName+'.'+extension, Data, fmt="%s", delimiter=',')
-
-def shiftDetection(filePath, imageList, activeImages, area, filterList, thread):
-
-    largeDisp = np.zeros((len(imageList),2))
-
-    initImage = cv2.imread(filePath+'/'+imageList[0].rstrip(), 0) #read the full image
-    initImage = filterFunctions.applyFilterListToImage(filterList, initImage)
-    nbImages = len(imageList)
-    currentPercent = 1
-
-    activeFileList = []
-    for image in range(1, nbImages):
-        if activeImages[image] == 1:
-            activeFileList.append(image)
-
-    template = initImage[area[1]:area[3],area[0]:area[2]] #select the template data
-    width = area[2]-area[0]
-    height = area[3]-area[1]
-
-    origin = (area[0], area[1])
-    startTime = time.time()
-    for i in activeFileList:
-
-        newImage = cv2.imread(filePath+'/'+imageList[i].rstrip(),0)
-        newImage = filterFunctions.applyFilterListToImage(filterList, newImage)
-
-        matchArea = cv2.matchTemplate(newImage, template, cv2.TM_CCORR_NORMED)
-        minVal, maxVal, minLoc, maxLoc = cv2.minMaxLoc(matchArea)
-        template = newImage[maxLoc[1]:maxLoc[1]+height,maxLoc[0]:maxLoc[0]+width] #the template for the next image is update with the template found on the current picture
-
-        largeDisp[i][0] = maxLoc[0]-origin[0] #save the displacement
-        largeDisp[i][1] = maxLoc[1]-origin[1]
-
-        percent = i*100/nbImages
-        if percent > currentPercent:
-            thread.signal.threadSignal.emit([percent, i, largeDisp[i][0], largeDisp[i][1]])
-            currentPercent = percent
-
-    totalTime = time.time() - startTime
-    thread.signal.threadSignal.emit([100, nbImages, largeDisp, totalTime])
-    #print totalTime
+# -*- coding: utf-8 -*-
+"""
+Created on 06/06/2016
+
+@author: Charlie Bourigault
+@contact: bourigault.charlie@gmail.com
+
+Please report issues and request on the GitHub project from ChrisEberl (Python_DIC)
+More details regarding the project on the GitHub Wiki : https://github.com/ChrisEberl/Python_DIC/wiki
+
+Current File: This file manages the complete image processing operation
+"""
+
+import numpy as np, cv2, time, os
+from functions import processFunctions, filterFunctions, CpCorr, strainFunctions, imageCache, getData, motionPrediction
+
+#PARAMETERS
+CORR_OPTIONS = {'engine': 'loop', 'imageCache': True, 'cacheMemory': 4096, 'prefetchDepth': 2, 'prefetchMemory': 512, 'schedule': 'markers', 'exportCSV': False, 'precision': 'double', 'pyramidLevels': 0, 'prediction': 'previous', 'neighborPrediction': False, 'searchRadius': 0, 'subpixel': 'quadratic', 'referenceMemory': 1024} #default correlation options
+# engine : 'loop' (cv2.matchTemplate marker by marker), 'batch' (all markers at once with CpCorr.cpcorrBatch), 'sat' (batch with the window norms read from a summed-area table of the whole reference image, same results as 'batch' and faster on dense grids) or 'sat32' (sat with single precision subsets, about twice faster but positions changed up to the 1e-2 pixel, more for markers with two close correlation peaks)
+#   'loop' is the default and gives the positions of the previous versions, 'batch' and 'sat' compute in double precision where cv2.matchTemplate uses single precision, their positions differ from 'loop' up to a few 1e-3 pixel
+# imageCache : decode and filter each image only once in a shared memory block read by all the processes
+# cacheMemory : maximum size of the shared image cache (MB), images are read by each process when exceeded
+# prefetchDepth : number of images decoded and filtered in advance by each process while the current one is correlated (0 to disable)
+# prefetchMemory : maximum size of the prefetched images waiting in each process (MB)
+# schedule : work split between the processes, 'markers' (marker ranges), 'images' (image ranges) or 'auto' (marker x image tiles depending on the number of markers, images and processes), images are only split with the first image as reference and not by 'auto' with a prediction
+#   the markers of the image ranges after the first one are first searched on the first image of the range (see seedPositions), they are found when they moved less than (corrsize-1)*2**SEED_PYRAMID_LEVELS pixels from the translation of the whole grid region
+# exportCSV : also write the result matrices as .csv files next to the binary .npy files
+# precision : storage of the result matrices from the processes to the files, 'double', 'single' or 'compact' (see RESULT_DTYPES)
+# pyramidLevels : number of times the images are downsampled by 2 for a coarse-to-fine search of each marker (CpCorr.cpcorrPyramid), markers moving up to (corrsize-1)*2**pyramidLevels pixels between two correlated images are found (0 to disable)
+# prediction : starting position of each marker on the next image, 'previous' (last position found), 'velocity' or 'acceleration' (extrapolated from the last 2 or 3 positions found, see motionPrediction)
+# neighborPrediction : markers lost on the previous image start from the median displacement of their neighbors (grid neighbors, same as neighbors.csv)
+# searchRadius : largest displacement searched around the starting position (pixels), 0 for corrsize without prediction and a radius adapted to the prediction errors otherwise
+# subpixel : 'quadratic' (fit of the cross correlation peak) or 'icgn' (inverse compositional Gauss-Newton refinement of the subsets with a first order shape function, more accurate but slower, see CpCorr.refineICGN)
+# referenceMemory : largest size (MB) of the search window spectra kept by each process with the first image as reference (see CpCorr.correlationReference), the other reference data are always kept
+CORR_ENGINES = {'loop': CpCorr.cpcorr, 'batch': CpCorr.cpcorrBatch, 'sat': CpCorr.cpcorrSAT, 'sat32': CpCorr.cpcorrSATSingle} #correlation function of each engine
+SEARCH_RETRY_ERRORS = [5, 6, 7, 8] #error codes of the markers correlated again with the full search window when a smaller search radius is used
+MIN_TILE_MARKERS = 500 #smallest marker range given to a process by the 'auto' schedule before splitting the images as well
+MIN_TILE_IMAGES = 2 #smallest number of correlated images given to a process when the images are split
+SEED_PYRAMID_LEVELS = 4 #smallest number of pyramid levels used to find the starting positions of the image ranges after the first one
+RESULT_NAMES = ['validx', 'validy', 'corrcoef', 'stdx', 'stdy', 'dispx', 'dispy', 'infoMarkers'] #result matrices written by the processes
+RESULT_DTYPES = {'double': ['f8', 'f8', 'f8', 'f8', 'f8', 'f8', 'f8', 'u1'], 'single': ['f4', 'f4', 'f4', 'f4', 'f4', 'f4', 'f4', 'u1'], 'compact': ['f4', 'f4', 'f2', 'f2', 'f2', 'f4', 'f4', 'u1']} #dtype of each result matrice
+# double : float64 positions, displacements, correlation and std
+# single : float32 for all of them, half the memory and file size
+# compact : float32 positions and displacements, float16 correlation and std
+# the error codes of infoMarkers (0 to 8) are stored as uint8 in every mode
+#END PARAMETERS
+
+def prepareCorrelations(fileNameList, gridX, gridY, corrsize, baseMode, floatStep, parentWidget, parentWindow, largeDisp, filterInfos, thread, corrOptions=None): #interface thread, run the analysis with the profile settings and signal the end
+
+    PROCESSES = int(parentWindow.profileData['nbProcesses'][parentWindow.currentProfile])
+    userName = str(parentWindow.profileData['User'][parentWindow.currentProfile])
+    runCorrelations(parentWindow.filePath, parentWindow.fileDataPath, fileNameList, parentWidget.imageActiveList, gridX, gridY, corrsize, baseMode, floatStep, largeDisp, filterInfos, PROCESSES, userName, corrOptions=corrOptions, progressBar=parentWidget.calculationBar, addInfo=parentWindow.devWindow.addInfo)
+    thread.signal.threadSignal.emit([1])
+    return
+
+def runCorrelations(filePath, fileDataPath, fileNameList, activeImages, gridX, gridY, corrsize, baseMode, floatStep, largeDisp, filterInfos, PROCESSES, userName, corrOptions=None, progressBar=None, addInfo=print):
+#correlate the images of filePath and write all the analysis files in fileDataPath, progressBar (see processFunctions.progressObject) and addInfo (messages) are optional so it runs without interface
+
+    startTime = time.time()
+    progressBar = processFunctions.progressObject(progressBar)
+    corrOptions = getCorrOptions(corrOptions)
+
+    infosAnalysis = []
+    isLargeDisp = 1
+    # Name
+    # Reference Mode
+    # CorrSize
+    # nbProcesses
+    # total processing time
+    # nbImages
+    # nbMarkers
+    # nbImages * nbMarkers
+    # largeDisp YES/NO
+    # User Profile
+
+    if fileNameList is None:
+        return
+
+    for image in range(len(fileNameList)):
+        fileNameList[image] = fileNameList[image].rstrip()
+    fileNameList = np.array(fileNameList)
+
+    activeImages = np.array(activeImages).astype(int)
+
+    if largeDisp is None:
+        largeDisp = np.zeros((len(fileNameList),2))
+        isLargeDisp = 0
+
+
+    numOfBasePoints = len(gridX)
+    numOfImages = len(fileNameList)
+
+    # Adding some informations to the DevMode widget
+    addInfo('Starting the correlation process with '+str(numOfBasePoints)+' markers on '+str(numOfImages)+' images.')
+    if baseMode == 0:
+        addInfo('Reference Image : Previous')
+    elif baseMode == 1:
+        addInfo('Reference Image : First')
+    elif baseMode == 2:
+        addInfo('Reference Image : Shifted ('+str(floatStep)+')')
+    addInfo('Correlation engine : '+str(corrOptions['engine']))
+    if corrOptions['pyramidLevels'] > 0:
+        addInfo('Pyramid levels : '+str(corrOptions['pyramidLevels']))
+    if corrOptions['prediction'] != 'previous' or corrOptions['neighborPrediction']:
+        addInfo('Motion prediction : '+str(corrOptions['prediction'])+(' and neighbors' if corrOptions['neighborPrediction'] else ''))
+    if corrOptions['searchRadius'] > 0:
+        addInfo('Search radius : '+str(corrOptions['searchRadius']))
+    if corrOptions['subpixel'] != 'quadratic':
+        addInfo('Subpixel refinement : '+str(corrOptions['subpixel']))
+
+    neighbors = None
+    if corrOptions['neighborPrediction']: #neighbors of the grid markers, given to each process for its marker range
+        if progressBar is not None:
+            progressBar.percent = 0
+            progressBar.currentTitle = 'Calculating neighborhood...'
+        neighbors = strainFunctions.calculateNeighbors(np.arange(numOfBasePoints), np.ravel(gridX).astype(np.float64), np.ravel(gridY).astype(np.float64), 16, fileDataPath, progressBar=progressBar)
+
+
+    # Setting up the processes
+    args = []
+    nbTasks = PROCESSES
+    if PROCESSES > 1: #more tiles than processes, a process finishing early takes the next tile
+        nbTasks = PROCESSES * processFunctions.TASKS_PER_PROCESS
+    schedule = corrOptions['schedule']
+    if schedule == 'auto' and corrOptions['prediction'] != 'previous': #the extrapolation needs the previous images of each marker in the same process
+        schedule = 'markers'
+    tiles, nbMarkerChunks, nbImageChunks = scheduleCorrelations(numOfBasePoints, activeImages, baseMode, nbTasks, schedule)
+    PROCESSES = max(min(PROCESSES, len(tiles)), 1)
+    addInfo('Number of processes used: '+str(PROCESSES)+' ('+str(len(tiles))+' tasks : '+str(nbMarkerChunks)+' marker ranges x '+str(nbImageChunks)+' image ranges)')
+
+    sharedBlock, cacheInfos = None, None
+    if corrOptions['imageCache'] and PROCESSES > 1: #a single process reads each image only once anyway
+        sharedBlock, cacheInfos = prepareImageCache(fileNameList, activeImages, filePath, filterInfos, corrOptions['cacheMemory'], PROCESSES, progressBar, addInfo)
+
+    #each process writes its tile directly in the shared result matrices
+    addInfo('Result precision : '+str(corrOptions['precision']))
+    outputBlocks, results, outputInfos = [], {}, []
+    try:
+        for name, dtype in zip(RESULT_NAMES, RESULT_DTYPES[corrOptions['precision']]):
+            outputBlock, results[name], infos = processFunctions.createSharedArray((numOfBasePoints, numOfImages), dtype)
+            outputBlocks.append(outputBlock)
+            outputInfos.append(infos)
+
+        for [markerStart, markerEnd, imageStart, imageEnd] in tiles:
+            tileNeighbors = None
+            if neighbors is not None:
+                tileNeighbors = motionPrediction.localNeighbors(neighbors, markerStart, markerEnd)
+            args.append((fileNameList, activeImages, filePath, gridX[markerStart:markerEnd], gridY[markerStart:markerEnd], baseMode, corrsize, floatStep, largeDisp, filterInfos, corrOptions, outputInfos, cacheInfos, (markerStart, markerEnd), (imageStart, imageEnd), tileNeighbors))
+
+        try:
+            processFunctions.createProcess(None, processCorrelation, args, PROCESSES, progressBar, '(1/2) Processing images...', stackResults=False)
+        finally:
+            imageCache.releaseImageCache(sharedBlock)
+
+        addInfo('Calculation finished. Saving data files.')
+
+        #neighbors calculation
+        if progressBar is not None:
+            progressBar.percent = 0
+            progressBar.currentTitle = '(2/2) Calculating neighborhood...'
+        activeMarkers = np.linspace(0, numOfBasePoints, num=numOfBasePoints, endpoint=False).astype(int)
+        minNeighbors = 16
+        strainFunctions.calculateNeighbors(activeMarkers, results['validx'][:,activeImages[0]], results['validy'][:,activeImages[0]], minNeighbors, fileDataPath, progressBar=progressBar)
+
+        #data saving
+        if progressBar is not None:
+            progressBar.percent = 0
+        getData.saveResults(fileDataPath, results, exportCSV=corrOptions['exportCSV'], progressBar=progressBar)
+    finally:
+        results = None
+        for outputBlock in outputBlocks:
+            processFunctions.closeSharedArray(outputBlock, unlink=True)
+    if progressBar is not None:
+        progressBar.percent = 80
+        progressBar.currentTitle = 'Saving filenamelist.csv...'
+    Save('filenamelist', fileNameList, fileDataPath)
+    if len(filterInfos) > 0:
+        filterFunctions.saveOpenFilter(fileDataPath, filterList=filterInfos)
+
+    addInfo('Calculation done. Data files saved.')
+    totalTime = time.time() - startTime
+
+    infosAnalysis.append(os.path.basename(fileDataPath))
+    infosAnalysis.append(baseMode)
+    infosAnalysis.append(corrsize)
+    infosAnalysis.append(PROCESSES)
+    infosAnalysis.append(totalTime)
+    infosAnalysis.append(numOfImages)
+    infosAnalysis.append(numOfBasePoints)
+    infosAnalysis.append(numOfImages*numOfBasePoints)
+    infosAnalysis.append(isLargeDisp)
+    infosAnalysis.append(userName)
+
+    if progressBar is not None:
+        progressBar.percent = 90
+        progressBar.currentTitle = 'Saving infoAnalysis.csv...'
+    Save('infoAnalysis', np.array(infosAnalysis), fileDataPath)
+    if isLargeDisp:
+        if progressBar is not None:
+            progressBar.percent = 95
+            progressBar.currentTitle = 'Saving largeDisp.csv...'
+        Save('largeDisp', largeDisp, fileDataPath)
+
+    addInfo('Processing Time : '+str(totalTime))
+    return totalTime
+
+
+def processCorrelation(fileNameList, activeImages, filePath, gridX, gridY, baseMode, corrsize, floatStep, largeDisp, filterInfos, corrOptions, outputInfos, cacheInfos, markerRange, imageRange, neighbors, q, pipe):
+
+
+    # Initialise variables:
+    [basePointsX, basePointsY, inputPointsX, inputPointsY] = InitFunc(gridX, gridY)
+    [imageStart, imageEnd] = imageRange #only the images in this range are correlated (and the reference image)
+
+    # The main matrices are the rows of the markers in the shared result matrices
+    [markerStart, markerEnd] = markerRange
+    outputBlocks, output = [], []
+    for infos in outputInfos:
+        outputBlock, outputArray = processFunctions.openSharedArray(infos)
+        outputBlocks.append(outputBlock)
+        output.append(outputArray[markerStart:markerEnd])
+    outputArray = None
+    [ValidX, ValidY, CorrCoef, StdX, StdY, DispX, DispY, infoMarkers] = output
+
+    refImg = 0
+    # Loading the reference image and applying filter if exist
+    while(activeImages[refImg] == 0):
+        ValidX[:,refImg] = np.nan
+        ValidY[:,refImg] = np.nan
+        DispX[:, refImg] = np.nan
+        DispY[:, refImg] = np.nan
+        CorrCoef[:,refImg] = np.nan
+        StdX[:,refImg] = np.nan
+        StdY[:,refImg] = np.nan
+        refImg += 1
+
+    #filtered images are read from the shared cache when it exists
+    reader = imageCache.imageReader(filePath, fileNameList, filterInfos, cacheInfos)
+    base = reader.read(refImg) # Reference image
+    firstImage = max(refImg+1, imageStart)
+
+
+    ValidX[:,refImg]=basePointsX[:,0]
+    ValidY[:,refImg]=basePointsY[:,0]
+    shiftedPositions = {refImg: [basePointsX[:,0], basePointsY[:,0]]} #positions of the possible shifted references
+
+    reference = None
+    if baseMode == 1: #same base image and points for all the images, what the correlation computes from them is kept
+        reference = CpCorr.correlationReference(np.hstack([basePointsX, basePointsY]), base, corrsize, corrOptions['referenceMemory'])
+
+    if firstImage > refImg+1: #the previous images are correlated by another process, the starting positions are searched on the first image of the range
+        [inputPointsX, inputPointsY] = seedPositions(basePointsX, basePointsY, base, reader, activeImages, firstImage, imageEnd, refImg, corrsize, largeDisp, corrOptions, reference)
+    reader.prefetch([image for image in range(firstImage, imageEnd) if activeImages[image] == 1], corrOptions['prefetchDepth'], corrOptions['prefetchMemory'])
+
+    #starting positions extrapolated from the positions found on the previous images of the process
+    predictor = None
+    if corrOptions['prediction'] != 'previous' or neighbors is not None or corrOptions['searchRadius'] > 0:
+        predictor = motionPrediction.motionPredictor(basePointsX, basePointsY, motionPrediction.PREDICTION_ORDERS[corrOptions['prediction']], neighbors, corrsize, corrOptions['searchRadius'])
+        if firstImage == refImg+1:
+            predictor.addPositions(refImg, basePointsX, basePointsY, np.zeros(len(basePointsX)), largeDisp)
+
+
+    previousTime = time.time()
+    # Process all images: calculate correlation between reference and current image
+    for CurrentImage in range(firstImage, imageEnd):
+
+
+        currentProgress = (CurrentImage - firstImage) * 100 / (imageEnd - firstImage)
+        currentTime = time.time()
+        if currentTime > previousTime + .05:
+            previousTime = currentTime
+            pipe.send(currentProgress)
+
+        if activeImages[CurrentImage] == 1:
+
+            inputImg = reader.read(CurrentImage)
+
+            if baseMode == 2:
+                #Reference image is shifted from float
+                if sum(activeImages[0:CurrentImage]) > floatStep:
+                    imageSelection = 0
+                    while(activeImages[CurrentImage-floatStep-imageSelection] == 0):
+                        imageSelection += 1
+                    referenceImage = CurrentImage-floatStep-imageSelection
+                    base = reader.read(referenceImage)
+                    [newX, newY] = shiftedPositions[referenceImage] #calculated positions, the stored ones are rounded with the single precision
+                    for image in [image for image in shiftedPositions if image < referenceImage]: #never used as reference again
+                        del shiftedPositions[image]
+                    basePointsX = np.reshape(newX, (len(newX),1))
+                    basePointsY = np.reshape(newY, (len(newY),1))
+
+
+
+            #adding large displacement
+            largeDisplacementX = largeDisp[CurrentImage, 0] - largeDisp[CurrentImage-1, 0]
+            largeDisplacementY = largeDisp[CurrentImage, 1] - largeDisp[CurrentImage-1, 1]
+
+
+            inputPointsX = inputPointsX + largeDisplacementX
+            inputPointsY = inputPointsY + largeDisplacementY
+
+            searchRadius = None
+            if predictor is not None:
+                [inputPointsX, inputPointsY, searchRadius] = predictor.predict(CurrentImage, inputPointsX, inputPointsY, largeDisp)
+
+
+            [inputCorrX, inputCorrY, currentStdX, currentStdY, currentCorrCoef, infosError] = CpcorrFunc(basePointsX, basePointsY, inputPointsX, inputPointsY, base, inputImg, corrsize, engine=corrOptions['engine'], pyramidLevels=corrOptions['pyramidLevels'], searchRadius=searchRadius, subpixel=corrOptions['subpixel'], reference=reference)
+            if searchRadius is not None and searchRadius < corrsize: #markers lost with the small search window are searched again in the full one
+                retry = np.flatnonzero(np.isin(infosError[:,0], SEARCH_RETRY_ERRORS))
+                if len(retry) > 0:
+                    retryReference = None
+                    if reference is not None:
+                        retryReference = reference[retry]
+                    retried = CpcorrFunc(basePointsX[retry], basePointsY[retry], inputPointsX[retry], inputPointsY[retry], base, inputImg, corrsize, engine=corrOptions['engine'], pyramidLevels=corrOptions['pyramidLevels'], subpixel=corrOptions['subpixel'], reference=retryReference)
+                    for result, retriedResult in zip([inputCorrX, inputCorrY, currentStdX, currentStdY, currentCorrCoef, infosError], retried):
+                        result[retry] = retriedResult
+            if predictor is not None:
+                predictor.addPositions(CurrentImage, inputCorrX, inputCorrY, infosError, largeDisp)
+            inputPointsX = inputCorrX
+            inputPointsY = inputCorrY
+
+
+            if baseMode == 0:
+                # Reference is previous image
+                base = inputImg
+                basePointsX = inputCorrX
+                basePointsY = inputCorrY
+                #basePointsX = np.round(inputCorrX, decimals = 1)
+                #basePointsY = np.round(inputCorrY, decimals = 1)
+
+
+            [ValidXCollected,ValidYCollected,StdXCollected,StdYCollected,CorrCoefCollected] = CollectDataFunc(inputCorrX, inputCorrY, currentStdX, currentStdY, currentCorrCoef) # a column for each image
+            #[self.XSize, self.YSize] = self.input.shape
+            ValidX[:,CurrentImage] = ValidXCollected[:,0]
+            ValidY[:,CurrentImage] = ValidYCollected[:,0]
+            DispX[:, CurrentImage] = ValidXCollected[:,0] - ValidX[:, refImg] - largeDisp[CurrentImage, 0] #from the calculated position, not the stored one (rounded with the single precision)
+            DispY[:, CurrentImage] = ValidYCollected[:,0] - ValidY[:, refImg] - largeDisp[CurrentImage, 1]
+            CorrCoef[:,CurrentImage] = CorrCoefCollected[:,0]
+            StdX[:,CurrentImage] = StdXCollected[:,0]
+            StdY[:,CurrentImage] = StdYCollected[:,0]
+            infoMarkers[:,CurrentImage] = infosError[:,0]
+            if baseMode == 2:
+                shiftedPositions[CurrentImage] = [ValidXCollected[:,0], ValidYCollected[:,0]]
+
+        else: #image has been removed by the user, putting NaN values in data
+
+            ValidX[:,CurrentImage] = np.nan
+            ValidY[:,CurrentImage] = np.nan
+            DispX[:, CurrentImage] = np.nan
+            DispY[:, CurrentImage] = np.nan
+            CorrCoef[:,CurrentImage] = np.nan
+            StdX[:,CurrentImage] = np.nan
+            StdY[:,CurrentImage] = np.nan
+
+
+
+    base, inputImg, reference = None, None, None
+    reader.close()
+
+    #the views of the shared result matrices are released before closing them
+    output = ValidX = ValidY = CorrCoef = StdX = StdY = DispX = DispY = infoMarkers = None
+    basePointsX = basePointsY = newX = newY = None
+    for outputBlock in outputBlocks:
+        processFunctions.closeSharedArray(outputBlock)
+    return
+
+
+
+def seedPositions(basePointsX, basePointsY, base, reader, activeImages, firstImage, imageEnd, refImg, corrsize, largeDisp, corrOptions, reference=None):
+#starting positions of an image range correlated without the previous images (first image as reference), the markers are searched on the first active image of the range with at least SEED_PYRAMID_LEVELS pyramid levels from the grid moved by the translation of the grid region (see regionShift)
+#the markers not found start from the median displacement of the found ones, the positions are given before the large displacement of the first image is added
+
+    inputPointsX = basePointsX + largeDisp[firstImage-1, 0] - largeDisp[refImg, 0]
+    inputPointsY = basePointsY + largeDisp[firstImage-1, 1] - largeDisp[refImg, 1]
+    rangeImages = [image for image in range(firstImage, imageEnd) if activeImages[image] == 1]
+    if len(rangeImages) < 1:
+        return inputPointsX, inputPointsY
+    seedImage = rangeImages[0]
+    largeDisplacementX = largeDisp[seedImage, 0] - largeDisp[seedImage-1, 0]
+    largeDisplacementY = largeDisp[seedImage, 1] - largeDisp[seedImage-1, 1]
+
+    inputImg = reader.read(seedImage)
+    startShift = regionShift(basePointsX, basePointsY, base, inputImg, corrsize, largeDisp[seedImage] - largeDisp[refImg])
+    levels = max(corrOptions['pyramidLevels'], SEED_PYRAMID_LEVELS)
+    startPoints = np.hstack([basePointsX + startShift[0], basePointsY + startShift[1]])
+    [xymoving, stdX, stdY, corrCoef, errorInfos] = CpCorr.cpcorrPyramid(startPoints, np.hstack([basePointsX, basePointsY]), inputImg, base, corrsize, levels, CORR_ENGINES[corrOptions['engine']], reference=reference)
+    found = errorInfos[:,0] == 0
+    if np.any(found):
+        xymoving[~found] = startPoints[~found] + np.median(xymoving[found] - startPoints[found], axis=0)
+    else:
+        xymoving = startPoints
+
+    inputPointsX = np.reshape(xymoving[:,0] - largeDisplacementX, (len(xymoving),1))
+    inputPointsY = np.reshape(xymoving[:,1] - largeDisplacementY, (len(xymoving),1))
+    return inputPointsX, inputPointsY
+
+def regionShift(basePointsX, basePointsY, base, inputImg, corrsize, largeShift): #translation of the region of the base points from base to inputImg (phase correlation of the region moved by the rounded large displacement), largeShift if the region is outside inputImg
+
+    largeShift = np.round(np.asarray(largeShift, dtype=np.float64)).astype(int)
+    left = max(int(np.floor(np.nanmin(basePointsX))) - corrsize, 0, -largeShift[0])
+    upper = max(int(np.floor(np.nanmin(basePointsY))) - corrsize, 0, -largeShift[1])
+    right = min(int(np.ceil(np.nanmax(basePointsX))) + corrsize + 1, base.shape[1], inputImg.shape[1] - largeShift[0])
+    lower = min(int(np.ceil(np.nanmax(basePointsY))) + corrsize + 1, base.shape[0], inputImg.shape[0] - largeShift[1])
+    if right - left < 2*corrsize or lower - upper < 2*corrsize:
+        return largeShift.astype(np.float64)
+
+    baseRegion = base[upper:lower, left:right].astype(np.float32)
+    inputRegion = inputImg[upper+largeShift[1]:lower+largeShift[1], left+largeShift[0]:right+largeShift[0]].astype(np.float32)
+    [shift, response] = cv2.phaseCorrelate(baseRegion, inputRegion, cv2.createHanningWindow((right-left, lower-upper), cv2.CV_32F))
+    return largeShift + np.array(shift)
+
+def scheduleCorrelations(numOfBasePoints, activeImages, baseMode, PROCESSES, schedule): #split the markers x images work in PROCESSES tasks, return the [markerStart, markerEnd, imageStart, imageEnd] tiles
+
+    correlatedImages = np.flatnonzero(activeImages)[1:] #the first active image is the reference
+    numOfImages = len(activeImages)
+
+    nbMarkerChunks = PROCESSES
+    nbImageChunks = 1
+    if baseMode == 1 and schedule != 'markers': #images are independent only when they are all correlated with the first one
+        if schedule == 'images':
+            nbMarkerChunks = 1
+        else:
+            nbMarkerChunks = max(min(PROCESSES, numOfBasePoints // MIN_TILE_MARKERS), 1)
+        nbImageChunks = max(min(PROCESSES // nbMarkerChunks, len(correlatedImages) // MIN_TILE_IMAGES), 1)
+    nbMarkerChunks = max(min(nbMarkerChunks, numOfBasePoints // 2), 1) #at least 2 markers per process
+
+    markerLimits = np.linspace(0, numOfBasePoints, nbMarkerChunks+1).astype(int)
+    imageLimits = [0, numOfImages]
+    if nbImageChunks > 1: #same number of correlated images in each range
+        imageLimits = [0] + [images[0] for images in np.array_split(correlatedImages, nbImageChunks)[1:]] + [numOfImages]
+
+    tiles = []
+    for markerChunk in range(nbMarkerChunks):
+        for imageChunk in range(nbImageChunks):
+            tiles.append([markerLimits[markerChunk], markerLimits[markerChunk+1], imageLimits[imageChunk], imageLimits[imageChunk+1]])
+    return tiles, nbMarkerChunks, nbImageChunks
+
+def prepareImageCache(fileNameList, activeImages, filePath, filterInfos, maxMemory, PROCESSES, progressBar, addInfo=print): #decode and filter every active image once into a shared memory block
+
+    sharedBlock, cacheInfos = imageCache.createImageCache(filePath, fileNameList, activeImages, filterInfos, maxMemory)
+    if sharedBlock is None:
+        addInfo('Images too large for the shared cache ('+str(maxMemory)+' MB or the free shared memory). Images are read by each process.')
+        return None, None
+
+    toLoad = np.flatnonzero(activeImages)[1:] #the first active image is loaded during the cache creation
+    nbLoaders = max(min(PROCESSES, len(toLoad)), 1)
+    args = []
+    for i in range(nbLoaders):
+        args.append((cacheInfos, filePath, fileNameList, toLoad[i::nbLoaders], filterInfos))
+    try:
+        notCached = processFunctions.createProcess(None, imageCache.fillImageCache, args, nbLoaders, progressBar, 'Loading images...')
+    except:
+        imageCache.releaseImageCache(sharedBlock)
+        raise
+    if notCached is not None and notCached.size > 0: #read by each process from the disk
+        cacheInfos['slots'][np.ravel(notCached)] = -1
+        addInfo(str(notCached.size)+' images could not be cached (missing, unreadable or of another size). They are read by each process.')
+    addInfo('Images loaded in the shared cache.')
+    return sharedBlock, cacheInfos
+
+def InitFunc(GridX, GridY):
+    # Initialize variables
+    inputPointsX = np.reshape(GridX,(len(GridX),1))
+    inputPointsY = np.reshape(GridY,(len(GridY),1))
+    basePointsX = np.reshape(GridX,(len(GridX),1))
+    basePointsY = np.reshape(GridY,(len(GridY),1))
+    return basePointsX, basePointsY, inputPointsX, inputPointsY
+
+
+def getCorrOptions(corrOptions=None): #complete the given correlation options with the default ones
+
+    options = dict(CORR_OPTIONS)
+    if corrOptions is not None:
+        options.update(corrOptions)
+    return options
+
+def CpcorrFunc(BasePointsX, BasePointsY, InputPointsX, InputPointsY, Base, Input, corrsize, engine=CORR_OPTIONS['engine'], pyramidLevels=CORR_OPTIONS['pyramidLevels'], searchRadius=None, subpixel=CORR_OPTIONS['subpixel'], reference=None):
+
+    #Process all markers and images by cpcorr.m (provided by matlab image processing toolbox)
+    InputPointsX=np.array(InputPointsX)
+    InputPointsY=np.array(InputPointsY)
+    BasePointsX=np.array(BasePointsX)
+    BasePointsY=np.array(BasePointsY)
+    InputPoints = np.hstack([InputPointsX,InputPointsY])
+    BasePoints = np.hstack([BasePointsX,BasePointsY])
+    correlate = CORR_ENGINES[engine]
+    if pyramidLevels > 0:
+        [xymoving, stdX, stdY, corrCoef, errorInfos] = CpCorr.cpcorrPyramid(InputPoints,BasePoints,Input,Base, corrsize, pyramidLevels, correlate, searchRadius=searchRadius, subpixelMethod=subpixel, reference=reference)
+    else:
+        [xymoving, stdX, stdY, corrCoef, errorInfos] = correlate(InputPoints,BasePoints,Input,Base, corrsize, searchRadius=searchRadius, subpixelMethod=subpixel, reference=reference)
+    inputCorrX = xymoving[:,0]
+    inputCorrY = xymoving[:,1]
+    inputCorrX = np.array(inputCorrX)
+    inputCorrY = np.array(inputCorrY)
+    stdX = np.array(stdX)
+    stdY = np.array(stdY)
+    inputCorrX = np.reshape(inputCorrX, (len(inputCorrX),1))
+    inputCorrY = np.reshape(inputCorrY, (len(inputCorrY),1))
+    stdX = np.reshape(stdX, (len(stdX),1))
+    stdY = np.reshape(stdY, (len(stdY),1))
+    return inputCorrX, inputCorrY, stdX, stdY, corrCoef, errorInfos
+
+def CollectDataFunc(InputCorrX,InputCorrY,StdX,StdY,CorrCoef):
+    validXCurrent = InputCorrX
+    validYCurrent = InputCorrY
+    corrCoefCurrent = CorrCoef
+    stdXCurrent = StdX
+    stdYCurrent = StdY
+    return validXCurrent, validYCurrent, stdXCurrent, stdYCurrent, corrCoefCurrent
+
+def Save(FileName, Data, filePath, extension='csv'):
+
+    np.savetxt(filePath+'/'+FileName+'.'+extension, Data, fmt="%s", delimiter=',')
+
+def shiftDetection(filePath, imageList, activeImages, area, filterList, thread):
+
+    largeDisp = np.zeros((len(imageList),2))
+
+    initImage = cv2.imread(filePath+'/'+imageList[0].rstrip(), 0) #read the full image
+    initImage = filterFunctions.applyFilterListToImage(filterList, initImage)
+    nbImages = len(imageList)
+    currentPercent = 1
+
+    activeFileList = []
+    for image in range(1, nbImages):
+        if activeImages[image] == 1:
+            activeFileList.append(image)
+
+    template = initImage[area[1]:area[3],area[0]:area[2]] #select the template data
+    width = area[2]-area[0]
+    height = area[3]-area[1]
+
+    origin = (area[0], area[1])
+    startTime = time.time()
+    for i in activeFileList:
+
+        newImage = cv2.imread(filePath+'/'+imageList[i].rstrip(),0)
+        newImage = filterFunctions.applyFilterListToImage(filterList, newImage)
+
+        matchArea = cv2.matchTemplate(newImage, template, cv2.TM_CCORR_NORMED)
+        minVal, maxVal, minLoc, maxLoc = cv2.minMaxLoc(matchArea)
+        template = newImage[maxLoc[1]:maxLoc[1]+height,maxLoc[0]:maxLoc[0]+width] #the template for the next image is update with the template found on the current picture
+
+        largeDisp[i][0] = maxLoc[0]-origin[0] #save the displacement
+        largeDisp[i][1] = maxLoc[1]-origin[1]
+
+        percent = i*100/nbImages
+        if percent > currentPercent:
+            thread.signal.threadSignal.emit([percent, i, largeDisp[i][0], largeDisp[i][1]])
+            currentPercent = percent
+
+    totalTime = time.time() - startTime
+    thread.signal.threadSignal.emit([100, nbImages, largeDisp, totalTime])
+    #print totalTime
@@ -0,0 +1,275 @@
+# -*- coding: utf-8 -*-
+"""
+Please report issues and request on the GitHub project from ChrisEberl (Python_DIC)
+More details regarding the project on the GitHub Wiki : https://github.com/ChrisEberl/Python_DIC/wiki
+
+Current File: Contains the pool of processes running the calculations and the progress objects (no interface dependency, imported by the processes)
+"""
+
+import time, multiprocessing, threading, queue, traceback, numpy as np
+from multiprocessing import shared_memory, resource_tracker
+
+#PARAMETERS
+TASKS_PER_PROCESS = 4 #the calculations are split in more tasks than processes, a process finishing early takes the next task
+POOL_WAIT = .1 #seconds between two checks of the processes when no event arrives
+POOL_STOP_TIMEOUT = 5 #seconds given to the surplus processes to stop when the pool is reduced before they are terminated
+#END PARAMETERS
+
+currentPool = None #pool of the application, started by the first calculation
+
+class progressCallback: #progress object calling function(title, percent) at each new title or percent, same percent and currentTitle attributes as the interface progress bars
+
+    def __init__(self, function):
+
+        self.function = function
+        self.title = ''
+        self.value = 0
+
+    @property
+    def currentTitle(self):
+
+        return self.title
+
+    @currentTitle.setter
+    def currentTitle(self, title):
+
+        self.title = title
+        self.function(self.title, self.value)
+
+    @property
+    def percent(self):
+
+        return self.value
+
+    @percent.setter
+    def percent(self, value):
+
+        if value != self.value:
+            self.value = value
+            self.function(self.title, self.value)
+
+def progressObject(progress): #progress given to the calculation functions : None, an object with percent and currentTitle attributes, a queue receiving (title, percent) or a function(title, percent)
+
+    if progress is None or hasattr(progress, 'percent'):
+        return progress
+    if hasattr(progress, 'put'):
+        return progressCallback(lambda title, percent: progress.put((title, percent)))
+    return progressCallback(progress)
+
+def createProcess(self, function, args, PROCESSES, progressBar=None, textBar=None, stackResults=True): # execute function with each element of args in the pool (PROCESSES processes), write progressBar if given (with textBar, see progressObject), return the list of results instead of stacking them if stackResults is False
+
+    results = getPool(PROCESSES).run(function, args, progressObject(progressBar), textBar)
+    if not stackResults:
+        return results
+    if any(result is None for result in results):
+        return None
+    return np.hstack(results)
+
+def getPool(PROCESSES): #return the pool of the application with PROCESSES processes
+
+    global currentPool
+    if currentPool is None:
+        currentPool = workerPool()
+    currentPool.resize(PROCESSES)
+    return currentPool
+
+def closePool(): #stop the processes of the pool (when the application is closed)
+
+    global currentPool
+    if currentPool is not None:
+        currentPool.close()
+        currentPool = None
+
+def poolWorker(tasks, events): #process of the pool, run the tasks until None is received
+
+    while True:
+        task = tasks.get()
+        if task is None:
+            break
+        [job, taskNb, function, args] = task
+        try:
+            function(*args, taskQueue(events, job, taskNb), taskPipe(events, job, taskNb))
+            events.put((job, taskNb, 'done', None))
+        except Exception:
+            events.put((job, taskNb, 'error', traceback.format_exc()))
+
+class taskPipe: #given to the task function as pipe, the progress (percent) of the task is sent as an event
+
+    def __init__(self, events, job, taskNb):
+
+        self.events = events
+        self.job = job
+        self.taskNb = taskNb
+
+    def send(self, percent):
+
+        self.events.put((self.job, self.taskNb, 'progress', percent))
+
+class taskQueue: #given to the task function as q, the result array is written in a shared memory block and only the block name is sent
+
+    def __init__(self, events, job, taskNb):
+
+        self.events = events
+        self.job = job
+        self.taskNb = taskNb
+
+    def put(self, result):
+
+        result = np.ascontiguousarray(result)
+        block = shared_memory.SharedMemory(create=True, size=max(result.nbytes, 1))
+        blockArray = np.ndarray(result.shape, dtype=result.dtype, buffer=block.buf)
+        blockArray[...] = result
+        del blockArray
+        block.close()
+        self.events.put((self.job, self.taskNb, 'result', (block.name, result.shape, result.dtype.str)))
+
+    def close(self):
+
+        pass
+
+def createSharedArray(shape, dtype=np.float64): #allocate an array in a shared memory block written directly by the processes, return the block, the array and the informations given to the processes
+
+    dtype = np.dtype(dtype)
+    block = shared_memory.SharedMemory(create=True, size=max(int(np.prod(shape))*dtype.itemsize, 1)) #filled with zeros
+    array = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+    return block, array, {'name': block.name, 'shape': tuple(shape), 'dtype': dtype.str}
+
+def openSharedArray(arrayInfos): #array of a shared memory block created by createSharedArray, in a process
+
+    block = shared_memory.SharedMemory(name=arrayInfos['name'])
+    return block, np.ndarray(arrayInfos['shape'], dtype=np.dtype(arrayInfos['dtype']), buffer=block.buf)
+
+def closeSharedArray(block, unlink=False): #close the block once its arrays are deleted, unlink frees it (creator only)
+
+    try:
+        block.close()
+    except BufferError: #arrays still referenced, the mapping is released with them
+        pass
+    if unlink:
+        block.unlink()
+
+def readResult(resultInfos): #copy a task result out of its shared memory block and free the block
+
+    [name, shape, dtype] = resultInfos
+    block = shared_memory.SharedMemory(name=name)
+    result = np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf).copy()
+    block.close()
+    block.unlink()
+    return result
+
+class workerPool: #long-lived processes running the tasks of all the calculations, each task is taken from a common queue by the first idle process
+
+    def __init__(self):
+
+        self.tasks = multiprocessing.Queue()
+        self.events = multiprocessing.Queue()
+        self.workers = []
+        self.job = 0
+        self.lock = threading.RLock() #one calculation at a time, the interface threads can share the pool
+        resource_tracker.ensure_running() #the processes share it, the result blocks they create are freed here
+
+    def resize(self, nbWorkers): #replace the stopped processes, then start new ones or stop the surplus ones until nbWorkers are running
+
+        nbWorkers = max(nbWorkers, 1)
+        with self.lock: #no task is waiting between two calculations, the surplus processes are idle and each takes one stop signal
+            self.workers = [worker for worker in self.workers if worker.is_alive()]
+            for stopped in range(len(self.workers) - nbWorkers):
+                self.tasks.put(None)
+            stopTime = time.time()
+            while len(self.workers) > nbWorkers:
+                if time.time() > stopTime + POOL_STOP_TIMEOUT: #processes that did not stop in time, all the processes are restarted with new queues as in cancel
+                    for worker in self.workers:
+                        worker.terminate()
+                        worker.join()
+                    self.workers = []
+                    self.tasks = multiprocessing.Queue()
+                    self.events = multiprocessing.Queue()
+                    break
+                time.sleep(POOL_WAIT)
+                self.workers = [worker for worker in self.workers if worker.is_alive()]
+            while len(self.workers) < nbWorkers:
+                worker = multiprocessing.Process(target=poolWorker, args=(self.tasks, self.events), daemon=True)
+                worker.start()
+                self.workers.append(worker)
+
+    def run(self, function, args, progressBar=None, textBar=None): #run function(*args[i], q, pipe) for each element of args, return the list of the results put in q (None if nothing put)
+
+        with self.lock:
+            self.job += 1
+            nbTasks = len(args)
+            for taskNb in range(nbTasks):
+                self.tasks.put((self.job, taskNb, function, args[taskNb]))
+
+            results = [None] * nbTasks
+            progress = np.zeros(nbTasks)
+            lastPercent = 0
+            remaining = nbTasks
+            if progressBar is not None:
+                progressBar.currentTitle = textBar
+            lastCheck = time.time()
+            try:
+                while remaining > 0:
+                    try:
+                        [job, taskNb, kind, value] = self.events.get(timeout=POOL_WAIT)
+                    except queue.Empty:
+                        job, kind = None, None
+                    if time.time() > lastCheck + POOL_WAIT:
+                        lastCheck = time.time()
+                        if any(not worker.is_alive() for worker in self.workers):
+                            raise RuntimeError('A calculation process stopped unexpectedly.')
+                    if job != self.job: #no event or event of a stopped calculation
+                        if kind == 'result':
+                            readResult(value)
+                        continue
+                    if kind == 'progress':
+                        progress[taskNb] = max(progress[taskNb], value)
+                    elif kind == 'result':
+                        results[taskNb] = readResult(value)
+                    elif kind == 'done':
+                        progress[taskNb] = 100
+                        remaining -= 1
+                    elif kind == 'error':
+                        raise RuntimeError('Error in a calculation process:\n'+value)
+                    total = progress.sum() / nbTasks
+                    if progressBar is not None and total != lastPercent:
+                        progressBar.percent = total
+                        lastPercent = total
+            except BaseException:
+                self.cancel()
+                raise
+            return results
+
+    def cancel(self): #remove the waiting tasks and restart the stopped processes, events of the running tasks are ignored
+
+        nbWorkers = len(self.workers)
+        if all(worker.is_alive() for worker in self.workers):
+            try:
+                while True:
+                    self.tasks.get(timeout=POOL_WAIT)
+            except queue.Empty:
+                pass
+        else: #a process stopped during a task and may have left the queues locked, all the processes are restarted with new queues
+            for worker in self.workers:
+                worker.terminate()
+                worker.join()
+            self.workers = []
+            self.tasks = multiprocessing.Queue()
+            self.events = multiprocessing.Queue()
+        self.resize(nbWorkers)
+
+    def close(self):
+
+        for worker in self.workers:
+            self.tasks.put(None)
+        for worker in self.workers:
+            worker.join(timeout=1)
+            if worker.is_alive():
+                worker.terminate()
+        self.workers = []
+        try: #results of cancelled tasks
+            while True:
+                [job, taskNb, kind, value] = self.events.get(timeout=POOL_WAIT)
+                if kind == 'result':
+                    readResult(value)
+        except queue.Empty:
+            pass
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""
+Please report issues and request on the GitHub project from ChrisEberl (Python_DIC)
+More details regarding the project on the GitHub Wiki : https://github.com/ChrisEberl/Python_DIC/wiki
+
+Current File: Contains the relative displacements of the markers to their neighbors used by the relative neighbors mask procedure (no interface dependency)
+"""
+
+import numpy as np, time, warnings
+from functions import strainFunctions
+
+def activeMatrix(nbMarkers, activeImages, activeMarkers): #boolean markers x active images matrix of the active markers
+
+    if isinstance(activeMarkers, strainFunctions.markerActivity):
+        return activeMarkers.matrix[:, activeImages]
+    isActive = np.zeros((nbMarkers, len(np.atleast_1d(activeImages))), dtype=bool)
+    for imageNb in range(len(np.atleast_1d(activeImages))):
+        isActive[np.atleast_1d(activeMarkers[activeImages[imageNb]]).astype(int), imageNb] = True
+    return isActive
+
+def packInstances(relativeDisp, isActive, activeInstances, gridInstances): #relative displacements of the markers of each instance active on each image, in increasing order
+
+    nbInstances = len(np.atleast_1d(activeInstances))
+    nbActiveImages = isActive.shape[1]
+    maxMarkersPerInstance = 0
+    for instance in range(nbInstances):
+        nbMarkersInInstance = len(np.atleast_1d(gridInstances[activeInstances[instance]]))
+        if nbMarkersInInstance > maxMarkersPerInstance:
+            maxMarkersPerInstance = nbMarkersInInstance
+
+    relativeDispX = np.zeros((nbInstances, maxMarkersPerInstance, nbActiveImages))
+    relativeDispY = np.zeros((nbInstances, maxMarkersPerInstance, nbActiveImages))
+    imageMatrix = np.ones((maxMarkersPerInstance, nbActiveImages))
+    for instance in range(nbInstances):
+        sortedMarkers = np.unique(np.atleast_1d(gridInstances[activeInstances[instance]]).astype(int))
+        for imageNb in range(nbActiveImages):
+            instanceMarkers = sortedMarkers[isActive[sortedMarkers, imageNb]]
+            relativeDispX[instance, :len(instanceMarkers), imageNb] = relativeDisp[0][instanceMarkers, imageNb]
+            relativeDispY[instance, :len(instanceMarkers), imageNb] = relativeDisp[1][instanceMarkers, imageNb]
+    for imageNb in range(nbActiveImages):
+        imageMatrix[:,imageNb] = imageNb*imageMatrix[:,imageNb]
+
+    return imageMatrix, relativeDispX, relativeDispY
+
+def unpackInstances(relativeX, relativeY, isActive, activeInstances, gridInstances): #markers x active images relative displacements from the instance matrices (inverse of packInstances)
+
+    relativeDisp = np.zeros((2,)+isActive.shape)
+    for instance in range(len(np.atleast_1d(activeInstances))):
+        sortedMarkers = np.unique(np.atleast_1d(gridInstances[activeInstances[instance]]).astype(int))
+        for imageNb in range(isActive.shape[1]):
+            instanceMarkers = sortedMarkers[isActive[sortedMarkers, imageNb]]
+            relativeDisp[0][instanceMarkers, imageNb] = relativeX[instance, :len(instanceMarkers), imageNb]
+            relativeDisp[1][instanceMarkers, imageNb] = relativeY[instance, :len(instanceMarkers), imageNb]
+    return relativeDisp
+
+def neighborMatrix(neighbors): #return the neighbors of each marker as an index matrix padded with 0 and the mask of the real neighbors
+
+    neighbors = np.atleast_2d(neighbors)
+    isNeighbor = np.isfinite(neighbors)
+    neighborIndexes = np.where(isNeighbor, neighbors, 0).astype(int)
+    return neighborIndexes, isNeighbor
+
+def relativeDisplacement(disp_x_image, disp_y_image, isActive, neighborIndexes, isNeighbor, markers=None): #displacement of all the markers (or only markers) relative to the median of their active neighbors on one image (0 without active neighbor)
+
+    if markers is not None:
+        neighborIndexes = neighborIndexes[markers]
+        isNeighbor = isNeighbor[markers]
+    activeNeighbors = isNeighbor & isActive[neighborIndexes]
+    hasNeighbors = np.any(activeNeighbors, axis=1)
+    relative = []
+    for disp in [disp_x_image, disp_y_image]:
+        neighborsDisp = disp[neighborIndexes]
+        hasNan = np.any(activeNeighbors & np.isnan(neighborsDisp), axis=1) #the median of a neighborhood with a nan is nan
+        with warnings.catch_warnings(): #markers without active neighbor give an empty slice
+            warnings.simplefilter('ignore', RuntimeWarning)
+            median = np.nanmedian(np.where(activeNeighbors, neighborsDisp, np.nan), axis=1)
+        median[hasNan] = np.nan
+        if markers is not None:
+            disp = disp[markers]
+        relative.append(np.where(hasNeighbors, disp - median, 0))
+    return relative[0], relative[1]
+
+def outsiders(relativeDisp, isActive, inInstances, sliceImages, topLimit, bottomLimit, directions): #markers of the instances active on sliceImages (active image numbers) whose relative displacement along one of the directions (0 for x, 1 for y) leaves the [bottomLimit, topLimit] band
+
+    candidates = isActive[:, sliceImages] & inInstances[:, np.newaxis]
+    toDelete = np.zeros(isActive.shape[0], dtype=bool)
+    for direction in directions:
+        disp = relativeDisp[direction][:, sliceImages]
+        toDelete |= np.any(candidates & ((disp > topLimit) | (disp < bottomLimit)), axis=1)
+    return toDelete
+
+def deleteMarkers(disp_x, disp_y, activeImages, isActive, relativeDisp, neighborIndexes, isNeighbor, toDelete): #deactivate the toDelete markers on all the active images, only the relative displacements of the markers whose neighborhood lost a marker are calculated again (isActive and relativeDisp are updated)
+
+    isActive[toDelete, :] = False
+    toUpdate = np.flatnonzero(np.any(isNeighbor & toDelete[neighborIndexes], axis=1))
+    for imageNb in range(len(np.atleast_1d(activeImages))):
+        image = activeImages[imageNb]
+        relativeDisp[0][toUpdate, imageNb], relativeDisp[1][toUpdate, imageNb] = relativeDisplacement(disp_x[:, image], disp_y[:, image], isActive[:, imageNb], neighborIndexes, isNeighbor, markers=toUpdate)
+    return toUpdate
+
+def relativeImages(disp_x, disp_y, isActive, neighborIndexes, isNeighbor, q=None, pipe=None): #relative displacements of the images given (columns), process function
+
+    nbImages = disp_x.shape[1]
+    result = np.zeros((2, disp_x.shape[0], nbImages))
+    previousTime = time.time()
+    for image in range(nbImages):
+        result[0, :, image], result[1, :, image] = relativeDisplacement(disp_x[:, image], disp_y[:, image], isActive[:, image], neighborIndexes, isNeighbor)
+        currentTime = time.time()
+        if pipe is not None and currentTime > previousTime + .05:
+            previousTime = currentTime
+            pipe.send(image * 100 / nbImages)
+
+    if q is not None:
+        q.put(result)
+        q.close()
+    else:
+        return result
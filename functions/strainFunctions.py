@@ -0,0 +1,354 @@
+# -*- coding: utf-8 -*-
+"""
+Please report issues and request on the GitHub project from ChrisEberl (Python_DIC)
+More details regarding the project on the GitHub Wiki : https://github.com/ChrisEberl/Python_DIC/wiki
+
+Current File: Contains the marker neighbors, strain and interpolated fields calculations (no interface dependency)
+"""
+
+import numpy as np, scipy, scipy.spatial, scipy.interpolate, time
+from functions import processFunctions, getData, fieldCache
+
+#PARAMETERS
+COORDINATES_RESOLUTION = 100 #default number of points of the interpolated fields (correlation 2D, local strain) along x and y
+#END PARAMETERS
+
+def activeGrid(gridInstances, activeInstances, activeMarkers, referenceImage): #keep the markers of each instance active on the reference image, remove the instances without active marker
+
+    for instance in activeInstances:
+        instanceMarkers = np.unique(np.atleast_1d(gridInstances[instance]).astype(int))
+        gridInstances[instance] = instanceMarkers[activeMarkers.matrix[instanceMarkers, referenceImage]]
+        nbMarkersInInstance = len(np.atleast_1d(gridInstances[instance]))
+        if nbMarkersInInstance < 1:
+            activeInstances = np.setdiff1d(activeInstances, instance, assume_unique=True)
+    activeMarkers.setInstances(gridInstances)
+    return gridInstances, activeInstances
+
+def instancesStrain(data_x, data_y, disp_x, disp_y, activeMarkers, activeImages, activeInstances): #1D strain (slope and intersect of the displacement fit) of each instance on each active image and the position limits of the active markers
+
+    nbActiveImages = len(np.atleast_1d(activeImages))
+    nbInstances = len(np.atleast_1d(activeInstances))
+    data_x_init = data_x[:, activeImages[0]]
+    data_y_init = data_y[:, activeImages[0]]
+    StrainX = np.zeros((nbActiveImages,nbInstances))
+    StrainY = np.zeros((nbActiveImages,nbInstances))
+    localStrainIntersectX = np.zeros((nbActiveImages,nbInstances))
+    localStrainIntersectY = np.zeros((nbActiveImages,nbInstances))
+    minCoordX, maxCoordX = np.max(data_x_init), 0
+    minCoordY, maxCoordY = np.max(data_y_init), 0
+    for image in range(nbActiveImages):
+        currentImage = activeImages[image]
+        for instance in range(nbInstances):
+            currentInstance = activeInstances[instance]
+            currentMarkers = activeMarkers.instanceMarkers(currentInstance, currentImage)
+            if len(np.atleast_1d(currentMarkers)) > 1:
+                StrainX[image,instance], localStrainIntersectX[image,instance] = np.polyfit(data_x[currentMarkers, currentImage], disp_x[currentMarkers, currentImage], 1)
+                StrainY[image,instance], localStrainIntersectY[image,instance] = np.polyfit(data_y[currentMarkers, currentImage], disp_y[currentMarkers, currentImage], 1)
+                currentMinX, currentMaxX = np.min(data_x[currentMarkers,currentImage]), np.max(data_x[currentMarkers,currentImage])
+                currentMinY, currentMaxY = np.min(data_y[currentMarkers,currentImage]), np.max(data_y[currentMarkers,currentImage])
+                if currentMinX < minCoordX:
+                    minCoordX = currentMinX
+                if currentMaxX > maxCoordX:
+                    maxCoordX = currentMaxX
+                if currentMinY < minCoordY:
+                    minCoordY = currentMinY
+                if currentMaxY > maxCoordY:
+                    maxCoordY = currentMaxY
+    return StrainX, StrainY, localStrainIntersectX, localStrainIntersectY, [minCoordX, maxCoordX], [minCoordY, maxCoordY]
+
+def fieldGrid(fileDataPath, data_x, data_y, resolution=COORDINATES_RESOLUTION): #interpolation grid of the fields, spans the positions of all the markers on all the images so the cached cells stay valid when the mask changes
+
+    xLimit = getData.resultLimits(fileDataPath, 'validx', data_x)
+    yLimit = getData.resultLimits(fileDataPath, 'validy', data_y)
+    return np.linspace(xLimit[0], xLimit[1], resolution), np.linspace(yLimit[0], yLimit[1], resolution)
+
+def updateFields(cache, currentMask, data_x, data_y, disp_x, disp_y, data_corr, activeImages, gridInstances, activeInstances, neighbors, toRecalculate, PROCESSES, progressBar=None, addInfo=print): #calculate the missing cells of the field cache (and the outdated ones of the toRecalculate fields) and save them
+
+    progressBar = processFunctions.progressObject(progressBar)
+    [xi, yi] = cache['grid']
+    directory = cache['directory']
+    nbInstances = len(np.atleast_1d(activeInstances))
+    data_x_init = data_x[:, activeImages[0]]
+    data_y_init = data_y[:, activeImages[0]]
+    keys = {}
+    for instance in activeInstances:
+        keys[instance] = fieldCache.cellKeys(gridInstances[instance], activeImages[0], neighbors)
+
+    if toRecalculate is None:
+        toRecalculate = [True, True, True]
+
+    #missing cells are always calculated, cells calculated with other markers, reference image or neighbors only for the selected fields
+    toCompute = np.zeros((3, len(np.atleast_1d(activeImages)), nbInstances), dtype=bool)
+    for field in range(3):
+        for instance in range(nbInstances):
+            cellKeys = cache['cells'][field, activeInstances[instance], activeImages]
+            toCompute[field, :, instance] = (cellKeys == '') | (toRecalculate[field] & (cellKeys != keys[activeInstances[instance]][field]))
+    imagesToCompute = np.flatnonzero(np.any(toCompute, axis=(0,2)))
+    nbImagesToCompute = len(imagesToCompute)
+    addInfo(str(int(np.sum(toCompute)))+' coordinates to calculate on '+str(nbImagesToCompute)+' images.')
+
+    if nbImagesToCompute > 0:
+        computedImages = np.array(activeImages)[imagesToCompute]
+        #MULTIPROCESSING
+        if PROCESSES > 0:
+            args = []
+            nbTasks = PROCESSES * processFunctions.TASKS_PER_PROCESS
+            nbImageCore = nbImagesToCompute/nbTasks
+            if nbImageCore < 2:
+                nbImageCore = 2
+                nbTasks = int(nbImagesToCompute/2)+1
+            PROCESSES = min(PROCESSES, nbTasks)
+            addInfo('Starting calculation with '+str(PROCESSES)+' processes ('+str(nbTasks)+' tasks).')
+            for i in range (0, nbTasks):
+                start = int(i*nbImageCore)
+                if i >= nbTasks-1: #last task do all the last images
+                    end = nbImagesToCompute
+                else:
+                    end = int((i+1)*nbImageCore)
+                args.append((start,end, data_x[:, computedImages[start:end]], data_y[:, computedImages[start:end]], disp_x[:, computedImages[start:end]], disp_y[:, computedImages[start:end]], data_corr[:, computedImages[start:end]], xi, yi, activeImages, gridInstances, activeInstances, neighbors, directory, data_x_init, data_y_init, toCompute[:, imagesToCompute[start:end]]))
+
+            result = processFunctions.createProcess(None, calculateCoordinates, args, PROCESSES, progressBar, 'Calculating missing coordinates ...')
+
+        else:
+            result = calculateCoordinates(0, nbImagesToCompute, data_x[:, computedImages], data_y[:, computedImages], disp_x[:, computedImages], disp_y[:, computedImages], data_corr[:, computedImages], xi, yi, activeImages, gridInstances, activeInstances, neighbors, directory, data_x_init, data_y_init, toCompute[:, imagesToCompute], None, None)
+
+        #saving Coordinates
+        if progressBar is not None:
+            progressBar.currentTitle = "Saving coordinates..."
+        for field in range(3):
+            for instance in range(nbInstances):
+                currentInstance = activeInstances[instance]
+                computedCells = toCompute[field, imagesToCompute, instance]
+                fieldCache.writeFields(cache, currentInstance, computedImages[computedCells], field, result[field*nbInstances+instance][computedCells])
+                cache['cells'][field, currentInstance, computedImages[computedCells]] = keys[currentInstance][field]
+        fieldCache.saveFieldCache(cache, currentMask)
+
+def postProcess(fileDataPath, PROCESSES, resolution=COORDINATES_RESOLUTION, progressBar=None, addInfo=print): #calculate what the interface calculates when the analysis is opened with the original mask (1D strain files and field cache)
+
+    progressBar = processFunctions.progressObject(progressBar)
+    data = {}
+    for name in ['validx', 'validy', 'corrcoef', 'dispx', 'dispy']:
+        data[name] = getData.readResult(fileDataPath, name, mmap_mode='r')
+        if data[name] is None:
+            addInfo('Missing result file: '+name)
+            return None
+    [nb_marker, nb_image] = data['validx'].shape
+    gridInstances = getData.readGridInstances(fileDataPath, nb_marker)
+    if gridInstances is None:
+        addInfo('Missing grid file: gridx.csv')
+        return None
+    neighbors = np.genfromtxt(fileDataPath+'/neighbors.csv', delimiter=',')
+
+    currentMask = np.ones((nb_marker, nb_image))
+    activeMarkers = markerActivity(currentMask)
+    activeImages = np.flatnonzero(np.any(activeMarkers.matrix, axis=0)).tolist()
+    activeInstances = np.linspace(0, len(gridInstances), num=len(gridInstances), endpoint=False, dtype=int)
+    gridInstances, activeInstances = activeGrid(gridInstances, activeInstances, activeMarkers, activeImages[0])
+
+    if progressBar is not None:
+        progressBar.percent = 0
+        progressBar.currentTitle = 'Calculating strain...'
+    StrainX, StrainY, intersectX, intersectY, xLimit, yLimit = instancesStrain(data['validx'], data['validy'], data['dispx'], data['dispy'], activeMarkers, activeImages, activeInstances)
+    np.savetxt(fileDataPath+'/strainx.csv', StrainX, delimiter=',')
+    np.savetxt(fileDataPath+'/strainy.csv', StrainY, delimiter=',')
+
+    [xi, yi] = fieldGrid(fileDataPath, data['validx'], data['validy'], resolution)
+    cache = fieldCache.openFieldCache(fileDataPath, len(gridInstances), nb_image, xi, yi)
+    updateFields(cache, currentMask, data['validx'], data['validy'], data['dispx'], data['dispy'], data['corrcoef'], activeImages, gridInstances, activeInstances, neighbors, None, PROCESSES, progressBar=progressBar, addInfo=addInfo)
+    return cache
+
+def calculateCoordinates(imageStart, imageEnd, data_x, data_y, disp_x, disp_y, data_corr, xi, yi, activeImages, grid_instances, activeInstances, neighbors, directory, data_x_init, data_y_init, toCompute, q, pipe):
+#calculate the correlation (field 0) and strain (fields 1 and 2) coordinates of the images given, only for the cells where toCompute[field, image, instance] is True
+
+    nbImages = imageEnd-imageStart
+    nbInstances = len(np.atleast_1d(activeInstances))
+    result = np.zeros((3*nbInstances, nbImages, yi.shape[0], xi.shape[0]))
+    previousTime = time.time()
+
+    #the neighbors of each marker inside its instance and the triangulations of the reference positions are the same for all the images
+    instanceNeighbors = []
+    instanceTriangulations = []
+    for instance in range(nbInstances):
+        instanceMarkers = np.atleast_1d(grid_instances[activeInstances[instance]])
+        instanceNeighbors.append(strainNeighbors(instanceMarkers, neighbors))
+        strainCalculated = instanceNeighbors[instance][0]
+        corrTriangulation, strainTriangulation = None, None
+        if len(instanceMarkers) >= 3 and np.any(toCompute[0, :, instance]):
+            corrTriangulation = scipy.spatial.Delaunay(np.c_[data_x_init[instanceMarkers], data_y_init[instanceMarkers]])
+        if len(strainCalculated) > 3 and np.any(toCompute[1:, :, instance]):
+            strainTriangulation = scipy.spatial.Delaunay(np.c_[data_x_init[strainCalculated], data_y_init[strainCalculated]])
+        instanceTriangulations.append([corrTriangulation, strainTriangulation])
+
+    for image in range(0, nbImages):
+        if pipe is not None:
+            currentProgress = image * 100 / nbImages
+            currentTime = time.time()
+            if currentTime > previousTime + .05:
+                previousTime = currentTime
+                pipe.send(currentProgress)
+        currentImage = image
+        data_x_current = data_x[:, currentImage]
+        data_y_current = data_y[:, currentImage]
+
+        for instance in range(nbInstances):
+            instanceMarkers = np.atleast_1d(grid_instances[activeInstances[instance]])
+            if len(np.atleast_1d(instanceMarkers)) < 3:
+                result[instance][image][0,0] = 99999
+                result[nbInstances+instance][image][0,0] = 99999
+                result[2*nbInstances+instance][image][0,0] = 99999
+                continue
+            toRecalculate = toCompute[:, image, instance]
+            #CORRELATION 2D
+            data_corr_clean = data_corr[instanceMarkers, currentImage]
+            if toRecalculate[0]:
+                result[instance][image] = interpolateField(instanceTriangulations[instance][0], data_corr_clean, xi, yi)
+
+            ## 2D STRAIN ##
+            if not toRecalculate[1] and not toRecalculate[2]:
+                continue
+            [strainCalculated, neighborIndexes, isNeighbor] = instanceNeighbors[instance]
+            currentStrainXX, currentStrainYY = localStrain(data_x_current, data_y_current, disp_x[:, currentImage], disp_y[:, currentImage], strainCalculated, neighborIndexes, isNeighbor, toRecalculate)
+
+            if len(np.atleast_1d(strainCalculated)) > 3:
+                strainFields = [field for field in [1, 2] if toRecalculate[field]]
+                strainValues = np.c_[currentStrainXX, currentStrainYY][:, np.array(strainFields)-1]
+                interpolatedStrain = interpolateField(instanceTriangulations[instance][1], strainValues, xi, yi) #both strains in one evaluation
+                for i in range(len(strainFields)):
+                    result[strainFields[i]*nbInstances+instance][image] = interpolatedStrain[:, :, i]
+            else:
+                result[nbInstances+instance][image][0,0] = 99999
+                result[2*nbInstances+instance][image][0,0] = 99999
+
+    if q is not None: #if multiprocessing, results are put in the queue
+        q.put(result)
+        q.close()
+        return
+    else:
+        return result
+
+
+def interpolateField(triangulation, values, xi, yi): #cubic interpolation of the values (one column per field) on the xi, yi grid, same as griddata(method='cubic') without triangulating the points again
+
+    interpolator = scipy.interpolate.CloughTocher2DInterpolator(triangulation, values)
+    return interpolator(xi[None,:], yi[:,None])
+
+def strainNeighbors(instanceMarkers, neighbors): #return the markers of the instance having enough neighbors in the instance for the local strain fit, the padded index array of these neighbors and the mask of the real ones
+
+    instanceMarkers = np.atleast_1d(instanceMarkers).astype(int)
+    markerNeighbors = np.atleast_2d(neighbors)[instanceMarkers]
+    isNeighbor = np.isin(markerNeighbors, instanceMarkers)
+    order = np.argsort(~isNeighbor, axis=1, kind='stable') #neighbors first, in the neighbors.csv order
+    markerNeighbors = np.take_along_axis(markerNeighbors, order, axis=1)
+    isNeighbor = np.take_along_axis(isNeighbor, order, axis=1)
+    nbNeighbors = np.sum(isNeighbor, axis=1)
+    fitted = nbNeighbors > 6
+    maxNeighbors = int(np.max(nbNeighbors[fitted])) if np.any(fitted) else 0
+    neighborIndexes = np.where(isNeighbor, markerNeighbors, 0)[fitted, :maxNeighbors].astype(int)
+    return instanceMarkers[fitted], neighborIndexes, isNeighbor[fitted, :maxNeighbors]
+
+def localStrain(data_x_current, data_y_current, disp_x_current, disp_y_current, strainMarkers, neighborIndexes, isNeighbor, toRecalculate):
+#fit Z = C[4]*X**2. + C[5]*Y**2. + C[3]*X*Y + C[1]*X + C[2]*Y + C[0] on the neighbors of all the markers at once, return the strain XX and YY at each marker (nan when a neighbor has no position)
+
+    xData = np.where(isNeighbor, data_x_current[neighborIndexes], 0)
+    yData = np.where(isNeighbor, data_y_current[neighborIndexes], 0)
+    dispDataX = np.where(isNeighbor, disp_x_current[neighborIndexes], 0)
+    dispDataY = np.where(isNeighbor, disp_y_current[neighborIndexes], 0)
+    A = np.stack((isNeighbor.astype(np.float64), xData, yData, xData*yData, xData**2, yData**2), axis=2) #padding rows are zeros
+    fitted = np.isfinite(A).all(axis=(1,2)) & np.isfinite(dispDataX).all(axis=1) & np.isfinite(dispDataY).all(axis=1)
+
+    strainXX = np.nan * np.ones(len(neighborIndexes))
+    strainYY = np.nan * np.ones(len(neighborIndexes))
+    if not np.any(fitted):
+        return strainXX, strainYY
+    pinvA = np.linalg.pinv(A[fitted]) #same least-squares solution for X and Y, the columns of the Y fit are only swapped
+    markersX = data_x_current[strainMarkers[fitted]]
+    markersY = data_y_current[strainMarkers[fitted]]
+    if toRecalculate[1]:
+        C = np.matmul(pinvA, dispDataX[fitted][:, :, np.newaxis])[:, :, 0]
+        strainXX[fitted] = 2*C[:, 4]*markersX+C[:, 1]+C[:, 3]*markersY
+    if toRecalculate[2]:
+        D = np.matmul(pinvA, dispDataY[fitted][:, :, np.newaxis])[:, :, 0]
+        strainYY[fitted] = 2*D[:, 5]*markersY+D[:, 2]+D[:, 3]*markersX
+    return strainXX, strainYY
+
+class markerActivity: #active markers of each image as a boolean markers x images matrix, read like a list of marker arrays (activeMarkers[image])
+
+    def __init__(self, currentMask, gridInstances=[]):
+
+        self.matrix = np.asarray(currentMask) == 1
+        self.setInstances(gridInstances)
+
+    def setInstances(self, gridInstances): #sorted markers of each instance, to get the active markers of an instance without set intersection
+
+        self.instances = [np.unique(np.atleast_1d(instanceMarkers).astype(int)) for instanceMarkers in gridInstances]
+
+    def __len__(self):
+
+        return self.matrix.shape[1]
+
+    def __getitem__(self, image):
+
+        return np.flatnonzero(self.matrix[:, image])
+
+    def __setitem__(self, image, markers):
+
+        self.matrix[:, image] = False
+        self.matrix[np.atleast_1d(markers).astype(int), image] = True
+
+    def instanceMarkers(self, instance, image): #active markers of the grid instance on the image, in increasing order
+
+        markers = self.instances[instance]
+        return markers[self.matrix[markers, image]]
+
+def calculateNeighbors(activeMarkers, data_x_init, data_y_init, minNeighbors, fileDataPath, progressBar=None):
+#return an array containing at least the 'minNeighbors' closest neighbors of each marker and save it in analysis folder
+
+    progressBar = processFunctions.progressObject(progressBar)
+    activeMarkers = np.array(activeMarkers).astype(int)
+    maxCorrDistance = 0
+    data_x_unique = np.unique(data_x_init.astype(int))
+    data_y_unique = np.unique(data_y_init.astype(int))
+    if len(np.atleast_1d(data_x_unique)) > 1 and len(np.atleast_1d(data_y_unique)) > 1:
+        minDistance = max(np.absolute(data_x_unique[1]-data_x_unique[0]), np.absolute(data_y_unique[1]-data_y_unique[0]))
+        maxCorrDistance = max(np.max(data_x_unique)-np.min(data_x_unique), np.max(data_y_unique)-np.min(data_y_unique))
+    else:
+        minDistance = maxCorrDistance
+    if minDistance < 5:
+        minDistance = 5
+    nbMarkers = len(activeMarkers)
+    maxNeighbors = 0
+    maxIteration = int(maxCorrDistance / minDistance) + 1
+    if nbMarkers < minNeighbors:
+        minNeighbors = nbMarkers
+
+    #the neighbors of a marker are the markers inside the smallest square window (half-size multiple of minDistance, at most maxIteration steps) containing at least minNeighbors markers
+    markerNeighbors = [[] for marker in range(nbMarkers)]
+    positions = np.vstack((data_x_init[activeMarkers], data_y_init[activeMarkers])).T
+    validMarkers = np.flatnonzero(np.isfinite(positions).all(axis=1)) #markers without position are nobody's neighbor
+    if len(validMarkers) > 0:
+        tree = scipy.spatial.cKDTree(positions[validMarkers])
+        nbSteps = maxIteration * np.ones(len(validMarkers), dtype=int)
+        if 0 < minNeighbors <= len(validMarkers):
+            kthDistance = tree.query(positions[validMarkers], k=minNeighbors, p=np.inf)[0].reshape(len(validMarkers), -1)[:, -1] #square window distance
+            nbSteps = np.minimum(np.floor(kthDistance / minDistance).astype(int) + 1, maxIteration)
+        elif minNeighbors <= 0:
+            nbSteps[:] = 1
+        steps = np.unique(nbSteps)
+        for i in range(len(steps)):
+            if progressBar is not None:
+                progressBar.percent = int(i * 100 / len(steps))
+            stepMarkers = validMarkers[nbSteps == steps[i]]
+            radius = np.nextafter(steps[i] * minDistance, 0) #window limits are excluded
+            windowMarkers = tree.query_ball_point(positions[stepMarkers], radius, p=np.inf)
+            for marker in range(len(stepMarkers)):
+                markerNeighbors[stepMarkers[marker]] = activeMarkers[validMarkers[np.sort(windowMarkers[marker])]]
+    for marker in range(nbMarkers):
+        maxNeighbors = max(maxNeighbors, len(markerNeighbors[marker]))
+
+    neighbors = np.zeros((nbMarkers,maxNeighbors))
+    for marker in range(nbMarkers):
+        currentNeighbors = len(np.atleast_1d(markerNeighbors[marker]))
+        neighbors[marker, :currentNeighbors] = markerNeighbors[marker]
+        neighbors[marker, currentNeighbors:maxNeighbors] = np.nan
+    np.savetxt(fileDataPath+'/neighbors.csv', neighbors, fmt='%1.0f', delimiter=',')
+    return neighbors
@@ -13,9 +13,16 @@ Current File: Defines the start-up process and load the interface
 
 from PyQt4.QtGui import *
 from PyQt4.QtCore import *
-from interface import menubar, profile
+from interface import menubar, profile, devMode
 from functions import startOptions
 
+class MainWindow(QMainWindow):
+    def __init__(self, PROFILE_FILE, DEFAULT_PROFILE, DEV_MODE): #initiate the main window
+        super(MainWindow, self).__init__()
+        initProfile(self, PROFILE_FILE, DEFAULT_PROFILE)
+        setUpInterface(self, self.currentProfile)
+        self.devWindow = devMode.DevMode(self, DEV_MODE)
+
 def initProfile(self, PROFILE_FILE, DEFAULT_PROFILE):
 
     self.profileData = profile.readProfile(PROFILE_FILE, default=DEFAULT_PROFILE) #read the profile list and create a default profile if the PROFILE_FILE is not found
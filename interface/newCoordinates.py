@@ -41,6 +41,18 @@ class newCoordinatesDialog(QDialog):
         checkBoxLayout.addWidget(self.xStrainBox)
         checkBoxLayout.addWidget(self.yStrainBox)
 
+        resolutionLayout = QHBoxLayout()
+        resolutionLbl = QLabel('Resolution (points along x and y):')
+        self.resolution = QSpinBox()
+        self.resolution.setMaximumWidth(100)
+        self.resolution.setRange(10, 1000)
+        self.resolution.setValue(parent.coordinatesResolution)
+        self.resolution.setToolTip('Changing the resolution re-calculates all the coordinates.')
+        resolutionLayout.addStretch(1)
+        resolutionLayout.addWidget(resolutionLbl)
+        resolutionLayout.addWidget(self.resolution)
+        resolutionLayout.addStretch(1)
+
         dialogButtonLayout = QHBoxLayout()
         self.dialogButton = QPushButton('Calculate')
         self.dialogButton.setMaximumWidth(100)
@@ -51,6 +63,7 @@ class newCoordinatesDialog(QDialog):
 
         dialogLayout.addWidget(dialogLabel)
         dialogLayout.addLayout(checkBoxLayout)
+        dialogLayout.addLayout(resolutionLayout)
         dialogLayout.addLayout(dialogButtonLayout)
 
         self.setLayout(dialogLayout)
@@ -60,6 +73,8 @@ class newCoordinatesDialog(QDialog):
         recalculateCoordinates = [self.corrBox.isChecked(), self.xStrainBox.isChecked(), self.yStrainBox.isChecked()]
         progressBar = progressWidget.progressBarDialog('Starting calculation...')
         self.close()
+        initData.resetCoordinates(parent, recalculateCoordinates)
+        parent.coordinatesResolution = int(self.resolution.value())
         calculatingThread = DIC_Global.createThread(parent.parentWindow, [parent, progressBar, parent.currentMask, recalculateCoordinates], initData.initPlottedData, signal=1)
         calculatingThread.signal.threadSignal.connect(lambda: masks.newMasksCalculated(parent, progressBar))
         calculatingThread.start()
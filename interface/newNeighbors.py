@@ -15,7 +15,7 @@ from PyQt4.QtCore import *
 from PyQt4.QtGui import *
 import numpy as np, time
 from interface import progressWidget
-from functions import initData
+from functions import strainFunctions
 
 class newNeighborsDialog(QDialog):
 
@@ -72,7 +72,7 @@ class newNeighborsDialog(QDialog):
         data_x_init = parent.data_x[:,firstImage]
         data_y_init = parent.data_y[:,firstImage]
         minNeighbors = int(self.nbNeighbors.value())
-        neighbors = initData.calculateNeighbors(listMarkers, data_x_init, data_y_init, minNeighbors, parent.parentWindow.fileDataPath, progressBar=self.dialogProgress)
+        neighbors = strainFunctions.calculateNeighbors(listMarkers, data_x_init, data_y_init, minNeighbors, parent.parentWindow.fileDataPath, progressBar=self.dialogProgress)
         parent.neighbors = neighbors
         self.dialogButton.setText('Done. Closing..')
         self.dialogButton.setDisabled(True)
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+"""
+Please report issues and request on the GitHub project from ChrisEberl (Python_DIC)
+More details regarding the project on the GitHub Wiki : https://github.com/ChrisEberl/Python_DIC/wiki
+
+Current File: Tests of the subpixel refinement, pyramid search, motion prediction and reference cache of the correlation (python -m pytest tests)
+"""
+
+import os, sys, numpy as np, pytest
+from scipy import ndimage
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from functions import CpCorr, motionPrediction, newProcessCorrelations
+from test_regression import speckle, IMAGE_SHAPE, CORRSIZE
+
+#PARAMETERS
+SUBPIXEL_SHIFT = (.37, -.61) #(x, y) shift of the subpixel accuracy test
+LARGE_SHIFT = 13 #x shift of the pyramid test, larger than CORRSIZE-1
+#END PARAMETERS
+
+def shiftedImage(img, shiftX, shiftY): #8 bits image of img moved by (shiftX, shiftY) pixels
+
+    return np.clip(np.round(ndimage.shift(img, (shiftY, shiftX), order=5, mode='reflect')), 0, 255).astype(np.uint8)
+
+def gridPoints(margin, step=12): #markers at least margin pixels from the image borders
+
+    [gridX, gridY] = np.meshgrid(np.arange(margin, IMAGE_SHAPE[1]-margin, step), np.arange(margin, IMAGE_SHAPE[0]-margin, step))
+    return np.column_stack((gridX.ravel(), gridY.ravel())).astype(np.float64)
+
+@pytest.fixture(scope='module')
+def speckleImage():
+
+    return speckle(IMAGE_SHAPE)
+
+def correlate(points, base, current, engine, **options): #CpcorrFunc positions (markers x 2) and error codes
+
+    [pointsX, pointsY] = [points[:, :1], points[:, 1:]]
+    [inputCorrX, inputCorrY, stdX, stdY, corrCoef, errorInfos] = newProcessCorrelations.CpcorrFunc(pointsX, pointsY, pointsX, pointsY, base, current, CORRSIZE, engine=engine, **options)
+    return np.hstack([inputCorrX, inputCorrY]), errorInfos[:, 0]
+
+@pytest.mark.parametrize('engine', list(newProcessCorrelations.CORR_ENGINES))
+def test_icgn(speckleImage, engine): #the IC-GN refinement finds a subpixel shift several times more accurately than the quadratic peak fit
+
+    base = shiftedImage(speckleImage, 0, 0)
+    current = shiftedImage(speckleImage, *SUBPIXEL_SHIFT)
+    points = gridPoints(40)
+    errors = {}
+    for subpixel in ['quadratic', 'icgn']:
+        [positions, errorInfos] = correlate(points, base, current, engine, subpixel=subpixel)
+        assert np.all(errorInfos == 0)
+        errors[subpixel] = np.hypot(*(positions - points - SUBPIXEL_SHIFT).T)
+    assert np.median(errors['icgn']) < .003
+    assert np.percentile(errors['icgn'], 95) < .01
+    assert np.median(errors['icgn']) < np.median(errors['quadratic'])/5
+
+@pytest.mark.parametrize('engine', list(newProcessCorrelations.CORR_ENGINES))
+def test_pyramid(speckleImage, engine): #markers moving more than CORRSIZE-1 pixels are only found with the pyramid
+
+    base = shiftedImage(speckleImage, 0, 0)
+    current = shiftedImage(speckleImage, LARGE_SHIFT, 0)
+    points = gridPoints(60) #the search windows of the downsampled images stay inside the image
+    [positions, errorInfos] = correlate(points, base, current, engine, pyramidLevels=1)
+    errors = np.hypot(*(positions - points - [LARGE_SHIFT, 0]).T)
+    assert np.all(errorInfos == 0)
+    assert errors.max() < .1
+    [positions, errorInfos] = correlate(points, base, current, engine)
+    errors = np.hypot(*(positions - points - [LARGE_SHIFT, 0]).T)
+    assert np.median(errors) > 1
+
+@pytest.mark.parametrize('engine', list(newProcessCorrelations.CORR_ENGINES))
+@pytest.mark.parametrize('options', [{}, {'subpixel': 'icgn'}, {'pyramidLevels': 1}, {'searchRadius': 4}])
+def test_reference_cache(speckleImage, engine, options): #the positions, std, correlation and errors are the same to the last bit with the reference cache
+
+    base = shiftedImage(speckleImage, 0, 0)
+    points = gridPoints(30, step=9)
+    [pointsX, pointsY] = [points[:, :1], points[:, 1:]]
+    reference = CpCorr.correlationReference(points, base, CORRSIZE, maxMemory=newProcessCorrelations.CORR_OPTIONS['referenceMemory'])
+    markers = np.arange(0, len(points), 3)
+    for image in range(1, 4): #the cached data is reused by the next images and by a part of the markers
+        current = shiftedImage(speckleImage, 2.3*image, -.7*image)
+        startX, startY = pointsX + round(2.3*image), pointsY + round(-.7*image)
+        cached = newProcessCorrelations.CpcorrFunc(pointsX, pointsY, startX, startY, base, current, CORRSIZE, engine=engine, reference=reference, **options)
+        uncached = newProcessCorrelations.CpcorrFunc(pointsX, pointsY, startX, startY, base, current, CORRSIZE, engine=engine, **options)
+        for cachedResult, uncachedResult in zip(cached, uncached):
+            assert np.array_equal(cachedResult, uncachedResult, equal_nan=True)
+        cached = newProcessCorrelations.CpcorrFunc(pointsX[markers], pointsY[markers], startX[markers], startY[markers], base, current, CORRSIZE, engine=engine, reference=reference[markers], **options)
+        uncached = newProcessCorrelations.CpcorrFunc(pointsX[markers], pointsY[markers], startX[markers], startY[markers], base, current, CORRSIZE, engine=engine, **options) #the FFT of a stack depends on the stack size to the last bit
+        for cachedResult, uncachedResult in zip(cached, uncached):
+            assert np.array_equal(cachedResult, uncachedResult, equal_nan=True)
+
+def test_motion_prediction(): #constant velocity and acceleration are extrapolated exactly, without the large displacement, lost markers follow their neighbors
+
+    gridX = np.array([10., 20., 30., 40.])
+    gridY = np.zeros(4)
+    largeDisp = np.zeros((6, 2))
+    largeDisp[:, 0] = [0, 5, 9, 20, 21, 30]
+    found = np.zeros(4)
+    neighbors = np.array([[1, 2], [0, 2], [1, 3], [2, -1]])
+    trajectories = {1: lambda image: 1.5*image, 2: lambda image: .5*image**2 + image}
+    for order, displacement in trajectories.items():
+        predictor = motionPrediction.motionPredictor(gridX, gridY, order, neighbors, CORRSIZE)
+        for image in [0, 1, 3]: #image 2 is not correlated
+            positionsX = gridX + displacement(image) + largeDisp[image, 0]
+            predictor.addPositions(image, positionsX, gridY, found, largeDisp)
+        pointsX = positionsX + largeDisp[4, 0] - largeDisp[3, 0] #previous positions moved by the large displacement, as given by processCorrelation
+        [predictedX, predictedY, searchRadius] = predictor.predict(4, pointsX, gridY, largeDisp)
+        assert np.allclose(predictedX, gridX + displacement(4) + largeDisp[4, 0], rtol=0, atol=1e-12)
+        assert np.array_equal(predictedY, gridY)
+
+    largeDisp = np.zeros((3, 2))
+    predictor = motionPrediction.motionPredictor(gridX, gridY, 1, neighbors, CORRSIZE)
+    predictor.addPositions(0, gridX, gridY, found, largeDisp)
+    predictor.addPositions(1, gridX + [2, 2, 3, 4], gridY, [0, 8, 0, 0], largeDisp)
+    [predictedX, predictedY, searchRadius] = predictor.predict(2, gridX + [2, 2, 3, 4], gridY, largeDisp)
+    assert np.allclose(predictedX, gridX + [4, 5, 6, 8]) #marker 1 takes the median predicted displacement of markers 0 and 2
+    assert searchRadius == CORRSIZE
+
+    predictor.addPositions(2, predictedX + [.5, 0, 0, -.2], gridY, found, largeDisp) #the search radius follows the prediction errors
+    assert predictor.radius == max(int(np.ceil(motionPrediction.SEARCH_RADIUS_FACTOR*np.percentile([.5, 0, 0, .2], motionPrediction.SEARCH_RADIUS_PERCENTILE))), motionPrediction.SEARCH_RADIUS_MIN)
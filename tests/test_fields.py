@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""
+Please report issues and request on the GitHub project from ChrisEberl (Python_DIC)
+More details regarding the project on the GitHub Wiki : https://github.com/ChrisEberl/Python_DIC/wiki
+
+Current File: Tests of the field cache invalidation on the synthetic image sequence (python -m pytest tests)
+"""
+
+import os, sys, shutil, numpy as np, pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import DIC_batch
+from functions import getData, fieldCache, strainFunctions
+from test_regression import sequence, CORRSIZE
+
+#PARAMETERS
+RESOLUTION = 30
+#END PARAMETERS
+
+@pytest.fixture(scope='module')
+def analysis(sequence): #analysis of the sequence with its field cache
+
+    [directory, gridDirectory] = sequence
+    fileDataPath = DIC_batch.runAnalysis(directory, 'fields', gridDirectory, corrsize=CORRSIZE, reference='first', PROCESSES=1, resolution=RESOLUTION, addInfo=lambda info: None)
+    data = {name: getData.readResult(fileDataPath, name) for name in ['validx', 'validy', 'corrcoef', 'dispx', 'dispy']}
+    gridInstances = getData.readGridInstances(fileDataPath, data['validx'].shape[0])
+    neighbors = np.genfromtxt(fileDataPath+'/neighbors.csv', delimiter=',')
+    return fileDataPath, data, gridInstances, neighbors
+
+def updateCache(directory, data, gridInstances, neighbors, activeImages, toRecalculate=None): #update the field cache of directory, return it and the number of calculated cells
+
+    messages = []
+    [xi, yi] = strainFunctions.fieldGrid(directory, data['validx'], data['validy'], RESOLUTION)
+    cache = fieldCache.openFieldCache(directory, len(gridInstances), data['validx'].shape[1], xi, yi)
+    mask = np.ones(data['validx'].shape)
+    strainFunctions.updateFields(cache, mask, data['validx'], data['validy'], data['dispx'], data['dispy'], data['corrcoef'], activeImages, gridInstances, np.arange(len(gridInstances)), neighbors, toRecalculate, 0, addInfo=messages.append)
+    return cache, int(messages[0].split()[0])
+
+def cellFields(cache, images): #all the cached fields of the first instance on images
+
+    return np.array([[fieldCache.readField(cache, 0, image, field) for field in range(3)] for image in images])
+
+def test_field_cache_keys(analysis, tmp_path): #cells are calculated again when their markers, reference image or neighbors change and give the fields of an empty cache
+
+    [fileDataPath, data, gridInstances, neighbors] = analysis
+    directory = str(tmp_path/'fields')
+    shutil.copytree(fileDataPath, directory)
+    nbImages = data['validx'].shape[1]
+    allImages = list(range(nbImages))
+
+    [cache, calculated] = updateCache(directory, data, gridInstances, neighbors, allImages)
+    assert calculated == 0
+
+    otherNeighbors = neighbors[:, ::-1] #same neighbors in another order, another fit
+    [cache, calculated] = updateCache(directory, data, gridInstances, otherNeighbors, allImages)
+    assert calculated == 2*nbImages #only the strain fields
+    [cache, calculated] = updateCache(directory, data, gridInstances, otherNeighbors, allImages)
+    assert calculated == 0
+
+    [cache, calculated] = updateCache(directory, data, gridInstances, otherNeighbors, allImages[1:])
+    assert calculated == 3*(nbImages-1) #reference image of all the fields
+    emptyDirectory = str(tmp_path/'empty')
+    shutil.copytree(fileDataPath, emptyDirectory)
+    shutil.rmtree(emptyDirectory+'/'+fieldCache.FIELD_DIRECTORY)
+    os.remove(emptyDirectory+'/'+fieldCache.HEADER_FILE)
+    [emptyCache, calculated] = updateCache(emptyDirectory, data, gridInstances, otherNeighbors, allImages[1:])
+    assert calculated == 3*(nbImages-1)
+    assert np.array_equal(cellFields(cache, allImages[1:]), cellFields(emptyCache, allImages[1:]), equal_nan=True)
+
+    maskedInstances = [np.delete(np.atleast_1d(gridInstances[0]), 0)]
+    [cache, calculated] = updateCache(directory, data, maskedInstances, otherNeighbors, allImages[1:], toRecalculate=[False, True, False])
+    assert calculated == nbImages-1 #cells of the other markers are kept for the unselected fields
+
+def test_field_grid(analysis): #the interpolation grid spans all the positions, whatever the mask
+
+    [fileDataPath, data, gridInstances, neighbors] = analysis
+    [xi, yi] = strainFunctions.fieldGrid(fileDataPath, data['validx'], data['validy'], RESOLUTION)
+    assert xi[0] == np.nanmin(data['validx']) and xi[-1] == np.nanmax(data['validx'])
+    assert yi[0] == np.nanmin(data['validy']) and yi[-1] == np.nanmax(data['validy'])
+    assert len(xi) == RESOLUTION and len(yi) == RESOLUTION
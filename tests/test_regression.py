@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""
+Please report issues and request on the GitHub project from ChrisEberl (Python_DIC)
+More details regarding the project on the GitHub Wiki : https://github.com/ChrisEberl/Python_DIC/wiki
+
+Current File: Regression tests of the correlation on a synthetic image sequence (python -m pytest tests)
+"""
+
+import os, sys, shutil, numpy as np, cv2, pytest
+from scipy import ndimage
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import DIC_batch
+from functions import CpCorr, getData, processFunctions, newProcessCorrelations
+
+#PARAMETERS
+IMAGE_SHAPE = (220, 300)
+NB_IMAGES = 10
+STEP_X = 2.3 #displacement of the speckle between two images (pixels), the total displacement is larger than CORRSIZE
+STEP_Y = -0.7
+CORRSIZE = 10
+GRID_STEP = 16
+#END PARAMETERS
+
+def speckle(shape, seed=0): #random speckle pattern with a few pixels grains
+
+    rng = np.random.default_rng(seed)
+    img = cv2.GaussianBlur(rng.random(shape)*255, (0,0), 2.0)
+    return (img-img.min())/(img.max()-img.min())*255
+
+@pytest.fixture(scope='module')
+def sequence(tmp_path_factory): #images moved by (STEP_X, STEP_Y) pixels from one image to the next and the grid files
+
+    directory = str(tmp_path_factory.mktemp('sequence'))
+    img = speckle(IMAGE_SHAPE)
+    for image in range(NB_IMAGES):
+        moved = ndimage.shift(img, (STEP_Y*image, STEP_X*image), order=5, mode='reflect')
+        cv2.imwrite(directory+'/im%02d.tif' % image, np.clip(np.round(moved), 0, 255).astype(np.uint8))
+    gridDirectory = directory+'/grid'
+    os.makedirs(gridDirectory)
+    [gridX, gridY] = np.meshgrid(np.arange(40, IMAGE_SHAPE[1]-60, GRID_STEP), np.arange(40, IMAGE_SHAPE[0]-40, GRID_STEP))
+    np.savetxt(gridDirectory+'/gridx.csv', gridX.ravel()[:, None], delimiter=',')
+    np.savetxt(gridDirectory+'/gridy.csv', gridY.ravel()[:, None], delimiter=',')
+    yield directory, gridDirectory
+    processFunctions.closePool()
+    shutil.rmtree(directory, ignore_errors=True)
+
+def runSequence(sequence, name, PROCESSES, reference='first', corrOptions=None): #result matrices of an analysis of the sequence
+
+    [directory, gridDirectory] = sequence
+    fileDataPath = DIC_batch.runAnalysis(directory, name, gridDirectory, corrsize=CORRSIZE, reference=reference, PROCESSES=PROCESSES, corrOptions=corrOptions, fields=False, addInfo=lambda info: None)
+    return {name: np.asarray(getData.readResult(fileDataPath, name)) for name in newProcessCorrelations.RESULT_NAMES}
+
+def test_engines(sequence): #the engines find the same markers, 'sat' gives the 'batch' results and the others differ by the single precision of their cross correlation
+
+    directory = sequence[0]
+    base = cv2.imread(directory+'/im00.tif', 0)
+    current = cv2.imread(directory+'/im01.tif', 0)
+    [gridX, gridY] = np.meshgrid(np.arange(30, IMAGE_SHAPE[1]-30, 6), np.arange(30, IMAGE_SHAPE[0]-30, 6))
+    points = np.column_stack((gridX.ravel(), gridY.ravel())).astype(np.float64)
+    results = {}
+    for engine, correlate in newProcessCorrelations.CORR_ENGINES.items():
+        results[engine] = correlate(points.copy(), points.copy(), current, base, CORRSIZE)
+
+    for satResult, batchResult in zip(results['sat'], results['batch']):
+        assert np.array_equal(satResult, batchResult, equal_nan=True)
+    found = results['batch'][4][:,0] == 0
+    assert found.mean() > .95
+    for engine in ['loop', 'sat32']:
+        assert np.array_equal(results[engine][4], results['batch'][4])
+        difference = np.absolute(results[engine][0] - results['batch'][0])[found]
+        assert np.median(difference) <= 1e-3
+        assert np.percentile(difference, 99) <= 1e-2
+    expected = points + [STEP_X, STEP_Y]
+    assert np.median(np.absolute(results['batch'][0][found] - expected[found])) < .05
+
+@pytest.mark.parametrize('reference', ['first', 'previous'])
+def test_process_count(sequence, reference): #the results do not depend on the number of processes, the markers are followed further than CORRSIZE
+
+    single = runSequence(sequence, 'single_'+reference, 1, reference)
+    multiple = runSequence(sequence, 'multiple_'+reference, 3, reference)
+    for name in ['validx', 'validy', 'dispx', 'dispy', 'infoMarkers']:
+        assert np.array_equal(single[name], multiple[name], equal_nan=True), name
+    for name in ['corrcoef', 'stdx', 'stdy']: #the FFT of a stack of subsets depends on the stack size to the last bit
+        assert np.allclose(single[name], multiple[name], rtol=1e-12, atol=1e-15, equal_nan=True), name
+    found = single['infoMarkers'][:, -1] == 0
+    assert found.mean() > .95
+    assert abs(np.median(single['dispx'][found, -1]) - STEP_X*(NB_IMAGES-1)) < .1
+    assert abs(np.median(single['dispy'][found, -1]) - STEP_Y*(NB_IMAGES-1)) < .1
+
+@pytest.mark.parametrize('precision', list(newProcessCorrelations.RESULT_DTYPES))
+def test_result_files(sequence, precision): #results.json and the .npy files give back the matrices written by the processes, .csv files are read without manifest
+
+    results = runSequence(sequence, 'files_'+precision, 2, corrOptions={'precision': precision, 'exportCSV': True})
+    fileDataPath = sequence[0]+'/files_'+precision
+    manifest = getData.readManifest(fileDataPath)
+    for name, dtype in zip(newProcessCorrelations.RESULT_NAMES, newProcessCorrelations.RESULT_DTYPES[precision]):
+        assert np.dtype(manifest['results'][name]['dtype']) == np.dtype(dtype)
+        stored = np.load(fileDataPath+'/'+name+'.npy')
+        mapped = getData.readResult(fileDataPath, name, mmap_mode='r')
+        assert mapped.shape == stored.shape
+        assert np.array_equal(np.asarray(mapped[:, 1:3]), stored[:, 1:3].astype(mapped.dtype), equal_nan=True)
+        assert np.array_equal(results[name], stored.astype(results[name].dtype), equal_nan=True)
+        if 'limits' in manifest['results'][name]:
+            assert np.allclose(manifest['results'][name]['limits'], [np.nanmin(stored), np.nanmax(stored)])
+
+    os.remove(fileDataPath+'/'+getData.RESULT_MANIFEST)
+    for name in newProcessCorrelations.RESULT_NAMES:
+        stored = np.load(fileDataPath+'/'+name+'.npy')
+        assert np.allclose(getData.readResult(fileDataPath, name).astype(stored.dtype), stored, rtol=1e-15, atol=0, equal_nan=True) #pandas parses the last digit of some floats differently
+
+def test_image_cache_fallback(sequence, tmp_path): #an image of another size is read from the disk and gives the results of an analysis without cache
+
+    directory = str(tmp_path/'resized')
+    shutil.copytree(sequence[0], directory)
+    resized = cv2.imread(directory+'/im05.tif', 0)[:-20, :-20]
+    cv2.imwrite(directory+'/im05.tif', resized)
+    cached = runSequence((directory, directory+'/grid'), 'cached', 2, corrOptions={'imageCache': True})
+    uncached = runSequence((directory, directory+'/grid'), 'uncached', 2, corrOptions={'imageCache': False})
+    for name in newProcessCorrelations.RESULT_NAMES:
+        assert np.allclose(cached[name], uncached[name], rtol=1e-12, atol=1e-15, equal_nan=True), name
+
+@pytest.mark.parametrize('schedule', ['images', 'auto'])
+def test_image_schedules(sequence, schedule): #image ranges correlated by other processes find the markers moved further than CORRSIZE from the grid
+
+    single = runSequence(sequence, 'schedule_single_'+schedule, 1)
+    multiple = runSequence(sequence, 'schedule_'+schedule, 3, corrOptions={'schedule': schedule})
+    assert np.array_equal(single['infoMarkers'], multiple['infoMarkers'])
+    assert np.all(single['infoMarkers'] == 0)
+    for name in ['validx', 'validy', 'dispx', 'dispy']: #the first image of a range starts from its own estimation instead of the previous positions, the subpixel peak differs a little
+        difference = np.absolute(single[name] - multiple[name])
+        assert np.median(difference) < .01, name
+        assert difference.max() < .1, name
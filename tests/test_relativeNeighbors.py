@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""
+Please report issues and request on the GitHub project from ChrisEberl (Python_DIC)
+More details regarding the project on the GitHub Wiki : https://github.com/ChrisEberl/Python_DIC/wiki
+
+Current File: Tests of the relative displacements of the relative neighbors mask procedure (python -m pytest tests)
+"""
+
+import os, sys, numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from functions import strainFunctions, relativeNeighbors
+from test_strain import jitteredGrid
+
+#PARAMETERS
+NB_IMAGES = 6
+LIMIT = 1.2 #band of the relative displacements kept on the checked images
+#END PARAMETERS
+
+def displacements(nbMarkers, seed=2): #noisy displacements with a few nan and a masked marker
+
+    rng = np.random.default_rng(seed)
+    dispX = rng.normal(size=(nbMarkers, NB_IMAGES))
+    dispY = rng.normal(size=(nbMarkers, NB_IMAGES))
+    dispX[10, 3] = np.nan
+    mask = np.ones((nbMarkers, NB_IMAGES))
+    mask[4, :] = 0
+    mask[20, 2:] = 0
+    return dispX, dispY, mask
+
+def test_incremental_outsiders(tmp_path): #each iteration only updates the neighborhoods of the deleted markers and gives the relative displacements calculated from scratch
+
+    [dataX, dataY] = jitteredGrid()
+    nbMarkers = len(dataX)
+    neighbors = strainFunctions.calculateNeighbors(np.arange(nbMarkers), dataX, dataY, 8, str(tmp_path))
+    [dispX, dispY, mask] = displacements(nbMarkers)
+    gridInstances = [np.arange(0, 100), np.arange(100, nbMarkers)]
+    activeInstances = [0, 1]
+    activeImages = list(range(NB_IMAGES))
+
+    activeMarkers = strainFunctions.markerActivity(mask, gridInstances)
+    isActive = relativeNeighbors.activeMatrix(nbMarkers, activeImages, activeMarkers)
+    [neighborIndexes, isNeighbor] = relativeNeighbors.neighborMatrix(neighbors)
+    relativeDisp = relativeNeighbors.relativeImages(dispX, dispY, isActive, neighborIndexes, isNeighbor)
+    [imageMatrix, relativeX, relativeY] = relativeNeighbors.packInstances(relativeDisp, isActive, activeInstances, gridInstances)
+    relativeDisp = relativeNeighbors.unpackInstances(relativeX, relativeY, isActive, activeInstances, gridInstances) #what the dialog keeps between two calculations
+
+    inInstances = np.ones(nbMarkers, dtype=bool) #the instances cover all the markers
+    sliceImages = np.arange(1, NB_IMAGES)
+    nbIterations = 0
+    while True:
+        toDelete = relativeNeighbors.outsiders(relativeDisp, isActive, inInstances, sliceImages, LIMIT, -LIMIT, [0, 1])
+        if not np.any(toDelete):
+            break
+        relativeNeighbors.deleteMarkers(dispX, dispY, activeImages, isActive, relativeDisp, neighborIndexes, isNeighbor, toDelete)
+        nbIterations += 1
+
+        recalculated = relativeNeighbors.relativeImages(dispX, dispY, isActive, neighborIndexes, isNeighbor)
+        assert np.array_equal(relativeDisp, recalculated, equal_nan=True)
+        assert np.array_equal(np.stack(relativeNeighbors.packInstances(relativeDisp, isActive, activeInstances, gridInstances)[1:]), np.stack(relativeNeighbors.packInstances(recalculated, isActive, activeInstances, gridInstances)[1:]), equal_nan=True)
+    assert nbIterations > 1
+    assert not np.any(isActive[4]) and not np.any(isActive[20, 2:])
+
+def test_relative_displacement(tmp_path): #displacement relative to the median of the active neighbors, nan when one of them has no displacement
+
+    [dataX, dataY] = jitteredGrid()
+    nbMarkers = len(dataX)
+    neighbors = strainFunctions.calculateNeighbors(np.arange(nbMarkers), dataX, dataY, 8, str(tmp_path))
+    [dispX, dispY, mask] = displacements(nbMarkers)
+    isActive = mask == 1
+    [neighborIndexes, isNeighbor] = relativeNeighbors.neighborMatrix(neighbors)
+    relativeDisp = relativeNeighbors.relativeImages(dispX, dispY, isActive, neighborIndexes, isNeighbor)
+
+    for image in range(NB_IMAGES):
+        for marker in range(nbMarkers):
+            markerNeighbors = neighborIndexes[marker][isNeighbor[marker]]
+            markerNeighbors = markerNeighbors[isActive[markerNeighbors, image]]
+            for direction, disp in enumerate([dispX, dispY]):
+                expected = 0 if len(markerNeighbors) < 1 else disp[marker, image] - np.median(disp[markerNeighbors, image])
+                assert np.array_equal(relativeDisp[direction, marker, image], expected, equal_nan=True)
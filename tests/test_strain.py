@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""
+Please report issues and request on the GitHub project from ChrisEberl (Python_DIC)
+More details regarding the project on the GitHub Wiki : https://github.com/ChrisEberl/Python_DIC/wiki
+
+Current File: Tests of the local strain fit and of the active markers matrix (python -m pytest tests)
+"""
+
+import os, sys, numpy as np, scipy.linalg
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from functions import strainFunctions
+
+#PARAMETERS
+GRID_SHAPE = (12, 15)
+GRID_STEP = 20
+#END PARAMETERS
+
+def jitteredGrid(seed=0): #marker positions of a regular grid moved by less than a pixel
+
+    rng = np.random.default_rng(seed)
+    [gridX, gridY] = np.meshgrid(np.arange(GRID_SHAPE[1])*GRID_STEP+50., np.arange(GRID_SHAPE[0])*GRID_STEP+50.)
+    return gridX.ravel()+rng.uniform(-.5, .5, gridX.size), gridY.ravel()+rng.uniform(-.5, .5, gridY.size)
+
+def test_local_strain(tmp_path): #the batched fit gives the strain of a quadratic field and the per-marker least-squares fit of the previous versions
+
+    [dataX, dataY] = jitteredGrid()
+    markers = np.arange(len(dataX))
+    neighbors = strainFunctions.calculateNeighbors(markers, dataX, dataY, 16, str(tmp_path))
+    dispX = 2e-5*dataX**2 - 1e-5*dataY**2 + 3e-5*dataX*dataY + 1e-3*dataX - 2e-3*dataY + .5
+    dispY = -1e-5*dataX**2 + 4e-5*dataY**2 + 2e-5*dataX*dataY + 3e-3*dataY + .1*dataX
+    dispX[7] = np.nan #the markers having this neighbor get no strain
+
+    [strainMarkers, neighborIndexes, isNeighbor] = strainFunctions.strainNeighbors(markers, neighbors)
+    [strainXX, strainYY] = strainFunctions.localStrain(dataX, dataY, dispX, dispY, strainMarkers, neighborIndexes, isNeighbor, [True, True, True])
+
+    for i, marker in enumerate(strainMarkers):
+        markerNeighbors = neighborIndexes[i][isNeighbor[i]]
+        if np.any(np.isnan(dispX[markerNeighbors])):
+            assert np.isnan(strainXX[i]) and np.isnan(strainYY[i])
+            continue
+        x, y = dataX[markerNeighbors], dataY[markerNeighbors]
+        A = np.c_[np.ones(len(x)), x, y, x*y, x**2, y**2]
+        C = scipy.linalg.lstsq(A, dispX[markerNeighbors])[0]
+        D = scipy.linalg.lstsq(A, dispY[markerNeighbors])[0]
+        assert np.isclose(strainXX[i], 2*C[4]*dataX[marker]+C[1]+C[3]*dataY[marker], rtol=1e-7, atol=1e-9)
+        assert np.isclose(strainYY[i], 2*D[5]*dataY[marker]+D[2]+D[3]*dataX[marker], rtol=1e-7, atol=1e-9)
+        assert np.isclose(strainXX[i], 4e-5*dataX[marker] + 3e-5*dataY[marker] + 1e-3, rtol=1e-6)
+        assert np.isclose(strainYY[i], 8e-5*dataY[marker] + 2e-5*dataX[marker] + 3e-3, rtol=1e-6)
+    assert np.count_nonzero(np.isfinite(strainXX)) > len(strainMarkers)/2
+
+def test_marker_activity(): #the markers of an instance on an image are the ones of the set intersection with the active markers
+
+    rng = np.random.default_rng(1)
+    mask = (rng.random((100, 8)) > .3).astype(int)
+    gridInstances = [rng.permutation(100)[:40], np.arange(50, 100), np.array([3])]
+    activeMarkers = strainFunctions.markerActivity(mask, gridInstances)
+    assert len(activeMarkers) == 8
+    for image in range(8):
+        assert np.array_equal(activeMarkers[image], np.flatnonzero(mask[:, image]))
+        for instance in range(len(gridInstances)):
+            assert np.array_equal(activeMarkers.instanceMarkers(instance, image), np.intersect1d(gridInstances[instance], np.flatnonzero(mask[:, image])))
+
+    activeMarkers[2] = np.array([5, 1, 60])
+    assert np.array_equal(activeMarkers[2], [1, 5, 60])
+    assert np.array_equal(activeMarkers.instanceMarkers(1, 2), [60])